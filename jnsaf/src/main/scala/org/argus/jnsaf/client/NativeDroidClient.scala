@@ -169,6 +169,34 @@ class NativeDroidClient(address: String, port: Int, apkDigest: String, reporter:
     }
   }
 
+  def hasSymbols(soFileUri: FileResourceUri, symbols: IList[String]): IMap[String, Boolean] = {
+    reporter.echo(TITLE,s"Client hasSymbols: ${symbols.size} symbols")
+    try {
+      val soDigest = getBinaryDigest(soFileUri)
+      val response = blocking_client.hasSymbols(HasSymbolsRequest(soDigest, symbols))
+      symbols.zip(response.hasSymbol).toMap
+    } catch {
+      case e: Throwable =>
+        reporter.error(TITLE, e.getMessage)
+        e.printStackTrace()
+        symbols.map(symbol => (symbol, false)).toMap
+    }
+  }
+
+  def listJniEntryPoints(soFileUri: FileResourceUri): (IList[String], Boolean) = {
+    reporter.echo(TITLE,s"Client listJniEntryPoints: $soFileUri")
+    try {
+      val soDigest = getBinaryDigest(soFileUri)
+      val response = blocking_client.listJniEntryPoints(ListJniEntryPointsRequest(soDigest))
+      (response.jniFunc.toList, response.hasJniOnLoad)
+    } catch {
+      case e: Throwable =>
+        reporter.error(TITLE, e.getMessage)
+        e.printStackTrace()
+        (ilistEmpty, false)
+    }
+  }
+
   def hasNativeActivity(soFileUri: FileResourceUri, customEntry: Option[String]): Boolean = {
     reporter.echo(TITLE,"Client hasNativeActivity")
     customEntry match {
@@ -209,25 +237,25 @@ class NativeDroidClient(address: String, port: Int, apkDigest: String, reporter:
     res.toList
   }
 
-  def genSummary(soFileUri: FileResourceUri, componentName: String, name_or_addr: Either[String, Long], sig: Signature, depth: Int): (String, String) = {
+  def genSummary(soFileUri: FileResourceUri, componentName: String, name_or_addr: Either[String, Long], sig: Signature, depth: Int, budget: Option[Budget] = None): (String, String) = {
     reporter.echo(TITLE,s"Client genSummary for $sig")
     val soDigest = getBinaryDigest(soFileUri)
     val requestOpt = name_or_addr match {
       case Left(name) =>
         if(hasSymbol(soFileUri, name)) {
-          Some(GenSummaryRequest(apkDigest, componentName, depth, soDigest, Some(sig.method_signature), JniFunc(name)))
+          Some(GenSummaryRequest(apkDigest, componentName, depth, soDigest, Some(sig.method_signature), budget, JniFunc(name)))
         } else {
           None
         }
       case Right(addr) =>
-        Some(GenSummaryRequest(apkDigest, componentName, depth, soDigest, Some(sig.method_signature), Addr(addr)))
+        Some(GenSummaryRequest(apkDigest, componentName, depth, soDigest, Some(sig.method_signature), budget, Addr(addr)))
     }
     requestOpt match {
       case Some(request) =>
         try {
           val doneSignal = new CountDownLatch(1)
 
-          val responseFuture: Future[GenSummaryResponse] = client.genSummary(request)
+          val responseFuture: Future[GenSummaryResponse] = client.withDeadlineAfter(5, TimeUnit.MINUTES).genSummary(request)
           var responseOpt: Option[GenSummaryResponse] = None
           responseFuture.foreach { response =>
             responseOpt = Some(response)
@@ -239,6 +267,9 @@ class NativeDroidClient(address: String, port: Int, apkDigest: String, reporter:
           responseOpt match {
             case Some(response) =>
               reporter.echo(TITLE, s"Analyzed ${response.analyzedInstructions} instructions")
+              if(response.partial) {
+                reporter.warning(TITLE, s"Summary of $sig is partial, the analysis ran out of budget")
+              }
               return (response.taint, response.summary.trim)
             case None =>
           }
@@ -252,13 +283,61 @@ class NativeDroidClient(address: String, port: Int, apkDigest: String, reporter:
     ("", s"`${sig.signature}`:;")
   }
 
+  /**
+    * Gen summaries of many JNI methods of one binary in one streaming call, the server analyzes them with one
+    * loaded project and in parallel where it can.
+    *
+    * @return Signature to (taint, summary), methods which are not found or fail to analyze get an empty summary.
+    */
+  def genSummaries(soFileUri: FileResourceUri, componentName: String, methods: IList[(Either[String, Long], Signature)], depth: Int, budget: Option[Budget] = None): IMap[Signature, (String, String)] = {
+    reporter.echo(TITLE,s"Client genSummaries for ${methods.size} methods")
+    val results: MMap[Signature, (String, String)] = mmapEmpty
+    methods.foreach { case (_, sig) =>
+      results(sig) = ("", s"`${sig.signature}`:;")
+    }
+    try {
+      val soDigest = getBinaryDigest(soFileUri)
+      val symbols = hasSymbols(soFileUri, methods.collect { case (Left(name), _) => name })
+      val jniMethods = methods.filter {
+        case (Left(name), _) => symbols.getOrElse(name, false)
+        case (Right(_), _) => true
+      }
+      if(jniMethods.nonEmpty) {
+        val request = GenSummariesRequest(apkDigest, componentName, depth, soDigest, jniMethods.map {
+          case (Left(name), sig) =>
+            JniMethod(methodSignature = Some(sig.method_signature), nameOrAddress = JniMethod.NameOrAddress.JniFunc(name))
+          case (Right(addr), sig) =>
+            JniMethod(methodSignature = Some(sig.method_signature), nameOrAddress = JniMethod.NameOrAddress.Addr(addr))
+        }, budget)
+        blocking_client.withDeadlineAfter(5L * jniMethods.size, TimeUnit.MINUTES).genSummaries(request).foreach { response =>
+          val sig = jniMethods(response.index)._2
+          if(response.error.isEmpty) {
+            val summary = response.response.getOrElse(GenSummaryResponse())
+            reporter.echo(TITLE, s"Analyzed ${summary.analyzedInstructions} instructions for $sig")
+            if(summary.partial) {
+              reporter.warning(TITLE, s"Summary of $sig is partial, the analysis ran out of budget")
+            }
+            results(sig) = (summary.taint, summary.summary.trim)
+          } else {
+            reporter.error(TITLE, s"genSummaries failed for $sig: ${response.error}")
+          }
+        }
+      }
+    } catch {
+      case e: Throwable =>
+        reporter.error(TITLE, e.getMessage)
+        e.printStackTrace()
+    }
+    results.toMap
+  }
+
   def analyseNativeActivity(soFileUri: FileResourceUri, componentName: String, customEntry: Option[String]): Long = {
     reporter.echo(TITLE,s"Client analyseNativeActivity for $soFileUri $customEntry")
     try {
       val doneSignal = new CountDownLatch(1)
       val soDigest = getBinaryDigest(soFileUri)
       val request = AnalyseNativeActivityRequest(apkDigest, componentName, soDigest, customEntry.getOrElse(""))
-      val responseFuture: Future[AnalyseNativeActivityResponse] = client.analyseNativeActivity(request)
+      val responseFuture: Future[AnalyseNativeActivityResponse] = client.withDeadlineAfter(5, TimeUnit.MINUTES).analyseNativeActivity(request)
       var responseOpt: Option[AnalyseNativeActivityResponse] = None
       responseFuture.foreach { response =>
         responseOpt = Some(response)
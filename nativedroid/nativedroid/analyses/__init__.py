@@ -1,4 +1,5 @@
 from annotation_based_analysis import AnnotationBasedAnalysis
+from library_handle import LibraryHandle, LibraryHandleCache
 from nativedroid_analysis import *
 from resolver import *
 from resolver.model import *
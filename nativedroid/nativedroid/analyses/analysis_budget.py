@@ -0,0 +1,143 @@
+import os
+import threading
+import time
+from contextlib import contextmanager
+
+__author__ = "Fengguo Wei"
+__copyright__ = "Copyright 2018, The Argus-SAF Project"
+__license__ = "Apache v2.0"
+
+DEFAULT_CALL_DEPTH = 5
+
+# Number of analyses tracing in this process, which all grow the same resident memory.
+_tracing_lock = threading.Lock()
+_tracing = [0]
+
+
+def current_resident_memory():
+    """
+    Get the resident set size of current process.
+
+    :return: Resident memory in bytes, 0 if it cannot be read.
+    :rtype: int
+    """
+    try:
+        with open('/proc/self/statm') as f:
+            return int(f.read().split()[1]) * os.sysconf('SC_PAGE_SIZE')
+    except (IOError, OSError, IndexError, ValueError):
+        return 0
+
+
+class AnalysisBudget(object):
+    """
+    Limits of one analysis, counted from the creation of the budget. The CFG charges every traced block to the
+    budget and stops once a limit is exceeded, the analysis then reports what it found so far as a partial result.
+    The budget also ends at the deadline of the request and as soon as the request is no longer active.
+
+    The resident memory belongs to the process, not to one analysis, so the memory limit is only enforced while the
+    analysis is the only one tracing in its process, e.g. in a forked child or when a worker runs one call. Its
+    growth is counted from when the analysis last started to trace alone.
+
+    :param float time_limit: Seconds of wall time, None for unlimited
+    :param int max_instructions: Number of traced instructions, a block traced again is charged again, None for
+                                 unlimited
+    :param int max_states: Number of states waiting to be traced, None for unlimited
+    :param int max_memory: Bytes the resident memory may grow by while the analysis traces alone, None for unlimited
+    :param int call_depth: How deep in the call stack to trace
+    :param float deadline: Deadline of the request in seconds since the epoch, None for no deadline
+    :param is_active: Function telling whether the request is still active, None if it cannot be cancelled
+    """
+
+    def __init__(self, time_limit=None, max_instructions=None, max_states=None, max_memory=None,
+                 call_depth=DEFAULT_CALL_DEPTH, deadline=None, is_active=None):
+        self._time_limit = time_limit
+        self._max_instructions = max_instructions
+        self._max_states = max_states
+        self._max_memory = max_memory
+        self._call_depth = call_depth
+        self._deadline = deadline
+        self._is_active = is_active
+        self._start_time = time.time()
+        self._start_memory = current_resident_memory() if max_memory is not None else None
+        self._instructions = 0
+        self._exhausted = None
+
+    @property
+    def call_depth(self):
+        return self._call_depth
+
+    @property
+    def instructions(self):
+        return self._instructions
+
+    @property
+    def exhausted(self):
+        """
+        Name of the exceeded limit: 'time', 'instructions', 'states' or 'memory', 'deadline' if the deadline passed,
+        'cancelled' if the request is no longer active, None if the analysis may go on.
+        """
+        return self._exhausted
+
+    @property
+    def partial(self):
+        """
+        Whether the analysis was stopped by the budget, so its result is partial.
+        """
+        return self._exhausted is not None
+
+    @contextmanager
+    def tracing(self):
+        """
+        Context in which the CFG charging this budget is built, it tells the budgets of other analyses in the
+        process that they share the resident memory.
+        """
+        with _tracing_lock:
+            _tracing[0] += 1
+        try:
+            yield self
+        finally:
+            with _tracing_lock:
+                _tracing[0] -= 1
+
+    def charge(self, instructions, live_states):
+        """
+        Charge a traced block to the budget.
+
+        :param int instructions: Number of instructions of the block
+        :param int live_states: Number of states waiting to be traced
+        :return: Name of the exceeded limit, None if the analysis may go on
+        :rtype: str
+        """
+        self._instructions += instructions
+        if self._exhausted is None:
+            self._exhausted = self._check(live_states)
+        return self._exhausted
+
+    def abort(self, reason):
+        """
+        Stop the analysis at the next charge, e.g. because a request it depends on ran out of time.
+
+        :param str reason: Name of the exceeded limit, kept unless another limit was already exceeded
+        """
+        if self._exhausted is None:
+            self._exhausted = reason
+
+    def _check(self, live_states):
+        if self._is_active is not None and not self._is_active():
+            return 'cancelled'
+        if self._deadline is not None and time.time() > self._deadline:
+            return 'deadline'
+        if self._time_limit is not None and time.time() - self._start_time > self._time_limit:
+            return 'time'
+        if self._max_instructions is not None and self._instructions > self._max_instructions:
+            return 'instructions'
+        if self._max_states is not None and live_states > self._max_states:
+            return 'states'
+        if self._max_memory is not None:
+            if _tracing[0] > 1:
+                self._start_memory = None
+            elif self._start_memory is None:
+                self._start_memory = current_resident_memory()
+            elif current_resident_memory() - self._start_memory > self._max_memory:
+                return 'memory'
+        return None
@@ -0,0 +1,77 @@
+import time
+import unittest
+
+from nativedroid.analyses.analysis_budget import *
+
+
+class AnalysisBudgetTest(unittest.TestCase):
+    def testUnlimited(self):
+        budget = AnalysisBudget()
+        self.assertIsNone(budget.charge(1000000, 1000000))
+        self.assertFalse(budget.partial)
+        self.assertEqual(1000000, budget.instructions)
+        self.assertEqual(DEFAULT_CALL_DEPTH, budget.call_depth)
+
+    def testInstructions(self):
+        budget = AnalysisBudget(max_instructions=10)
+        self.assertIsNone(budget.charge(10, 1))
+        self.assertEqual('instructions', budget.charge(1, 1))
+        self.assertTrue(budget.partial)
+        # The first exceeded limit is kept.
+        self.assertEqual('instructions', budget.charge(0, 0))
+
+    def testStates(self):
+        budget = AnalysisBudget(max_states=2)
+        self.assertIsNone(budget.charge(1, 2))
+        self.assertEqual('states', budget.charge(1, 3))
+
+    def testTime(self):
+        budget = AnalysisBudget(time_limit=0.01)
+        self.assertIsNone(budget.charge(1, 1))
+        time.sleep(0.02)
+        self.assertEqual('time', budget.charge(1, 1))
+
+    def testDeadline(self):
+        budget = AnalysisBudget(deadline=time.time() - 1)
+        self.assertEqual('deadline', budget.charge(1, 1))
+
+    def testCancelled(self):
+        active = [True]
+        budget = AnalysisBudget(is_active=lambda: active[0])
+        self.assertIsNone(budget.charge(1, 1))
+        active[0] = False
+        self.assertEqual('cancelled', budget.charge(1, 1))
+
+    def testAbort(self):
+        budget = AnalysisBudget()
+        budget.abort('deadline')
+        self.assertTrue(budget.partial)
+        self.assertEqual('deadline', budget.charge(1, 1))
+        budget.abort('cancelled')
+        self.assertEqual('deadline', budget.exhausted)
+
+    def testMemory(self):
+        budget = AnalysisBudget(max_memory=1024 * 1024)
+        self.assertIsNone(budget.charge(1, 1))
+        if current_resident_memory():
+            data = bytearray(16 * 1024 * 1024)
+            self.assertEqual('memory', budget.charge(1, 1))
+            del data
+
+    def testMemoryShared(self):
+        budget = AnalysisBudget(max_memory=1024 * 1024)
+        other = AnalysisBudget()
+        if current_resident_memory():
+            with budget.tracing():
+                with other.tracing():
+                    data = bytearray(16 * 1024 * 1024)
+                    self.assertIsNone(budget.charge(1, 1))
+                # Growth while other analyses traced is not charged once the analysis traces alone again.
+                self.assertIsNone(budget.charge(1, 1))
+                more = bytearray(16 * 1024 * 1024)
+                self.assertEqual('memory', budget.charge(1, 1))
+                del data, more
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,3 +1,6 @@
+from nativedroid.analyses.analysis_budget import AnalysisBudget
+from nativedroid.analyses.resolver.annotation.heap_abstraction import HeapAbstraction
+
 __author__ = "Fengguo Wei"
 __copyright__ = "Copyright 2018, The Argus-SAF Project"
 __license__ = "Apache v2.0"
@@ -10,11 +13,18 @@ class AnalysisCenter(object):
     :param str signature: method signature
     :param JNSafClient jnsaf_client: JNSaf client
     :param SourceAndSinkManager ssm:
+    :param LibraryHandle library_handle: handle of the analyzed binary, None if the project is not shared
+    :param HeapAbstraction heap_abstraction: bounds of the annotation heap, the default bounds if None
+    :param AnalysisBudget analysis_budget: limits of the analysis, the default call depth and no other limit if None
     """
-    def __init__(self, signature, jnsaf_client, ssm):
+    def __init__(self, signature, jnsaf_client, ssm, library_handle=None, heap_abstraction=None,
+                 analysis_budget=None):
         self._signature = signature
         self._jnsaf_client = jnsaf_client
         self._ssm = ssm
+        self._library_handle = library_handle
+        self._heap_abstraction = heap_abstraction if heap_abstraction is not None else HeapAbstraction()
+        self._analysis_budget = analysis_budget if analysis_budget is not None else AnalysisBudget()
         self._dynamic_register_map = dict()
 
     def get_signature(self):
@@ -26,5 +36,14 @@ class AnalysisCenter(object):
     def get_source_sink_manager(self):
         return self._ssm
 
+    def get_library_handle(self):
+        return self._library_handle
+
+    def get_heap_abstraction(self):
+        return self._heap_abstraction
+
+    def get_analysis_budget(self):
+        return self._analysis_budget
+
     def get_dynamic_register_map(self):
         return self._dynamic_register_map
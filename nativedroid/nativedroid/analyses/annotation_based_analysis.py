@@ -1,10 +1,13 @@
-import copy
 from cStringIO import StringIO
 
+from angr.knowledge_base import KnowledgeBase
+
 from nativedroid.analyses.resolver.annotation import *
 from nativedroid.analyses.resolver.armel_resolver import ArmelResolver
 from nativedroid.analyses.resolver.jni.jni_helper import *
 from nativedroid.analyses.resolver.model.__android_log_print import *
+from nativedroid.analyses.taint_site_index import TaintSiteIndex
+from nativedroid.analyses.taint_tags import API, FROM_ARGUMENT, SINK, SOURCE, TAINT_KINDS
 from nativedroid.protobuf.jnsaf_grpc_pb2 import *
 
 __author__ = "Xingwei Lin, Fengguo Wei"
@@ -26,7 +29,8 @@ class AnnotationBasedAnalysis(angr.Analysis):
     This class performs taint analysis based upon angr's annotation technique.
     """
 
-    def __init__(self, analysis_center, jni_method_addr, jni_method_arguments, is_native_pure, native_pure_info=None):
+    def __init__(self, analysis_center, jni_method_addr, jni_method_arguments, is_native_pure, native_pure_info=None,
+                 keep_state=False):
         """
         init
 
@@ -35,6 +39,8 @@ class AnnotationBasedAnalysis(angr.Analysis):
         :param str jni_method_arguments:
         :param list is_native_pure: whether it is pure native and android_main type or direct type.
         :param Object native_pure_info: initial SimState and native pure argument
+        :param bool keep_state: Keep the states of all CFG nodes. By default the taint sites are recorded while the
+                                CFG is built and the states of each node are dropped once it is recorded.
         """
         if self.project.arch.name is 'ARMEL':
             self._resolver = ArmelResolver(self.project, analysis_center)
@@ -44,20 +50,27 @@ class AnnotationBasedAnalysis(angr.Analysis):
         self._analysis_center = analysis_center
         self._jni_method_signature = analysis_center.get_signature()
         self._jni_method_addr = jni_method_addr
+        # Collected sources and sinks are interned, identical facts of different paths collapse to one annotation.
+        self._interner = AnnotationInterner()
+        self._taint_sites = None if keep_state else \
+            TaintSiteIndex(jni_method_addr, analysis_center.get_source_sink_manager(), self._resolver)
         if is_native_pure:
             self._state = self._resolver.prepare_native_pure_state(native_pure_info)
             self._arguments_summary = None
         else:
             self._state, self._arguments_summary = self._resolver.prepare_initial_state(jni_method_arguments)
 
-        if is_native_pure:
-            self.cfg = self.project.analyses.CFGAccurate(fail_fast=True, starts=[self._jni_method_addr],
-                                                         initial_state=self._state, context_sensitivity_level=1,
-                                                         keep_state=True, normalize=True, call_depth=5)
-        else:
-            self.cfg = self.project.analyses.CFGAccurate(fail_fast=True, starts=[self._jni_method_addr],
-                                                         initial_state=self._state, context_sensitivity_level=1,
-                                                         keep_state=True, normalize=True, call_depth=5)
+        # Recover functions into a private knowledge base, the project may be shared by other analyses.
+        kb = KnowledgeBase(self.project, self.project.loader.main_object)
+        self._budget = analysis_center.get_analysis_budget()
+        self.cfg = self.project.analyses.TaintCFGAccurate(taint_sites=self._taint_sites, budget=self._budget,
+                                                          fail_fast=True, kb=kb, starts=[self._jni_method_addr],
+                                                          initial_state=self._state, context_sensitivity_level=1,
+                                                          keep_state=keep_state, normalize=True,
+                                                          call_depth=self._budget.call_depth)
+        if self._budget.partial:
+            nativedroid_logger.warning('Stopped analysis of %s after %d instructions: %s.',
+                                       self._jni_method_signature, self._budget.instructions, self._budget.exhausted)
 
     def _hook_system_calls(self):
         if '__android_log_print' in self.project.loader.main_object.imports:
@@ -82,6 +95,29 @@ class AnnotationBasedAnalysis(angr.Analysis):
         # print('Total INS: %d' % total_instructions)
         return total_instructions
 
+    @property
+    def partial(self):
+        """
+        Whether the CFG was stopped by the analysis budget, the reports then only cover the part traced so far.
+
+        :rtype: bool
+        """
+        return self._budget.partial
+
+    @property
+    def taint_sites(self):
+        """
+        Index of the return sites, Call*Method SimProcedures and sink calls of the CFG. Without keep_state it was
+        recorded while the CFG was built, otherwise it is built from the kept states on first use.
+
+        :rtype: TaintSiteIndex
+        """
+        if self._taint_sites is None:
+            self._taint_sites = TaintSiteIndex.from_cfg(self.cfg, self._jni_method_addr,
+                                                        self._analysis_center.get_source_sink_manager(),
+                                                        self._resolver)
+        return self._taint_sites
+
     def _collect_taint_sources(self):
         """
         Collect source nodes from CFG.
@@ -101,24 +137,18 @@ class AnnotationBasedAnalysis(angr.Analysis):
                             worklist = worklist[1:]
                             if isinstance(field_info, JobjectAnnotation):
                                 if field_info.taint_info['is_taint'] and \
-                                        field_info.taint_info['taint_type'][0] == '_SOURCE_' and \
-                                        '_ARGUMENT_' not in field_info.taint_info['taint_type'][1]:
-                                    sources_annotation.add(annotation)
+                                        field_info.taint_info.role == SOURCE and \
+                                        not field_info.taint_info.origin & FROM_ARGUMENT:
+                                    sources_annotation.add(self._interner.intern(annotation))
                                 else:
                                     worklist.extend(field_info.fields_info)
         if not self._jni_method_signature.endswith(")V"):
-            for node in self.cfg.nodes():
-                if not node.is_simprocedure and \
-                        node.block.vex.jumpkind == 'Ijk_Ret' and \
-                        node.function_address == self._jni_method_addr:
-                    for final_state in node.final_states:
-                        return_value = final_state.regs.r0
-                        for annotation in return_value.annotations:
-                            if isinstance(annotation, JobjectAnnotation):
-                                if annotation.taint_info['is_taint'] and \
-                                        annotation.taint_info['taint_type'][0] == '_SOURCE_' and \
-                                        '_ARGUMENT_' not in annotation.taint_info['taint_type'][1]:
-                                    sources_annotation.add(annotation)
+            for annotation in self.taint_sites.return_annotations:
+                if isinstance(annotation, JobjectAnnotation):
+                    if annotation.taint_info['is_taint'] and \
+                            annotation.taint_info.role == SOURCE and \
+                            not annotation.taint_info.origin & FROM_ARGUMENT:
+                        sources_annotation.add(self._interner.intern(annotation))
         return sources_annotation
 
     def _collect_taint_sinks(self):
@@ -128,60 +158,30 @@ class AnnotationBasedAnalysis(angr.Analysis):
         :return: A dictionary contains sink nodes with its sink tags (positions, taint_tags).
         :rtype: dict
         """
-        sink_nodes = {}
         sink_annotations = set()
-        for node in self.cfg.nodes():
-            if node.is_simprocedure and node.name.startswith('Call'):
-                for final_state in node.final_states:
-                    regs = [final_state.regs.r0,
-                            final_state.regs.r1,
-                            final_state.regs.r2,
-                            final_state.regs.r3,
-                            final_state.regs.r4,
-                            final_state.regs.r5,
-                            final_state.regs.r6,
-                            final_state.regs.r7,
-                            final_state.regs.r8,
-                            final_state.regs.r9,
-                            final_state.regs.r10]
-                    for reg in regs:
-                        # node_return_value = final_state.regs.r0
-                        for annotation in reg.annotations:
-                            if isinstance(annotation, JobjectAnnotation):
-                                if annotation.taint_info['is_taint'] and \
-                                        annotation.taint_info['taint_type'][0] == '_SINK_':
-                                    sink_annotations.add(annotation)
-            fn = self.cfg.project.kb.functions.get(node.addr)
-            if fn:
-                ssm = self._analysis_center.get_source_sink_manager()
-                if ssm.is_sink(fn.name):
-                    sink_tag = ssm.get_sink_tags(fn.name)
-                    sink_nodes[node] = sink_tag
-        for sink, (positions, tags) in sink_nodes.iteritems():
-            input_state = sink.input_state
-            final_states = sink.final_states
-            args = self._resolver.get_taint_args(input_state, final_states, positions, tags)
-            if args:
-                nativedroid_logger.debug('tainted: %s, belong_obj: %s' % (args, sink.final_states[0].regs.r0))
-                for arg in args:
-                    for annotation in arg.annotations:
-                        sink_annotation = copy.deepcopy(annotation)
-                        sink_annotation.taint_info['taint_type'][0] = '_SINK_'
-                        if annotation.taint_info['is_taint'] and \
-                                annotation.taint_info['taint_type'] == ['_SOURCE_', '_API_']:
-                            sink_annotation.taint_info['taint_type'][1] = '_SOURCE_'
-                        sink_annotations.add(sink_annotation)
+        for annotation in self.taint_sites.call_annotations:
+            if isinstance(annotation, JobjectAnnotation):
+                if annotation.taint_info['is_taint'] and \
+                        annotation.taint_info.role == SINK:
+                    sink_annotations.add(self._interner.intern(annotation))
+        for annotation in self.taint_sites.sink_annotations:
+            sink_annotation = annotation.copy()
+            sink_annotation.taint_info.role = SINK
+            if annotation.taint_info['is_taint'] and \
+                    annotation.taint_info.role == SOURCE and annotation.taint_info.origin == API:
+                sink_annotation.taint_info.origin = SOURCE
+            sink_annotations.add(self._interner.intern(sink_annotation))
         annotations = set()
         for annotation in sink_annotations:
-            if annotation.taint_info['is_taint'] and annotation.taint_info['taint_type'][1] == '_SOURCE_':
+            if annotation.taint_info['is_taint'] and annotation.taint_info.origin == SOURCE:
                 nativedroid_logger.info('Found taint in function %s.', self._jni_method_signature)
                 jnsaf_client = self._analysis_center.get_jnsaf_client()
                 if jnsaf_client:
                     request = RegisterTaintRequest(
                         apk_digest=jnsaf_client.apk_digest,
                         signature=self._analysis_center.get_signature(),
-                        source_kind=annotation.taint_info['source_kind'],
-                        sink_kind=annotation.taint_info['sink_kind'])
+                        source_kind=TAINT_KINDS.name(annotation.taint_info.source_kind_bit),
+                        sink_kind=TAINT_KINDS.name(annotation.taint_info.sink_kind_bit))
                     response = jnsaf_client.RegisterTaint(request)
                     if response.status:
                         nativedroid_logger.info('Registered %s as taint.', self._jni_method_signature)
@@ -232,7 +232,7 @@ class AnnotationBasedAnalysis(angr.Analysis):
                         field_info = worklist[0]
                         worklist = worklist[1:]
                         if field_info.taint_info['is_taint'] and \
-                                '_ARGUMENT_' not in field_info.taint_info['taint_type'][1]:
+                                not field_info.taint_info.origin & FROM_ARGUMENT:
                             taint_field_name += '.' + field_info.field_info['field_name']
                             break
                         elif isinstance(field_info, JobjectAnnotation):
@@ -266,36 +266,28 @@ class AnnotationBasedAnalysis(angr.Analysis):
                                 field_locations.append(field_location)
                             arg_safsu[field_name] = (field_type, field_locations)
                 args_safsu[arg_index] = arg_safsu
-        return_nodes = list()
-        for node in self.cfg.nodes():
-            if not node.is_simprocedure:
-                if node.block.vex.jumpkind == 'Ijk_Ret' and node.function_address == self._jni_method_addr:
-                    return_nodes.append(node)
         if not self._jni_method_signature.endswith(")V"):
-            for return_node in return_nodes:
-                for final_state in return_node.final_states:
-                    return_value = final_state.regs.r0
-                    for annotation in return_value.annotations:
-                        if isinstance(annotation, JstringAnnotation):
-                            # ret_type = annotation.primitive_type.split('L')[-1].replace('/', '.')
-                            ret_type = 'java.lang.String'
-                            ret_location = annotation_location[annotation.source]
-                            ret_value = annotation.value
-                            if ret_value is not None:
-                                ret_safsu = '  ret = "' + ret_value + '"@' + ret_location
-                            else:
-                                ret_safsu = '  ret = ' + ret_type + '@' + ret_location
-                            rets_safsu.append(ret_safsu)
-                        elif isinstance(annotation, JobjectAnnotation):
-                            if annotation.heap:
-                                ret_value = annotation.heap
-                                ret_safsu = '  ret = ' + ret_value
-                                rets_safsu.append(ret_safsu)
-                            else:
-                                ret_type = annotation.obj_type.replace('/', '.')
-                                ret_location = annotation_location[annotation.source]
-                                ret_safsu = '  ret = ' + ret_type + '@' + ret_location
-                                rets_safsu.append(ret_safsu)
+            for annotation in self.taint_sites.return_annotations:
+                if isinstance(annotation, JstringAnnotation):
+                    # ret_type = annotation.primitive_type.split('L')[-1].replace('/', '.')
+                    ret_type = 'java.lang.String'
+                    ret_location = annotation_location[annotation.source]
+                    ret_value = annotation.value
+                    if ret_value is not None:
+                        ret_safsu = '  ret = "' + ret_value + '"@' + ret_location
+                    else:
+                        ret_safsu = '  ret = ' + ret_type + '@' + ret_location
+                    rets_safsu.append(ret_safsu)
+                elif isinstance(annotation, JobjectAnnotation):
+                    if annotation.heap:
+                        ret_value = annotation.heap
+                        ret_safsu = '  ret = ' + ret_value
+                        rets_safsu.append(ret_safsu)
+                    else:
+                        ret_type = annotation.obj_type.replace('/', '.')
+                        ret_location = annotation_location[annotation.source]
+                        ret_safsu = '  ret = ' + ret_type + '@' + ret_location
+                        rets_safsu.append(ret_safsu)
         report_file = StringIO()
         report_file.write('`' + self._jni_method_signature + '`:' + '\n')
         if args_safsu:
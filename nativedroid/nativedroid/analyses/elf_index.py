@@ -0,0 +1,95 @@
+import logging
+
+from elftools.common.exceptions import ELFError
+from elftools.elf.elffile import ELFFile
+from elftools.elf.sections import SymbolTableSection
+
+__author__ = "Fengguo Wei"
+__copyright__ = "Copyright 2018, The Argus-SAF Project"
+__license__ = "Apache v2.0"
+
+nativedroid_logger = logging.getLogger('nativedroid.elf_index')
+nativedroid_logger.setLevel(logging.INFO)
+
+_SYMBOL_SECTIONS = ('.dynsym', '.symtab')
+# Local symbols, e.g. static functions, cannot be bound by the dynamic linker or the JVM.
+_VISIBLE_BINDINGS = ('STB_GLOBAL', 'STB_WEAK')
+
+
+class ElfMetadata(object):
+    """
+    Symbol level metadata of a binary, read from the ELF symbol tables without loading or lifting any code.
+
+    :param set exports: Names of global and weak symbols defined in the binary
+    :param set imports: Names of undefined symbols the binary imports
+    """
+
+    def __init__(self, exports, imports):
+        self._exports = frozenset(exports)
+        self._imports = frozenset(imports - exports)
+        self._jni_entry_points = sorted(name for name in self._exports if name.startswith('Java_'))
+
+    @property
+    def exports(self):
+        return self._exports
+
+    @property
+    def imports(self):
+        return self._imports
+
+    @property
+    def has_jni_on_load(self):
+        return 'JNI_OnLoad' in self._exports
+
+    @property
+    def jni_entry_points(self):
+        """
+        Statically registered JNI methods, i.e. exported `Java_*` functions.
+
+        :rtype: list
+        """
+        return self._jni_entry_points
+
+    def has_symbol(self, name):
+        return name in self._exports or name in self._imports
+
+
+def symbol_kind(symbol):
+    """
+    Classify an ELF symbol.
+
+    :param symbol: pyelftools symbol
+    :return: 'import' for undefined symbols, 'export' for defined global or weak symbols, None for the others.
+    :rtype: str
+    """
+    if not symbol.name or symbol['st_info']['bind'] not in _VISIBLE_BINDINGS:
+        return None
+    return 'import' if symbol['st_shndx'] == 'SHN_UNDEF' else 'export'
+
+
+def build_elf_metadata(so_file):
+    """
+    Index the symbol tables of given binary.
+
+    :param str so_file: Binary path
+    :return: Metadata of the binary, empty if it is not a valid ELF file.
+    :rtype: ElfMetadata
+    """
+    exports = set()
+    imports = set()
+    with open(so_file, 'rb') as f:
+        try:
+            elf = ELFFile(f)
+            for section_name in _SYMBOL_SECTIONS:
+                section = elf.get_section_by_name(section_name)
+                if not isinstance(section, SymbolTableSection):
+                    continue
+                for symbol in section.iter_symbols():
+                    kind = symbol_kind(symbol)
+                    if kind == 'import':
+                        imports.add(symbol.name)
+                    elif kind == 'export':
+                        exports.add(symbol.name)
+        except ELFError as e:
+            nativedroid_logger.error('Failed to index %s: %s', so_file, e)
+    return ElfMetadata(exports, imports)
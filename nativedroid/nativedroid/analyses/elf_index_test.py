@@ -0,0 +1,40 @@
+import unittest
+import pkg_resources
+from nativedroid.analyses.elf_index import *
+
+
+class _Symbol(dict):
+    def __init__(self, name, bind, shndx):
+        super(_Symbol, self).__init__(st_info={'bind': bind, 'type': 'STT_FUNC'}, st_shndx=shndx)
+        self.name = name
+
+
+class ElfIndexTest(unittest.TestCase):
+    def testSymbolKind(self):
+        self.assertEqual('export', symbol_kind(_Symbol('Java_Foo_bar', 'STB_GLOBAL', 7)))
+        self.assertEqual('export', symbol_kind(_Symbol('JNI_OnLoad', 'STB_WEAK', 7)))
+        self.assertEqual('import', symbol_kind(_Symbol('__android_log_print', 'STB_GLOBAL', 'SHN_UNDEF')))
+        self.assertIsNone(symbol_kind(_Symbol('Java_Foo_helper', 'STB_LOCAL', 7)))
+        self.assertIsNone(symbol_kind(_Symbol('', 'STB_LOCAL', 'SHN_UNDEF')))
+
+
+    def testLibLeak(self):
+        so_file = pkg_resources.resource_filename('nativedroid.testdata',
+                                                  'NativeLibs/native_leak/lib/armeabi/libleak.so')
+        elf_metadata = build_elf_metadata(so_file)
+        self.assertEqual(['Java_org_arguslab_native_1leak_MainActivity_send'], elf_metadata.jni_entry_points)
+        self.assertIn('__android_log_print', elf_metadata.imports)
+        self.assertTrue(elf_metadata.has_symbol('__android_log_print'))
+        self.assertFalse(elf_metadata.has_symbol('Java_org_arguslab_native_1leak_MainActivity_none'))
+        self.assertFalse(elf_metadata.has_jni_on_load)
+
+    def testLibLeakDynamicRegister(self):
+        so_file = pkg_resources.resource_filename('nativedroid.testdata',
+                                                  'NativeLibs/native_leak_dynamic_register/lib/'
+                                                  'armeabi/libleak_dynamic_register.so')
+        elf_metadata = build_elf_metadata(so_file)
+        self.assertTrue(elf_metadata.has_jni_on_load)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,133 @@
+import logging
+import re
+
+from elftools.common.exceptions import ELFError
+from elftools.elf.elffile import ELFFile
+
+__author__ = "Fengguo Wei"
+__copyright__ = "Copyright 2018, The Argus-SAF Project"
+__license__ = "Apache v2.0"
+
+nativedroid_logger = logging.getLogger('nativedroid.jni_reference_index')
+nativedroid_logger.setLevel(logging.INFO)
+
+# Compilers put string literals into .rodata, or into .text next to the code using them. Instruction bytes in .text
+# often look like short strings, so only longer ones are taken from there.
+_STRING_SECTIONS = {'.rodata': 1, '.text': 4}
+_STRING = re.compile('[\\x21-\\x7e]+(?=\\x00)')
+
+_IDENTIFIER = '[A-Za-z_$][\\w$]*'
+_FIELD_TYPE = '\\[*(?:[ZBCSIJFD]|L%s(?:/%s)*;)' % (_IDENTIFIER, _IDENTIFIER)
+_CLASS_NAME = re.compile('^%s(?:/%s)+$' % (_IDENTIFIER, _IDENTIFIER))
+_MEMBER_NAME = re.compile('^(?:<init>|<clinit>|%s)$' % _IDENTIFIER)
+_METHOD_SIGNATURE = re.compile('^\\((?:%s)*\\)(?:V|%s)$' % (_FIELD_TYPE, _FIELD_TYPE))
+_FIELD_SIGNATURE = re.compile('^%s$' % _FIELD_TYPE)
+
+
+def _member_signature(class_name, name, signature):
+    return 'L%s;.%s:%s' % (class_name, name, signature)
+
+
+class JniReferenceIndex(object):
+    """
+    Java classes, methods and fields a binary may reference through JNI, guessed from the string constants passed
+    to FindClass, GetMethodID and GetFieldID. Strings are only candidates: a string built at runtime is missed,
+    and a method may be paired with a wrong class.
+
+    :param list strings: String constants of the binary in address order
+    :param int max_candidates: Up to this many candidates every name is paired with every class and signature,
+        beyond it only with the nearest class and signature.
+    """
+
+    def __init__(self, strings, max_candidates=64):
+        self._classes = set()
+        self._methods = set()
+        self._fields = set()
+        names = list()
+        method_signatures = list()
+        field_signatures = list()
+        class_name = None
+        name = None
+        for string in strings:
+            if _CLASS_NAME.match(string):
+                self._classes.add(string)
+                class_name = string
+            elif _METHOD_SIGNATURE.match(string):
+                method_signatures.append(string)
+                if class_name and name:
+                    self._methods.add(_member_signature(class_name, name, string))
+            elif _FIELD_SIGNATURE.match(string):
+                field_signatures.append(string)
+                if class_name and name:
+                    self._fields.add(_member_signature(class_name, name, string))
+            elif _MEMBER_NAME.match(string):
+                names.append(string)
+                name = string
+        if len(self._classes) * len(names) * len(method_signatures) <= max_candidates:
+            self._methods.update(_member_signature(c, n, s)
+                                 for c in self._classes for n in names for s in method_signatures)
+        if len(self._classes) * len(names) * len(field_signatures) <= max_candidates:
+            self._fields.update(_member_signature(c, n, s)
+                                for c in self._classes for n in names for s in field_signatures)
+
+    @property
+    def classes(self):
+        return self._classes
+
+    @property
+    def methods(self):
+        """
+        Candidate method signatures, e.g. `Landroid/telephony/TelephonyManager;.getDeviceId:()Ljava/lang/String;`.
+
+        :rtype: list
+        """
+        return sorted(self._methods)
+
+    @property
+    def fields(self):
+        """
+        Candidate field signatures in the same form as methods, e.g. `Lpkg/Cls;.name:Ljava/lang/String;`.
+
+        :rtype: list
+        """
+        return sorted(self._fields)
+
+    def find_sources_and_sinks(self, ssm, native_names=()):
+        """
+        Find the configured sources and sinks the binary references.
+
+        :param SourceAndSinkManager ssm: Source and sink manager
+        :param native_names: Imported native function names
+        :return: (sources, sinks), sorted lists of Java method signatures and native function names
+        :rtype: tuple
+        """
+        sources = list()
+        sinks = list()
+        for name in sorted(native_names) + self.methods:
+            if ssm.is_source(name):
+                sources.append(name)
+            if ssm.is_sink(name):
+                sinks.append(name)
+        return sources, sinks
+
+
+def build_jni_reference_index(so_file):
+    """
+    Scan the string constants of given binary for JNI references.
+
+    :param str so_file: Binary path
+    :return: Index of the binary, empty if it is not a valid ELF file.
+    :rtype: JniReferenceIndex
+    """
+    strings = list()
+    with open(so_file, 'rb') as f:
+        try:
+            elf = ELFFile(f)
+            sections = [section for section in elf.iter_sections()
+                        if section.name in _STRING_SECTIONS and section['sh_type'] == 'SHT_PROGBITS']
+            for section in sorted(sections, key=lambda s: s['sh_addr']):
+                min_length = _STRING_SECTIONS[section.name]
+                strings.extend(string for string in _STRING.findall(section.data()) if len(string) >= min_length)
+        except ELFError as e:
+            nativedroid_logger.error('Failed to scan %s: %s', so_file, e)
+    return JniReferenceIndex(strings)
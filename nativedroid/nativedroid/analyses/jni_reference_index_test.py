@@ -0,0 +1,46 @@
+import unittest
+import pkg_resources
+from nativedroid.analyses.elf_index import build_elf_metadata
+from nativedroid.analyses.jni_reference_index import *
+from nativedroid.analyses.source_and_sink_manager import SourceAndSinkManager
+
+native_ss_file = pkg_resources.resource_filename('nativedroid.data', 'sourceAndSinks/NativeSourcesAndSinks.txt')
+java_ss_file = pkg_resources.resource_filename('nativedroid.data', 'sourceAndSinks/TaintSourcesAndSinks.txt')
+
+
+class JniReferenceIndexTest(unittest.TestCase):
+    def testPairing(self):
+        jni_references = JniReferenceIndex(['android/content/Intent', '<init>', '()V', 'putExtra',
+                                            '(Ljava/lang/String;Ljava/lang/String;)Landroid/content/Intent;',
+                                            'mData', '[B'], max_candidates=0)
+        self.assertEqual(set(['android/content/Intent']), jni_references.classes)
+        self.assertEqual(['Landroid/content/Intent;.<init>:()V',
+                          'Landroid/content/Intent;.putExtra:(Ljava/lang/String;Ljava/lang/String;)'
+                          'Landroid/content/Intent;'], jni_references.methods)
+        self.assertEqual(['Landroid/content/Intent;.mData:[B'], jni_references.fields)
+
+    def testLibSource(self):
+        so_file = pkg_resources.resource_filename('nativedroid.testdata',
+                                                  'NativeLibs/native_source/lib/armeabi/libsource.so')
+        jni_references = build_jni_reference_index(so_file)
+        self.assertIn('android/telephony/TelephonyManager', jni_references.classes)
+        self.assertIn('Landroid/telephony/TelephonyManager;.getDeviceId:()Ljava/lang/String;', jni_references.methods)
+        self.assertIn('Landroid/content/Context;.getSystemService:(Ljava/lang/String;)Ljava/lang/Object;',
+                      jni_references.methods)
+        ssm = SourceAndSinkManager(native_ss_file, java_ss_file)
+        sources, sinks = jni_references.find_sources_and_sinks(ssm, build_elf_metadata(so_file).imports)
+        self.assertEqual(['Landroid/telephony/TelephonyManager;.getDeviceId:()Ljava/lang/String;'], sources)
+        self.assertEqual([], sinks)
+
+    def testLibLeak(self):
+        so_file = pkg_resources.resource_filename('nativedroid.testdata',
+                                                  'NativeLibs/native_leak/lib/armeabi/libleak.so')
+        jni_references = build_jni_reference_index(so_file)
+        ssm = SourceAndSinkManager(native_ss_file, java_ss_file)
+        sources, sinks = jni_references.find_sources_and_sinks(ssm, build_elf_metadata(so_file).imports)
+        self.assertEqual([], sources)
+        self.assertEqual(['__android_log_print'], sinks)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,188 @@
+import cPickle
+import json
+import logging
+import os
+import sys
+import tempfile
+
+import pkg_resources
+
+__author__ = "Fengguo Wei"
+__copyright__ = "Copyright 2018, The Argus-SAF Project"
+__license__ = "Apache v2.0"
+
+nativedroid_logger = logging.getLogger('nativedroid.library_cache')
+nativedroid_logger.setLevel(logging.INFO)
+
+_SNAPSHOT_RECURSION_LIMIT = 100000
+
+
+def _distribution_version(name):
+    try:
+        return pkg_resources.get_distribution(name).version
+    except pkg_resources.DistributionNotFound:
+        return 'dev'
+
+
+# Layout of the cached files: bump it whenever what is pickled into a snapshot or dynamic register map changes, as
+# a source checkout always reports the 'dev' version.
+CACHE_SCHEMA = 1
+
+# Snapshots are only valid for the cache schema, nativedroid and angr that wrote them.
+CACHE_VERSION = 'schema-%d/nativedroid-%s/angr-%s' % (CACHE_SCHEMA, _distribution_version('nativedroid'),
+                                                     _distribution_version('angr'))
+
+
+def cache_dir_for(binary_path):
+    """
+    Get the cache directory which sits next to the binary directory.
+
+    :param str binary_path: Directory the binaries are stored in
+    :return: Cache directory path
+    :rtype: str
+    """
+    return os.path.normpath(binary_path) + '_cache'
+
+
+def cache_path(cache_dir, so_digest, kind):
+    return os.path.join(cache_dir, '%s.%s' % (so_digest, kind))
+
+
+def _write_atomic(path, data):
+    """
+    Write data to a temp file in the same directory and rename it to path, so concurrent readers in other
+    processes never see a partial file.
+    """
+    directory = os.path.dirname(path)
+    try:
+        os.makedirs(directory)
+    except OSError:
+        if not os.path.isdir(directory):
+            raise
+    fd, tmp_path = tempfile.mkstemp(dir=directory, prefix='.tmp-')
+    try:
+        with os.fdopen(fd, 'wb') as out:
+            out.write(data)
+        os.rename(tmp_path, path)
+    except Exception:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+
+
+def _remove(path):
+    try:
+        os.remove(path)
+    except OSError:
+        pass
+
+
+def load_project_snapshot(cache_dir, so_digest):
+    """
+    Restore the project of given binary from its snapshot. Snapshots written by another nativedroid or angr
+    version, or which fail to restore, are removed.
+
+    :param str cache_dir: Cache directory
+    :param str so_digest: sha256 digest of the binary
+    :return: Restored project, or None if there is no valid snapshot.
+    :rtype: angr.Project
+    """
+    path = cache_path(cache_dir, so_digest, 'project')
+    if not os.path.isfile(path):
+        return None
+    recursion_limit = sys.getrecursionlimit()
+    sys.setrecursionlimit(max(recursion_limit, _SNAPSHOT_RECURSION_LIMIT))
+    try:
+        with open(path, 'rb') as f:
+            snapshot = cPickle.load(f)
+    except Exception as e:
+        nativedroid_logger.warning('Failed to restore snapshot %s: %s', path, e)
+        snapshot = None
+    finally:
+        sys.setrecursionlimit(recursion_limit)
+    if not isinstance(snapshot, dict) or snapshot.get('version') != CACHE_VERSION or \
+            snapshot.get('so_digest') != so_digest:
+        nativedroid_logger.info('Invalidate stale snapshot %s.', path)
+        _remove(path)
+        return None
+    return snapshot['project']
+
+
+def save_project_snapshot(cache_dir, so_digest, project):
+    """
+    Snapshot the loader state of given project. Should be called before any analysis hooks the project. The
+    knowledge base of the project stays empty: every analysis recovers its CFG into a private knowledge base from a
+    method specific initial state, so there is no recovered CFG to reuse. The one CFG whose outcome is reusable,
+    the exploration of JNI_OnLoad, is cached as the dynamic register map. Failures are logged and ignored, as the
+    snapshot is only an optimization.
+
+    :param str cache_dir: Cache directory
+    :param str so_digest: sha256 digest of the binary
+    :param angr.Project project: Freshly loaded project
+    :return: True if the snapshot is written
+    :rtype: bool
+    """
+    snapshot = {
+        'version': CACHE_VERSION,
+        'so_digest': so_digest,
+        'project': project
+    }
+    recursion_limit = sys.getrecursionlimit()
+    sys.setrecursionlimit(max(recursion_limit, _SNAPSHOT_RECURSION_LIMIT))
+    try:
+        _write_atomic(cache_path(cache_dir, so_digest, 'project'),
+                      cPickle.dumps(snapshot, cPickle.HIGHEST_PROTOCOL))
+        return True
+    except Exception as e:
+        nativedroid_logger.warning('Failed to snapshot project of %s: %s', so_digest, e)
+        return False
+    finally:
+        sys.setrecursionlimit(recursion_limit)
+
+
+def load_dynamic_register_map(cache_dir, so_digest):
+    """
+    Load the dynamically registered methods of given binary. Stale or broken entries are removed.
+
+    :param str cache_dir: Cache directory
+    :param str so_digest: sha256 digest of the binary
+    :return: Method name and signature to function address, None if not cached.
+    :rtype: dict
+    """
+    path = cache_path(cache_dir, so_digest, 'dynamic_register.json')
+    if not os.path.isfile(path):
+        return None
+    try:
+        with open(path, 'rb') as f:
+            entry = json.load(f)
+    except (IOError, ValueError) as e:
+        nativedroid_logger.warning('Failed to read %s: %s', path, e)
+        entry = None
+    if not isinstance(entry, dict) or entry.get('version') != CACHE_VERSION or entry.get('so_digest') != so_digest:
+        nativedroid_logger.info('Invalidate stale dynamic register map %s.', path)
+        _remove(path)
+        return None
+    return dict((str(name), long(addr)) for name, addr in entry['methods'].iteritems())
+
+
+def save_dynamic_register_map(cache_dir, so_digest, dynamic_register_map):
+    """
+    Persist the dynamically registered methods of given binary.
+
+    :param str cache_dir: Cache directory
+    :param str so_digest: sha256 digest of the binary
+    :param dict dynamic_register_map: Method name and signature to function address
+    :return: True if the map is written
+    :rtype: bool
+    """
+    entry = {
+        'version': CACHE_VERSION,
+        'so_digest': so_digest,
+        'methods': dynamic_register_map
+    }
+    try:
+        _write_atomic(cache_path(cache_dir, so_digest, 'dynamic_register.json'), json.dumps(entry, sort_keys=True))
+        return True
+    except (IOError, OSError, TypeError, ValueError) as e:
+        nativedroid_logger.warning('Failed to save dynamic register map of %s: %s', so_digest, e)
+        return False
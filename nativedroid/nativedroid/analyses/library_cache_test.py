@@ -0,0 +1,71 @@
+import cPickle
+import json
+import os
+import shutil
+import tempfile
+import unittest
+
+import angr
+import pkg_resources
+
+from nativedroid.analyses.library_cache import *
+from nativedroid.analyses.library_handle import LOAD_OPTIONS, LibraryHandle
+
+leak_so_file = pkg_resources.resource_filename('nativedroid.testdata', 'NativeLibs/native_leak/lib/armeabi/libleak.so')
+
+
+class LibraryCacheTest(unittest.TestCase):
+    def setUp(self):
+        self.cache_dir = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.cache_dir)
+
+    def testProjectSnapshot(self):
+        project = angr.Project(leak_so_file, load_options=LOAD_OPTIONS)
+        self.assertTrue(save_project_snapshot(self.cache_dir, 'leak', project))
+        restored = load_project_snapshot(self.cache_dir, 'leak')
+        self.assertIsNotNone(restored)
+        symbol = restored.loader.main_object.get_symbol('Java_org_arguslab_native_1leak_MainActivity_send')
+        self.assertEqual(
+            project.loader.main_object.get_symbol('Java_org_arguslab_native_1leak_MainActivity_send').rebased_addr,
+            symbol.rebased_addr)
+
+    def testStaleSnapshot(self):
+        path = cache_path(self.cache_dir, 'leak', 'project')
+        with open(path, 'wb') as f:
+            cPickle.dump({'version': 'stale', 'so_digest': 'leak', 'project': None}, f)
+        self.assertIsNone(load_project_snapshot(self.cache_dir, 'leak'))
+        self.assertFalse(os.path.exists(path))
+
+    def testDynamicRegisterMap(self):
+        dynamic_register_map = {'send:(Ljava/lang/String;)V': 0x751L}
+        self.assertTrue(save_dynamic_register_map(self.cache_dir, 'leak', dynamic_register_map))
+        self.assertEqual(dynamic_register_map, load_dynamic_register_map(self.cache_dir, 'leak'))
+        self.assertIsNone(load_dynamic_register_map(self.cache_dir, 'other'))
+
+    def testOlderSchema(self):
+        self.assertTrue(save_dynamic_register_map(self.cache_dir, 'leak', {'send:(Ljava/lang/String;)V': 0x751L}))
+        path = cache_path(self.cache_dir, 'leak', 'dynamic_register.json')
+        with open(path, 'rb') as f:
+            entry = json.load(f)
+        entry['version'] = entry['version'].replace('schema-%d/' % CACHE_SCHEMA, 'schema-%d/' % (CACHE_SCHEMA - 1))
+        with open(path, 'wb') as f:
+            json.dump(entry, f)
+        self.assertIsNone(load_dynamic_register_map(self.cache_dir, 'leak'))
+
+    def testHandleReusesDynamicRegisterMap(self):
+        save_dynamic_register_map(self.cache_dir, 'leak', {'send:(Ljava/lang/String;)V': 0x751L})
+        library_handle = LibraryHandle('leak', leak_so_file, self.cache_dir)
+        self.assertEqual({'send:(Ljava/lang/String;)V': 0x751L}, library_handle.get_dynamic_register_map())
+        self.assertFalse(library_handle.loaded)
+
+    def testHandleRestoresSnapshot(self):
+        LibraryHandle('leak', leak_so_file, self.cache_dir).project
+        self.assertTrue(os.path.isfile(cache_path(self.cache_dir, 'leak', 'project')))
+        library_handle = LibraryHandle('leak', leak_so_file, self.cache_dir)
+        self.assertTrue(library_handle.has_symbol('Java_org_arguslab_native_1leak_MainActivity_send'))
+
+
+if __name__ == '__main__':
+    unittest.main()
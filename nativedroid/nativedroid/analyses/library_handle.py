@@ -0,0 +1,288 @@
+import logging
+import os
+import threading
+from collections import OrderedDict
+from contextlib import contextmanager
+
+import angr
+
+from nativedroid.analyses.analysis_budget import current_resident_memory
+from nativedroid.analyses.analysis_center import AnalysisCenter
+from nativedroid.analyses.elf_index import build_elf_metadata
+from nativedroid.analyses.jni_reference_index import build_jni_reference_index
+from nativedroid.analyses.library_cache import load_dynamic_register_map, load_project_snapshot, \
+    save_dynamic_register_map, save_project_snapshot
+from nativedroid.analyses.resolver.dynamic_register_resolution import dynamic_register_resolve
+from nativedroid.analyses.resolver.jni.jni_type.jni_native_interface import JNINativeInterface
+
+__author__ = "Fengguo Wei"
+__copyright__ = "Copyright 2018, The Argus-SAF Project"
+__license__ = "Apache v2.0"
+
+nativedroid_logger = logging.getLogger('nativedroid.library_handle')
+nativedroid_logger.setLevel(logging.INFO)
+
+LOAD_OPTIONS = {'main_opts': {'custom_base_addr': 0x0}}
+
+
+class LibraryHandle(object):
+    """
+    This class owns everything nativedroid keeps alive for one binary: the loaded angr project, the symbol table,
+    the dynamically registered methods and the JNI hooks installed into the project. Analyses sharing a handle must
+    hold its lock, as the hooks are bound to the analysis center of the running analysis. The lazily built parts
+    are guarded by separate locks, so a background prewarm never makes an analysis give up the shared handle.
+
+    :param str so_digest: sha256 digest of the binary
+    :param str so_file: Binary path
+    :param str cache_dir: Directory of on-disk project snapshots, None to always load from the binary
+    """
+
+    def __init__(self, so_digest, so_file, cache_dir=None):
+        self._so_digest = so_digest
+        self._so_file = so_file
+        self._cache_dir = cache_dir
+        self._lock = threading.RLock()
+        self._load_lock = threading.RLock()
+        self._register_lock = threading.Lock()
+        self._prewarm_lock = threading.Lock()
+        self._project = None
+        self._symbols = dict()
+        self._elf_metadata = None
+        self._jni_references = None
+        self._dynamic_register_map = None
+        self._jni_native_interface = None
+        self._resident_size = 0
+        self._prewarmed = False
+
+    @property
+    def so_digest(self):
+        return self._so_digest
+
+    @property
+    def so_file(self):
+        return self._so_file
+
+    @property
+    def lock(self):
+        return self._lock
+
+    @property
+    def loaded(self):
+        return self._project is not None
+
+    @property
+    def prewarmed(self):
+        return self._prewarmed
+
+    @property
+    def resident_size(self):
+        """
+        Estimated memory held by the loaded project, measured as the growth of resident memory during loading.
+        """
+        return self._resident_size
+
+    @property
+    def cache_dir(self):
+        return self._cache_dir
+
+    @property
+    def project(self):
+        if self._project is None:
+            with self._load_lock:
+                if self._project is None:
+                    before = current_resident_memory()
+                    self._project = self._load_project(save_snapshot=True)
+                    self._resident_size = max(current_resident_memory() - before, os.path.getsize(self._so_file))
+                    nativedroid_logger.info('Loaded %s (~%d bytes).', self._so_file, self._resident_size)
+        return self._project
+
+    @property
+    def _persistent(self):
+        return self._cache_dir is not None and self._so_digest is not None
+
+    def _load_project(self, save_snapshot):
+        snapshotting = self._persistent
+        if snapshotting:
+            project = load_project_snapshot(self._cache_dir, self._so_digest)
+            if project is not None:
+                nativedroid_logger.info('Restored %s from snapshot.', self._so_file)
+                return project
+        project = angr.Project(self._so_file, load_options=LOAD_OPTIONS)
+        if snapshotting and save_snapshot:
+            # Snapshot the loader state before any analysis hooks the project.
+            save_project_snapshot(self._cache_dir, self._so_digest, project)
+        return project
+
+    @contextmanager
+    def checkout(self):
+        """
+        Hold the handle exclusively for one analysis. If it is busy, most likely with the analysis that issued
+        this (nested) request, waiting would dead lock, so a private handle of the same binary is used instead.
+
+        :return: The handle to analyze with
+        :rtype: LibraryHandle
+        """
+        handle = self
+        if not handle.lock.acquire(False):
+            nativedroid_logger.info('Library handle %s is busy, use a private one.', self._so_digest)
+            handle = LibraryHandle(self._so_digest, self._so_file, self._cache_dir)
+            handle.lock.acquire()
+        try:
+            yield handle
+        finally:
+            handle.lock.release()
+
+    def get_symbol(self, name):
+        """
+        Look up symbol in the binary, results are memoized.
+
+        :param str name: Symbol name
+        :return: Symbol or None
+        """
+        with self._load_lock:
+            if name not in self._symbols:
+                self._symbols[name] = self.project.loader.main_object.get_symbol(name)
+            return self._symbols[name]
+
+    def has_symbol(self, name):
+        return self.get_symbol(name) is not None
+
+    @property
+    def elf_metadata(self):
+        """
+        Symbol metadata read straight from the ELF file, it does not need the project to be loaded.
+
+        :rtype: ElfMetadata
+        """
+        if self._elf_metadata is None:
+            self._elf_metadata = build_elf_metadata(self._so_file)
+        return self._elf_metadata
+
+    @property
+    def jni_references(self):
+        """
+        Java classes, methods and fields the binary may reference, scanned from its string constants. It does not
+        need the project to be loaded either.
+
+        :rtype: JniReferenceIndex
+        """
+        if self._jni_references is None:
+            self._jni_references = build_jni_reference_index(self._so_file)
+        return self._jni_references
+
+    def get_dynamic_register_map(self):
+        """
+        Get the methods registered in JNI_OnLoad. The map is resolved at most once per binary: it is kept in memory
+        and in the cache directory, so other handles and processes reuse it. The resolution installs its own hooks,
+        so it runs on a private project instead of the shared one.
+
+        :return: Method name and signature to function address
+        :rtype: dict
+        """
+        if self._dynamic_register_map is None:
+            with self._register_lock:
+                if self._dynamic_register_map is None:
+                    dynamic_register_map = self.get_cached_dynamic_register_map()
+                    if dynamic_register_map is None:
+                        project = self._load_project(save_snapshot=False)
+                        dynamic_register_map = dynamic_register_resolve(project, AnalysisCenter(None, None, None))
+                        if self._persistent:
+                            save_dynamic_register_map(self._cache_dir, self._so_digest, dynamic_register_map)
+                    self._dynamic_register_map = dynamic_register_map
+        return self._dynamic_register_map
+
+    def get_cached_dynamic_register_map(self):
+        """
+        Get the methods registered in JNI_OnLoad if they are already resolved, without resolving them.
+
+        :return: Method name and signature to function address, or None.
+        :rtype: dict
+        """
+        if self._dynamic_register_map is None and self._persistent:
+            self._dynamic_register_map = load_dynamic_register_map(self._cache_dir, self._so_digest)
+        return self._dynamic_register_map
+
+    def prewarm(self):
+        """
+        Do the expensive per-library work ahead of the first request: load the project, index all symbols of the
+        binary, scan its JNI references and resolve the dynamically registered methods. It is done once per handle,
+        later calls return at once.
+        """
+        if self._prewarmed:
+            return
+        with self._prewarm_lock:
+            if self._prewarmed:
+                return
+            for name in self.elf_metadata.exports:
+                self.get_symbol(name)
+            self.jni_references
+            self.get_dynamic_register_map()
+            self._prewarmed = True
+        nativedroid_logger.info('Prewarmed library handle %s.', self._so_digest)
+
+    def get_jni_native_interface(self, analysis_center):
+        """
+        Get the JNIEnv of this binary. It is built and hooked into the project once, later calls only rebind the
+        SimProcedures to the given analysis center.
+
+        :param AnalysisCenter analysis_center: Analysis center of the running analysis
+        :rtype: JNINativeInterface
+        """
+        with self._lock:
+            if self._jni_native_interface is None:
+                self._jni_native_interface = JNINativeInterface(self.project, analysis_center)
+            else:
+                self._jni_native_interface.bind(analysis_center)
+            return self._jni_native_interface
+
+
+class LibraryHandleCache(object):
+    """
+    LRU cache of LibraryHandle keyed by so_digest, bounded by both handle count and the estimated resident memory
+    of the loaded projects. The most recently used handle is never evicted.
+
+    :param int max_handles: Maximum number of handles kept
+    :param int max_memory: Maximum estimated memory in bytes of all loaded handles
+    :param str cache_dir: Directory of on-disk project snapshots shared by the handles
+    """
+
+    def __init__(self, max_handles=16, max_memory=4 * 1024 * 1024 * 1024, cache_dir=None):
+        self._max_handles = max_handles
+        self._max_memory = max_memory
+        self._cache_dir = cache_dir
+        self._handles = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._handles)
+
+    def __contains__(self, so_digest):
+        return so_digest in self._handles
+
+    def get(self, so_digest, so_file):
+        """
+        Get handle for given binary, create one if not cached.
+
+        :param str so_digest: sha256 digest of the binary
+        :param str so_file: Binary path
+        :rtype: LibraryHandle
+        """
+        with self._lock:
+            handle = self._handles.pop(so_digest, None)
+            if handle is None:
+                handle = LibraryHandle(so_digest, so_file, self._cache_dir)
+            self._handles[so_digest] = handle
+            self._shrink()
+            return handle
+
+    def evict(self, so_digest):
+        with self._lock:
+            return self._handles.pop(so_digest, None)
+
+    def _shrink(self):
+        while len(self._handles) > 1:
+            memory = sum(handle.resident_size for handle in self._handles.itervalues())
+            if len(self._handles) <= self._max_handles and memory <= self._max_memory:
+                break
+            so_digest, _ = self._handles.popitem(last=False)
+            nativedroid_logger.info('Evicted library handle %s.', so_digest)
@@ -0,0 +1,63 @@
+import unittest
+import pkg_resources
+from nativedroid.analyses.nativedroid_analysis import *
+from nativedroid.analyses.library_handle import LibraryHandleCache
+
+native_ss_file = pkg_resources.resource_filename('nativedroid.data', 'sourceAndSinks/NativeSourcesAndSinks.txt')
+java_ss_file = pkg_resources.resource_filename('nativedroid.data', 'sourceAndSinks/TaintSourcesAndSinks.txt')
+leak_so_file = pkg_resources.resource_filename('nativedroid.testdata', 'NativeLibs/native_leak/lib/armeabi/libleak.so')
+
+
+class LibraryHandleTest(unittest.TestCase):
+    def testReuseHandle(self):
+        library_handle = LibraryHandle('leak', leak_so_file)
+        jni_method_name = 'Java_org_arguslab_native_1leak_MainActivity_send'
+        jni_method_signature = 'Lorg/arguslab/native_leak/MainActivity;.send:(Ljava/lang/String;)V'
+        jni_method_arguments = 'org.arguslab.native_leak.MainActivity,java.lang.String'
+        first = gen_summary(None, library_handle, jni_method_name, jni_method_signature, jni_method_arguments,
+                            native_ss_file, java_ss_file)
+        project = library_handle.project
+        second = gen_summary(None, library_handle, jni_method_name, jni_method_signature, jni_method_arguments,
+                             native_ss_file, java_ss_file)
+        self.assertIs(project, library_handle.project)
+        self.assertEqual(first, second)
+        self.assertEqual('Lorg/arguslab/native_leak/MainActivity;.send:(Ljava/lang/String;)V -> _SINK_ 1',
+                         second[0])
+        self.assertTrue(has_symbol(library_handle, jni_method_name))
+
+    def testPrewarm(self):
+        so_file = pkg_resources.resource_filename('nativedroid.testdata',
+                                                  'NativeLibs/native_leak_dynamic_register/lib/'
+                                                  'armeabi/libleak_dynamic_register.so')
+        library_handle = LibraryHandle('leak_dynamic_register', so_file)
+        library_handle.prewarm()
+        self.assertTrue(library_handle.loaded)
+        self.assertTrue(library_handle.has_symbol('JNI_OnLoad'))
+        dynamic_map = library_handle.get_dynamic_register_map()
+        self.assertIn('send:(Ljava/lang/String;)V', dynamic_map)
+        self.assertIs(dynamic_map, library_handle.get_dynamic_register_map())
+        # Prewarming again does not redo the work.
+        library_handle.prewarm()
+        self.assertIs(dynamic_map, library_handle.get_dynamic_register_map())
+
+    def testCacheEviction(self):
+        cache = LibraryHandleCache(max_handles=2)
+        first = cache.get('a', leak_so_file)
+        cache.get('b', leak_so_file)
+        self.assertIs(first, cache.get('a', leak_so_file))
+        cache.get('c', leak_so_file)
+        self.assertEqual(2, len(cache))
+        self.assertIn('a', cache)
+        self.assertNotIn('b', cache)
+
+    def testCacheMemoryBound(self):
+        cache = LibraryHandleCache(max_memory=1)
+        cache.get('a', leak_so_file).project
+        cache.get('b', leak_so_file).project
+        cache.get('b', leak_so_file)
+        self.assertEqual(1, len(cache))
+        self.assertIn('b', cache)
+
+
+if __name__ == '__main__':
+    unittest.main()
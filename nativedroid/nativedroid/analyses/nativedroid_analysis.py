@@ -2,12 +2,14 @@ import logging
 
 import angr
 
+from nativedroid.analyses.analysis_budget import AnalysisBudget
 from nativedroid.analyses.analysis_center import AnalysisCenter
 from nativedroid.analyses.annotation_based_analysis import AnnotationBasedAnalysis
-from nativedroid.analyses.resolver.dynamic_register_resolution import dynamic_register_resolve
+from nativedroid.analyses.library_handle import LibraryHandle
 from nativedroid.analyses.resolver.jni.jni_type import jni_native_interface
 from nativedroid.analyses.resolver.model.native_pure_model import EnvMethodModel
 from nativedroid.analyses.source_and_sink_manager import SourceAndSinkManager
+from nativedroid.analyses.taint_cfg import TaintCFGAccurate
 
 __author__ = "Xingwei Lin, Fengguo Wei"
 __copyright__ = "Copyright 2018, The Argus-SAF Project"
@@ -16,88 +18,141 @@ __license__ = "Apache v2.0"
 nativedroid_logger = logging.getLogger('nativedroid')
 nativedroid_logger.setLevel(logging.INFO)
 
+angr.register_analysis(AnnotationBasedAnalysis, 'AnnotationBasedAnalysis')
+angr.register_analysis(TaintCFGAccurate, 'TaintCFGAccurate')
+
+
+def _get_library_handle(so_file):
+    """
+    Wrap a binary path into an uncached LibraryHandle, handles are passed through.
+
+    :param so_file: Binary path or LibraryHandle
+    :rtype: LibraryHandle
+    """
+    if isinstance(so_file, LibraryHandle):
+        return so_file
+    return LibraryHandle(None, so_file)
+
+
+def find_referenced_sources_and_sinks(jnsaf_client, so_file, ssm):
+    """
+    Scan the JNI references of the so_file before exploring it: start prefetching the summaries of the referenced
+    Java methods in one batch, and find out which configured sources and sinks are referenced at all.
+
+    :param JNSafClient jnsaf_client: JNSaf client
+    :param so_file: Binary path or LibraryHandle
+    :param SourceAndSinkManager ssm: Source and sink manager
+    :return: (sources, sinks) referenced by the binary
+    :rtype: tuple
+    """
+    library_handle = _get_library_handle(so_file)
+    jni_references = library_handle.jni_references
+    if jnsaf_client:
+        jnsaf_client.prefetch_summaries(jni_references.methods)
+    sources, sinks = jni_references.find_sources_and_sinks(ssm, library_handle.elf_metadata.imports)
+    if not sources and not sinks:
+        nativedroid_logger.info('%s references no configured source or sink.', library_handle.so_file)
+    return sources, sinks
+
 
 def gen_summary(jnsaf_client, so_file, jni_method_name_or_address, jni_method_signature, jni_method_arguments,
-                native_ss_file, java_ss_file):
+                native_ss_file, java_ss_file, analysis_budget=None):
     """
     Generate summary and taint tracking report based on annotation-based analysis.
 
     :param JNSafClient jnsaf_client: JNSaf client
-    :param so_file: Binary path
+    :param so_file: Binary path or LibraryHandle
     :param jni_method_name_or_address: JNI method name or func address
     :param jni_method_signature: JNI method signature
     :param jni_method_arguments: Arguments of JNI method
     :param native_ss_file: Native source and sink file path
     :param java_ss_file: Java source and sink file path
+    :param AnalysisBudget analysis_budget: Limits of the analysis, it tells whether the reports are partial
     :return: Taint analysis report, safsu_report and total execution instructions number
     :rtype: tuple
     """
     jni_native_interface.java_sas_file = java_ss_file
-    angr.register_analysis(AnnotationBasedAnalysis, 'AnnotationBasedAnalysis')
-    project = angr.Project(so_file, load_options={'main_opts': {'custom_base_addr': 0x0}})
     ssm = SourceAndSinkManager(native_ss_file, java_ss_file)
-    analysis_center = AnalysisCenter(jni_method_signature, jnsaf_client, ssm)
-    if isinstance(jni_method_name_or_address, long):
-        jni_method_addr = jni_method_name_or_address
-    else:
-        jni_method_symb = project.loader.main_object.get_symbol(jni_method_name_or_address)
-        if jni_method_symb is None:
-            nativedroid_logger.error('Failed to resolve jni method address for %s', jni_method_name_or_address)
-            return '', '`' + jni_method_signature + '`:;', 0
+    with _get_library_handle(so_file).checkout() as library_handle:
+        find_referenced_sources_and_sinks(jnsaf_client, library_handle, ssm)
+        analysis_center = AnalysisCenter(jni_method_signature, jnsaf_client, ssm, library_handle,
+                                         analysis_budget=analysis_budget)
+        project = library_handle.project
+        if isinstance(jni_method_name_or_address, long):
+            jni_method_addr = jni_method_name_or_address
+            # The address comes from the dynamic register map, share the resolved map instead of exploring
+            # JNI_OnLoad again.
+            dynamic_register_map = library_handle.get_cached_dynamic_register_map()
+            if dynamic_register_map:
+                analysis_center.get_dynamic_register_map().update(dynamic_register_map)
         else:
-            jni_method_addr = jni_method_symb.rebased_addr
-    annotation_based_analysis = project.analyses.AnnotationBasedAnalysis(
-        analysis_center, jni_method_addr, jni_method_arguments, False)
-    sources, sinks = annotation_based_analysis.run()
-    taint_analysis_report = annotation_based_analysis.gen_taint_analysis_report(sources, sinks)
-    safsu_report = annotation_based_analysis.gen_saf_summary_report()
+            jni_method_symb = library_handle.get_symbol(jni_method_name_or_address)
+            if jni_method_symb is None:
+                nativedroid_logger.error('Failed to resolve jni method address for %s', jni_method_name_or_address)
+                return '', '`' + jni_method_signature + '`:;', 0
+            else:
+                jni_method_addr = jni_method_symb.rebased_addr
+        annotation_based_analysis = project.analyses.AnnotationBasedAnalysis(
+            analysis_center, jni_method_addr, jni_method_arguments, False)
+        sources, sinks = annotation_based_analysis.run()
+        taint_analysis_report = annotation_based_analysis.gen_taint_analysis_report(sources, sinks)
+        safsu_report = annotation_based_analysis.gen_saf_summary_report()
+        total_instructions = annotation_based_analysis.count_cfg_instructions()
     nativedroid_logger.info('[Taint Analysis]\n%s', taint_analysis_report)
     nativedroid_logger.info('[SafSu Analysis]\n%s', safsu_report)
-    total_instructions = annotation_based_analysis.count_cfg_instructions()
     return taint_analysis_report, safsu_report, total_instructions
 
 
 def get_dynamic_register_methods(so_file, jni_method_signature):
     """
     Get dynamically registered methods
-    :param so_file: Binary path
+    :param so_file: Binary path or LibraryHandle
     :param jni_method_signature: JNI method signature
     :return: dict
     """
-    angr.register_analysis(AnnotationBasedAnalysis, 'AnnotationBasedAnalysis')
-    project = angr.Project(so_file, load_options={'main_opts': {'custom_base_addr': 0x0}})
-    analysis_center = AnalysisCenter(jni_method_signature, None, None)
-    return dynamic_register_resolve(project, analysis_center)
+    return dict(_get_library_handle(so_file).get_dynamic_register_map())
 
 
 def has_symbol(so_file, symbol):
     """
     check is given symbol in the so_file
-    :param so_file: so file
+    :param so_file: so file or LibraryHandle
     :param symbol: the symbol to check
     :return: boolean
     """
-    project = angr.Project(so_file, load_options={'auto_load_libs': False, 'main_opts': {'custom_base_addr': 0x0}})
-    return project.loader.main_object.get_symbol(symbol) is not None
+    return get_elf_metadata(so_file).has_symbol(symbol)
+
+
+def get_elf_metadata(so_file):
+    """
+    Get exported and imported symbols of the so_file, without loading it into angr.
+    :param so_file: so file or LibraryHandle
+    :return: ElfMetadata
+    """
+    return _get_library_handle(so_file).elf_metadata
 
 
-def native_activity_analysis(jnsaf_client, so_file, custom_entry_func_name, native_ss_file, java_ss_file):
+def native_activity_analysis(jnsaf_client, so_file, custom_entry_func_name, native_ss_file, java_ss_file,
+                             analysis_budget=None):
     """
     Do the analysis for pure native activity.
 
     :param JNSafClient jnsaf_client: JNSaf client
-    :param so_file: so file
+    :param so_file: so file or LibraryHandle
     :param custom_entry_func_name: Custom entry function name
     :param native_ss_file: native source and sink file path
     :param java_ss_file: java source and sink file path
+    :param AnalysisBudget analysis_budget: Limits of the analysis
     :return: total instructions: total execution instructions
     """
-
-    angr.register_analysis(AnnotationBasedAnalysis, 'AnnotationBasedAnalysis')
-    project = angr.Project(so_file, load_options={'auto_load_libs': False, 'main_opts': {'custom_base_addr': 0x0}})
     ssm = SourceAndSinkManager(native_ss_file, java_ss_file)
+    library_handle = _get_library_handle(so_file)
+    find_referenced_sources_and_sinks(jnsaf_client, library_handle, ssm)
+    # Entry callbacks are hooked with the state of this analysis, so it runs on a private project.
+    so_file = library_handle.so_file
+    project = angr.Project(so_file, load_options={'auto_load_libs': False, 'main_opts': {'custom_base_addr': 0x0}})
     jni_method_signature = 'Landroid/app/NativeActivity;.onCreate:(Landroid/os/Bundle;)V'
-    analysis_center = AnalysisCenter(jni_method_signature, jnsaf_client, ssm)
+    analysis_center = AnalysisCenter(jni_method_signature, jnsaf_client, ssm, analysis_budget=analysis_budget)
     env_method_model = EnvMethodModel()
     android_main_symbol = project.loader.main_object.get_symbol('android_main')
     if android_main_symbol:
@@ -22,6 +22,53 @@ class NativeDroidAnalysisTest(unittest.TestCase):
         self.assertEqual('`Lorg/arguslab/native_leak/MainActivity;.send:(Ljava/lang/String;)V`:\n;',
                          safsu_report)
 
+    def testLibLeakBudget(self):
+        so_file = pkg_resources.resource_filename('nativedroid.testdata',
+                                                  'NativeLibs/native_leak/lib/armeabi/libleak.so')
+        jni_method_name = 'Java_org_arguslab_native_1leak_MainActivity_send'
+        jni_method_signature = 'Lorg/arguslab/native_leak/MainActivity;.send:(Ljava/lang/String;)V'
+        jni_method_arguments = 'org.arguslab.native_leak.MainActivity,java.lang.String'
+        analysis_budget = AnalysisBudget(max_instructions=1)
+        taint_analysis_report, safsu_report, total_instructions = gen_summary(None, so_file, jni_method_name,
+                                                                              jni_method_signature,
+                                                                              jni_method_arguments,
+                                                                              native_ss_file, java_ss_file,
+                                                                              analysis_budget)
+        self.assertTrue(analysis_budget.partial)
+        self.assertEqual('instructions', analysis_budget.exhausted)
+        self.assertEqual('', taint_analysis_report)
+        analysis_budget = AnalysisBudget(max_instructions=100000)
+        taint_analysis_report, _, _ = gen_summary(None, so_file, jni_method_name, jni_method_signature,
+                                                  jni_method_arguments, native_ss_file, java_ss_file, analysis_budget)
+        self.assertFalse(analysis_budget.partial)
+        self.assertEqual('Lorg/arguslab/native_leak/MainActivity;.send:(Ljava/lang/String;)V -> _SINK_ 1',
+                         taint_analysis_report)
+
+    def testLibLeakTaintSites(self):
+        so_file = pkg_resources.resource_filename('nativedroid.testdata',
+                                                  'NativeLibs/native_leak/lib/armeabi/libleak.so')
+        jni_method_name = 'Java_org_arguslab_native_1leak_MainActivity_send'
+        jni_method_signature = 'Lorg/arguslab/native_leak/MainActivity;.send:(Ljava/lang/String;)V'
+        jni_method_arguments = 'org.arguslab.native_leak.MainActivity,java.lang.String'
+        jni_native_interface.java_sas_file = java_ss_file
+        ssm = SourceAndSinkManager(native_ss_file, java_ss_file)
+        library_handle = LibraryHandle('leak', so_file)
+        with library_handle.checkout():
+            jni_method_addr = library_handle.get_symbol(jni_method_name).rebased_addr
+            sink_annotations = list()
+            for keep_state in [False, True]:
+                analysis_center = AnalysisCenter(jni_method_signature, None, ssm, library_handle)
+                analysis = library_handle.project.analyses.AnnotationBasedAnalysis(
+                    analysis_center, jni_method_addr, jni_method_arguments, False, keep_state=keep_state)
+                sink_annotations.append(analysis.taint_sites.sink_annotations)
+                if not keep_state:
+                    self.assertTrue(all(node.input_state is None and not node.final_states
+                                        for node in analysis.cfg.nodes()))
+        # The string only reaches the sink through the JNI function models, which must run without keep_state too.
+        self.assertTrue(sink_annotations[0])
+        self.assertEqual([repr(annotation) for annotation in sink_annotations[1]],
+                         [repr(annotation) for annotation in sink_annotations[0]])
+
     def testLibIntent(self):
         so_file = pkg_resources.resource_filename('nativedroid.testdata',
                                                   'NativeLibs/icc_nativetojava/lib/armeabi/libintent.so')
@@ -1,3 +1,6 @@
+from nativedroid.analyses.resolver.annotation.annotation_info import *
+from nativedroid.analyses.resolver.annotation.annotation_interner import *
+from nativedroid.analyses.resolver.annotation.heap_abstraction import *
 from nativedroid.analyses.resolver.annotation.java_type_annotations import *
 from nativedroid.analyses.resolver.annotation.jclass_annotation import *
 from nativedroid.analyses.resolver.annotation.jfield_id_annotation import *
@@ -0,0 +1,203 @@
+from nativedroid.analyses.taint_tags import TAINT_KINDS, TAINT_TAGS, TAINT_TYPES
+
+__author__ = "Fengguo Wei"
+__copyright__ = "Copyright 2018, The Argus-SAF Project"
+__license__ = "Apache v2.0"
+
+
+class AnnotationInfo(object):
+    """
+    Fixed record of annotation info. It keeps the dict style access of the former info dicts, e.g.
+    `annotation.taint_info['is_taint']`, but stores the values in slots. Unknown keys raise KeyError like a dict.
+    """
+
+    __slots__ = ()
+    # Keys of the dict style access, the slots by default.
+    _keys = None
+
+    def __init__(self, **kwargs):
+        for key in self.__slots__:
+            setattr(self, key, None)
+        for key, value in kwargs.iteritems():
+            self[key] = value
+
+    @classmethod
+    def _key_names(cls):
+        return cls._keys if cls._keys is not None else cls.__slots__
+
+    @classmethod
+    def from_value(cls, value):
+        """
+        Convert a dict to the record, records are passed through.
+
+        :param value: Record or dict
+        """
+        if isinstance(value, cls):
+            return value
+        return cls(**value)
+
+    def __getitem__(self, key):
+        if key not in self._key_names():
+            raise KeyError(key)
+        return getattr(self, key)
+
+    def __setitem__(self, key, value):
+        if key not in self._key_names():
+            raise KeyError(key)
+        setattr(self, key, value)
+
+    def __contains__(self, key):
+        return key in self._key_names()
+
+    def __iter__(self):
+        return iter(self._key_names())
+
+    def __eq__(self, other):
+        if isinstance(other, dict):
+            other = self.from_value(other)
+        return type(self) is type(other) and self.items() == other.items()
+
+    def __ne__(self, other):
+        return not self == other
+
+    def __repr__(self):
+        return '{%s}' % ', '.join('%r: %r' % item for item in self.items())
+
+    def get(self, key, default=None):
+        return getattr(self, key) if key in self._key_names() else default
+
+    def keys(self):
+        return list(self._key_names())
+
+    def items(self):
+        return [(key, getattr(self, key)) for key in self._key_names()]
+
+    def copy(self):
+        info = self.__class__.__new__(self.__class__)
+        for key in self.__slots__:
+            setattr(info, key, getattr(self, key))
+        return info
+
+
+class FieldInfo(AnnotationInfo):
+    __slots__ = ('is_field', 'field_name', 'base_annotation')
+
+    def __init__(self, **kwargs):
+        super(FieldInfo, self).__init__(**kwargs)
+        if self.is_field is None:
+            self.is_field = False
+
+
+class ArrayInfo(AnnotationInfo):
+    __slots__ = ('is_element', 'element_index', 'base_annotation')
+
+    def __init__(self, **kwargs):
+        super(ArrayInfo, self).__init__(**kwargs)
+        if self.is_element is None:
+            self.is_element = False
+
+
+class TaintInfo(AnnotationInfo):
+    """
+    Taint of a value. The role (_SOURCE_ or _SINK_), origin (e.g. _API_ or _ARGUMENT_), tags and kinds are interned
+    bits, see taint_tags. The former string values are still available under their keys, e.g. `taint_type` gives
+    `['_SOURCE_', '_API_']`, but they are converted on every access, so hot paths should use the bits.
+    """
+
+    __slots__ = ('is_taint', 'role', 'origin', 'tag_bits', 'source_kind_bit', 'sink_kind_bit')
+    _keys = ('is_taint', 'taint_type', 'taint_info', 'source_kind', 'sink_kind')
+
+    def __init__(self, **kwargs):
+        self.is_taint = False
+        self.role = 0
+        self.origin = 0
+        self.tag_bits = 0
+        self.source_kind_bit = 0
+        self.sink_kind_bit = 0
+        for key, value in kwargs.iteritems():
+            self[key] = value
+
+    def copy(self):
+        info = TaintInfo.__new__(TaintInfo)
+        info.is_taint = self.is_taint
+        info.role = self.role
+        info.origin = self.origin
+        info.tag_bits = self.tag_bits
+        info.source_kind_bit = self.source_kind_bit
+        info.sink_kind_bit = self.sink_kind_bit
+        return info
+
+    def set_taint(self, role, origin, tag_bits, source_kind_bit=None, sink_kind_bit=None):
+        """
+        Mark the value as tainted, kinds which are None are kept.
+        """
+        self.is_taint = True
+        self.role = role
+        self.origin = origin
+        self.tag_bits = tag_bits
+        if source_kind_bit is not None:
+            self.source_kind_bit = source_kind_bit
+        if sink_kind_bit is not None:
+            self.sink_kind_bit = sink_kind_bit
+
+    @property
+    def taint_type(self):
+        if not self.role and not self.origin:
+            return None
+        return [TAINT_TYPES.name(self.role), TAINT_TYPES.name(self.origin)]
+
+    @taint_type.setter
+    def taint_type(self, value):
+        role, origin = value if value else (None, None)
+        self.role = TAINT_TYPES.bit(role) if role else 0
+        self.origin = TAINT_TYPES.bit(origin) if origin else 0
+
+    @property
+    def taint_info(self):
+        return TAINT_TAGS.names(self.tag_bits) if self.tag_bits else None
+
+    @taint_info.setter
+    def taint_info(self, value):
+        self.tag_bits = TAINT_TAGS.bits(value)
+
+    @property
+    def source_kind(self):
+        return TAINT_KINDS.name(self.source_kind_bit)
+
+    @source_kind.setter
+    def source_kind(self, value):
+        self.source_kind_bit = TAINT_KINDS.bit(value) if value else 0
+
+    @property
+    def sink_kind(self):
+        return TAINT_KINDS.name(self.sink_kind_bit)
+
+    @sink_kind.setter
+    def sink_kind(self, value):
+        self.sink_kind_bit = TAINT_KINDS.bit(value) if value else 0
+
+
+class IccInfo(AnnotationInfo):
+    __slots__ = ('is_icc', 'activity_name', 'component_name', 'extra')
+
+    def __init__(self, **kwargs):
+        super(IccInfo, self).__init__(**kwargs)
+        if self.is_icc is None:
+            self.is_icc = False
+
+    def copy(self):
+        info = super(IccInfo, self).copy()
+        if isinstance(info.extra, dict):
+            info.extra = dict(info.extra)
+        return info
+
+
+def copy_taint_info(taint_info):
+    """
+    Copy taint info.
+
+    :param taint_info: TaintInfo or dict
+    :return: Copied taint info
+    :rtype: TaintInfo
+    """
+    return TaintInfo.from_value(taint_info).copy()
@@ -0,0 +1,31 @@
+from nativedroid.analyses.resolver.annotation.java_type_annotations import JavaTypeAnnotation
+
+__author__ = "Fengguo Wei"
+__copyright__ = "Copyright 2018, The Argus-SAF Project"
+__license__ = "Apache v2.0"
+
+
+class AnnotationInterner(object):
+    """
+    Interning table of the annotations of an analysis. Structurally equal annotations are mapped to the first one
+    interned, so identical taint facts reaching many final states collapse to one object and sets of interned
+    annotations deduplicate. Only intern annotations which are not updated any more.
+    """
+
+    def __init__(self):
+        self._canonical = dict()
+
+    def __len__(self):
+        return len(self._canonical)
+
+    def intern(self, annotation):
+        """
+        Get the canonical annotation of given annotation.
+
+        :param JavaTypeAnnotation annotation: Annotation
+        :return: The first interned annotation structurally equal to it
+        :rtype: JavaTypeAnnotation
+        """
+        if not isinstance(annotation, JavaTypeAnnotation):
+            return annotation
+        return self._canonical.setdefault(annotation.structural_key(), annotation)
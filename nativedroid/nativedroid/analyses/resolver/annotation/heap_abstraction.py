@@ -0,0 +1,96 @@
+from nativedroid.analyses.resolver.annotation.annotation_info import copy_taint_info
+from nativedroid.analyses.resolver.annotation.java_type_annotations import JArrayAnnotation
+
+__author__ = "Fengguo Wei"
+__copyright__ = "Copyright 2018, The Argus-SAF Project"
+__license__ = "Apache v2.0"
+
+
+class HeapAbstraction(object):
+    """
+    Bounds the heap built from the annotations. Field access chains are k-limited: an object at depth field_depth
+    summarizes all objects reachable from it, so reading a field of it gives the object itself and writing a field of
+    it joins the taint of the value into it. With smash_arrays, all elements of an array are one summary element.
+
+    :param int field_depth: Maximal length of field and element chains, None for unbounded
+    :param bool smash_arrays: Whether to keep one element per array
+    """
+
+    def __init__(self, field_depth=5, smash_arrays=True):
+        self._field_depth = field_depth
+        self._smash_arrays = smash_arrays
+
+    @property
+    def field_depth(self):
+        return self._field_depth
+
+    @property
+    def smash_arrays(self):
+        return self._smash_arrays
+
+    @staticmethod
+    def depth_of(annotation):
+        """
+        Length of the field and element chain from the root object to given annotation.
+
+        :param JavaTypeAnnotation annotation: Annotation
+        :rtype: int
+        """
+        depth = 0
+        while True:
+            if annotation.field_info['is_field']:
+                annotation = annotation.field_info['base_annotation']
+            elif annotation.array_info['is_element']:
+                annotation = annotation.array_info['base_annotation']
+            else:
+                return depth
+            if annotation is None:
+                return depth
+            depth += 1
+
+    def is_summary(self, annotation):
+        """
+        Whether given annotation is at the depth limit, i.e. summarizes the objects reachable from it.
+
+        :param JavaTypeAnnotation annotation: Annotation
+        :rtype: bool
+        """
+        return self._field_depth is not None and self.depth_of(annotation) >= self._field_depth
+
+    @staticmethod
+    def find_field(annotation, field_name, obj_type=None):
+        """
+        Find a field of an object annotation.
+
+        :param JobjectAnnotation annotation: Object annotation
+        :param str field_name: Field name
+        :param str obj_type: Field type, None for any
+        :return: Field annotation or None
+        """
+        for field in annotation.fields_info:
+            if field.field_info['field_name'] == field_name and (obj_type is None or field.obj_type == obj_type):
+                return field
+        return None
+
+    @staticmethod
+    def join_taint(summary, annotation):
+        """
+        Join the taint of an annotation into a summary annotation.
+        """
+        if annotation.taint_info['is_taint'] and not summary.taint_info['is_taint']:
+            summary.taint_info = copy_taint_info(annotation.taint_info)
+
+    def get_element(self, array_annotation, make_element):
+        """
+        Get the element annotation of an array access.
+
+        :param JArrayAnnotation array_annotation: Array annotation
+        :param make_element: Function creating a new element annotation
+        :return: The summary element of the array if arrays are smashed, otherwise a new element
+        :rtype: JavaTypeAnnotation
+        """
+        if not self._smash_arrays or not isinstance(array_annotation, JArrayAnnotation):
+            return make_element()
+        if not array_annotation.elements:
+            array_annotation.elements = [make_element()]
+        return array_annotation.elements[0]
@@ -0,0 +1,46 @@
+import unittest
+
+from nativedroid.analyses.resolver.annotation import *
+from nativedroid.analyses.taint_tags import ARGUMENT, SENSITIVE_INFO, SOURCE
+
+
+def _field(base, name):
+    field = JobjectAnnotation(base.source, 'org/arguslab/Node', list())
+    field.field_info = {'is_field': True, 'field_name': name, 'base_annotation': base}
+    return field
+
+
+class HeapAbstractionTest(unittest.TestCase):
+    def testFieldDepth(self):
+        heap_abstraction = HeapAbstraction(field_depth=2)
+        root = JobjectAnnotation('arg1', 'org/arguslab/Node', list())
+        child = _field(root, 'next')
+        grandchild = _field(child, 'next')
+        self.assertEqual([0, 1, 2], map(HeapAbstraction.depth_of, [root, child, grandchild]))
+        self.assertFalse(heap_abstraction.is_summary(child))
+        self.assertTrue(heap_abstraction.is_summary(grandchild))
+        self.assertFalse(HeapAbstraction(field_depth=None).is_summary(grandchild))
+
+    def testFindFieldAndJoin(self):
+        root = JobjectAnnotation('arg1', 'org/arguslab/Node', list())
+        child = _field(root, 'next')
+        root.fields_info.append(child)
+        self.assertIs(child, HeapAbstraction.find_field(root, 'next'))
+        self.assertIsNone(HeapAbstraction.find_field(root, 'next', 'java/lang/String'))
+        value = JstringAnnotation('arg2')
+        value.taint_info.set_taint(SOURCE, ARGUMENT, SENSITIVE_INFO)
+        HeapAbstraction.join_taint(child, value)
+        self.assertEqual(SOURCE, child.taint_info.role)
+
+    def testSmashedElement(self):
+        array = JobjectArrayAnnotation('arg1')
+        elements = [HeapAbstraction().get_element(array, lambda: JobjectAnnotation('arg1', 'java/lang/Object', list()))
+                    for _ in xrange(3)]
+        self.assertIs(elements[0], elements[2])
+        self.assertEqual(1, len(array.elements))
+        self.assertIsNot(elements[0], HeapAbstraction(smash_arrays=False).get_element(
+            array, lambda: JobjectAnnotation('arg1', 'java/lang/Object', list())))
+
+
+if __name__ == '__main__':
+    unittest.main()
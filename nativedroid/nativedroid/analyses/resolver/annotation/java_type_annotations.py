@@ -1,12 +1,49 @@
 import re
 from claripy import Annotation
 
+from nativedroid.analyses.resolver.annotation.annotation_info import *
+
 __author__ = "Xingwei Lin, Fengguo Wei"
 __copyright__ = "Copyright 2018, The Argus-SAF Project"
 __license__ = "Apache v2.0"
 
 
+def _slots_of(cls):
+    slots = cls.__dict__.get('_all_slots')
+    if slots is None:
+        slots = tuple(slot for klass in reversed(cls.__mro__) for slot in klass.__dict__.get('__slots__', ()))
+        cls._all_slots = slots
+    return slots
+
+
+def _value_key(value):
+    if isinstance(value, JavaTypeAnnotation):
+        return value.structural_key()
+    if isinstance(value, AnnotationInfo):
+        return (value.__class__,) + tuple(_info_value_key(slot, getattr(value, slot)) for slot in value.__slots__)
+    if isinstance(value, dict):
+        return (dict,) + tuple(sorted((key, _value_key(item)) for key, item in value.iteritems()))
+    if isinstance(value, (list, tuple)):
+        return tuple(_value_key(item) for item in value)
+    return value
+
+
+def _info_value_key(slot, value):
+    if slot == 'base_annotation' and value is not None:
+        # The base annotation usually holds the annotation of the info in its fields, so only its identifying
+        # attributes are part of the key.
+        return value.__class__, value.source, value.heap, value.obj_type
+    return _value_key(value)
+
+
 class JavaTypeAnnotation(Annotation):
+    """
+    Base of the Java value annotations. Attributes are kept in slots and the info records are slotted as well, as
+    every value flowing through the registers carries an annotation.
+    """
+
+    __slots__ = ('_source', '_heap', '_obj_type', '_field_info', '_array_info', '_taint_info', '_icc_info')
+
     def __init__(self, source, obj_type):
         """
 
@@ -16,11 +53,10 @@ class JavaTypeAnnotation(Annotation):
         self._source = source
         self._heap = 'arg:' + str(re.split('arg|_', source)[1]) if source.startswith('arg') else None
         self._obj_type = obj_type
-        self._field_info = {'is_field': False, 'field_name': None, 'base_annotation': None}
-        self._array_info = {'is_element': False, 'element_index': None, 'base_annotation': None}
-        self._taint_info = {'is_taint': False, 'taint_type': None, 'taint_info': None,
-                            'source_kind': None, 'sink_kind': None}
-        self._icc_info = {'is_icc': False, 'activity_name': None, 'extra': None}
+        self._field_info = FieldInfo()
+        self._array_info = ArrayInfo()
+        self._taint_info = TaintInfo()
+        self._icc_info = IccInfo()
 
     def __repr__(self):
         text = '%s {\n  Source: %s\n  Heap: %s\n  Type: %s\n  '\
@@ -59,7 +95,7 @@ class JavaTypeAnnotation(Annotation):
 
     @field_info.setter
     def field_info(self, value):
-        self._field_info = value
+        self._field_info = FieldInfo.from_value(value)
 
     @property
     def array_info(self):
@@ -67,7 +103,7 @@ class JavaTypeAnnotation(Annotation):
 
     @array_info.setter
     def array_info(self, value):
-        self._array_info = value
+        self._array_info = ArrayInfo.from_value(value)
 
     @property
     def taint_info(self):
@@ -75,7 +111,7 @@ class JavaTypeAnnotation(Annotation):
 
     @taint_info.setter
     def taint_info(self, value):
-        self._taint_info = value
+        self._taint_info = TaintInfo.from_value(value)
 
     @property
     def icc_info(self):
@@ -83,7 +119,7 @@ class JavaTypeAnnotation(Annotation):
 
     @icc_info.setter
     def icc_info(self, value):
-        self._icc_info = value
+        self._icc_info = IccInfo.from_value(value)
 
     @property
     def eliminatable(self):
@@ -96,12 +132,46 @@ class JavaTypeAnnotation(Annotation):
     def relocate(self, src, dst):
         return self
 
+    def structural_key(self):
+        """
+        Key of the content of this annotation, including the annotations it refers to. Annotations with equal keys
+        describe the same fact, see AnnotationInterner. Hashing and equality of annotations stay identity based, as
+        claripy hashes annotations into the ASTs they annotate and annotations may still be updated in place.
+
+        :rtype: tuple
+        """
+        return (self.__class__,) + tuple(_value_key(getattr(self, slot)) for slot in _slots_of(self.__class__))
+
+    def structurally_equal(self, other):
+        return isinstance(other, JavaTypeAnnotation) and self.structural_key() == other.structural_key()
+
+    def copy(self):
+        """
+        Copy on write: the copy owns its info records and containers, so they can be updated without affecting this
+        annotation, while the annotations they refer to (base annotations, fields, elements and ICC extras) are
+        shared. To change a shared annotation, derive a copy of it instead.
+
+        :return: Copied annotation
+        :rtype: JavaTypeAnnotation
+        """
+        cls = self.__class__
+        annotation = cls.__new__(cls)
+        for slot in _slots_of(cls):
+            setattr(annotation, slot, getattr(self, slot))
+        annotation._field_info = self._field_info.copy()
+        annotation._array_info = self._array_info.copy()
+        annotation._taint_info = self._taint_info.copy()
+        annotation._icc_info = self._icc_info.copy()
+        return annotation
+
 
 class JobjectAnnotation(JavaTypeAnnotation):
     """
     This annotation is used to annotate the flow of the object related operations.
     """
 
+    __slots__ = ('_fields_info',)
+
     def __init__(self, source, obj_type, fields_info):
         """
 
@@ -120,6 +190,11 @@ class JobjectAnnotation(JavaTypeAnnotation):
     def fields_info(self, value):
         self._fields_info = value
 
+    def copy(self):
+        annotation = super(JobjectAnnotation, self).copy()
+        annotation._fields_info = list(self._fields_info)
+        return annotation
+
 
 class PrimitiveTypeAnnotation(JavaTypeAnnotation):
     """
@@ -127,6 +202,8 @@ class PrimitiveTypeAnnotation(JavaTypeAnnotation):
     Primitive type includes jboolean, jbyte, jchar, jdouble, jfloat, jint, jlong, jshort.
     """
 
+    __slots__ = ('_value',)
+
     def __init__(self, source, obj_type, value=None):
         """
 
@@ -263,6 +340,8 @@ class JstringAnnotation(JobjectAnnotation):
     This annotation is used to store jstring type value information.
     """
 
+    __slots__ = ('_value',)
+
     def __init__(self, source, value=None):
         """
 
@@ -286,6 +365,8 @@ class JArrayAnnotation(JobjectAnnotation):
     This annotation is used to store array type value information.
     """
 
+    __slots__ = ('_elements',)
+
     def __init__(self, source, obj_type, elements=None):
         """
 
@@ -304,6 +385,12 @@ class JArrayAnnotation(JobjectAnnotation):
     def elements(self, value):
         self._elements = value
 
+    def copy(self):
+        annotation = super(JArrayAnnotation, self).copy()
+        if self._elements is not None:
+            annotation._elements = list(self._elements)
+        return annotation
+
 
 class JbooleanArrayAnnotation(JArrayAnnotation):
     """
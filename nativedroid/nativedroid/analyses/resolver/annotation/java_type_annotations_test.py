@@ -0,0 +1,88 @@
+import unittest
+
+from nativedroid.analyses.resolver.annotation import *
+from nativedroid.analyses.taint_tags import API, SENSITIVE_INFO, SINK, SOURCE
+
+
+class JavaTypeAnnotationsTest(unittest.TestCase):
+    def testCopyOnWrite(self):
+        base = JobjectAnnotation('arg1', 'org/arguslab/Data', list())
+        field = JstringAnnotation('arg1')
+        field.field_info = {'is_field': True, 'field_name': 'secret', 'base_annotation': base}
+        field.taint_info['taint_type'] = ['_SOURCE_', '_API_']
+        base.fields_info.append(field)
+
+        derived = base.copy()
+        self.assertIs(field, derived.fields_info[0])
+        derived.fields_info.append(JintAnnotation('arg1'))
+        derived.taint_info['is_taint'] = True
+        self.assertEqual(1, len(base.fields_info))
+        self.assertFalse(base.taint_info['is_taint'])
+
+        sink = field.copy()
+        sink.taint_info.role = SINK
+        sink.field_info['field_name'] = 'other'
+        self.assertEqual(['_SOURCE_', '_API_'], field.taint_info['taint_type'])
+        self.assertEqual('secret', field.field_info['field_name'])
+        self.assertIs(base, sink.field_info['base_annotation'])
+        self.assertIsInstance(sink, JstringAnnotation)
+
+    def testInfoRecords(self):
+        annotation = JstringAnnotation('arg1', 'value')
+        self.assertFalse(hasattr(annotation, '__dict__') and annotation.__dict__)
+        self.assertIsInstance(annotation.taint_info, TaintInfo)
+        self.assertFalse(annotation.taint_info['is_taint'])
+        annotation.taint_info['taint_type'] = ['_SOURCE_', '_API_']
+        self.assertEqual(['_SOURCE_', '_API_'], annotation.taint_info['taint_type'])
+        annotation.field_info = {'is_field': True, 'field_name': 'name', 'base_annotation': None}
+        self.assertIsInstance(annotation.field_info, FieldInfo)
+        self.assertEqual('name', annotation.field_info['field_name'])
+        self.assertEqual({'is_field': True, 'field_name': 'name', 'base_annotation': None}, annotation.field_info)
+        annotation.icc_info['component_name'] = 'org.arguslab.Foo'
+        self.assertEqual('org.arguslab.Foo', annotation.copy().icc_info['component_name'])
+        self.assertEqual('value', annotation.copy().value)
+        with self.assertRaises(KeyError):
+            annotation.field_info['field_signature']
+
+    def testTaintBits(self):
+        taint_info = TaintInfo(is_taint=True, taint_type=['_SOURCE_', '_API_'], taint_info=['SENSITIVE_INFO'],
+                               source_kind='icc_source')
+        self.assertEqual((SOURCE, API, SENSITIVE_INFO), (taint_info.role, taint_info.origin, taint_info.tag_bits))
+        self.assertEqual(['SENSITIVE_INFO'], taint_info['taint_info'])
+        self.assertEqual('icc_source', taint_info['source_kind'])
+        self.assertIsNone(taint_info['sink_kind'])
+        self.assertEqual(taint_info, copy_taint_info(taint_info))
+        self.assertEqual(['is_taint', 'taint_type', 'taint_info', 'source_kind', 'sink_kind'], taint_info.keys())
+        sink = copy_taint_info(taint_info)
+        sink.set_taint(SINK, SOURCE, SENSITIVE_INFO)
+        self.assertEqual(['_SINK_', '_SOURCE_'], sink['taint_type'])
+        self.assertEqual('icc_source', sink['source_kind'])
+        self.assertEqual(['_SOURCE_', '_API_'], taint_info['taint_type'])
+
+    def testStructuralKey(self):
+        base = JobjectAnnotation('arg1', 'org/arguslab/Data', list())
+        field = JstringAnnotation('arg1')
+        field.field_info = {'is_field': True, 'field_name': 'secret', 'base_annotation': base}
+        base.fields_info.append(field)
+        self.assertTrue(base.copy().structurally_equal(base))
+        self.assertTrue(field.copy().structurally_equal(field))
+        tainted = base.copy()
+        tainted.taint_info.set_taint(SOURCE, API, SENSITIVE_INFO)
+        self.assertFalse(tainted.structurally_equal(base))
+        self.assertNotEqual(base.copy(), base)
+
+    def testInterner(self):
+        interner = AnnotationInterner()
+        annotation = JobjectAnnotation('arg1', 'org/arguslab/Data', list())
+        annotation.taint_info.set_taint(SINK, SOURCE, SENSITIVE_INFO)
+        sinks = set(interner.intern(annotation.copy()) for _ in xrange(10))
+        self.assertEqual(1, len(sinks))
+        self.assertEqual(1, len(interner))
+        other = annotation.copy()
+        other.taint_info.set_taint(SINK, API, SENSITIVE_INFO)
+        self.assertIsNot(sinks.pop(), interner.intern(other))
+        self.assertEqual(2, len(interner))
+
+
+if __name__ == '__main__':
+    unittest.main()
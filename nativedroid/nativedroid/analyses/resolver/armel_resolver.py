@@ -1,5 +1,6 @@
 from nativedroid.analyses.resolver.taint_resolver import TaintResolver
 from nativedroid.analyses.resolver.model.android_app_model import *
+from nativedroid.analyses.taint_tags import API_SOURCE, ARGUMENT, SENSITIVE_INFO, SOURCE
 
 __author__ = "Xingwei Lin"
 __copyright__ = "Copyright 2018, The Argus-SAF Project"
@@ -29,8 +30,12 @@ class ArmelResolver(TaintResolver):
             raise ValueError("Param num is limited to 15 for armel.")
 
         state = self._project.factory.blank_state(mode="fastpath")
-        state.regs.r0 = claripy.BVV(JNINativeInterface(self._project, self._analysis_center).ptr,
-                                    self._project.arch.bits)
+        library_handle = self._analysis_center.get_library_handle()
+        if library_handle is not None:
+            jni_native_interface = library_handle.get_jni_native_interface(self._analysis_center)
+        else:
+            jni_native_interface = JNINativeInterface(self._project, self._analysis_center)
+        state.regs.r0 = claripy.BVV(jni_native_interface.ptr, self._project.arch.bits)
         # state.regs.r1 = claripy.BVV(JObject(self._project).ptr, self._project.arch.bits)
         i = 1
 
@@ -64,10 +69,7 @@ class ArmelResolver(TaintResolver):
             data = claripy.BVV(typ.ptr, typ_size)
             argument_annotation = construct_annotation(argument_type, argument_name)
             # argument_annotation = jobjectAnnotation(source=argument_name, obj_type=argument_type, fields_info=list())
-            argument_annotation.taint_info['is_taint'] = True
-            argument_annotation.taint_info['taint_type'] = ['_SOURCE_', '_ARGUMENT_']
-            argument_annotation.taint_info['taint_info'] = ['SENSITIVE_INFO']
-            argument_annotation.taint_info['source_kind'] = 'api_source'
+            argument_annotation.taint_info.set_taint(SOURCE, ARGUMENT, SENSITIVE_INFO, source_kind_bit=API_SOURCE)
             data = data.annotate(argument_annotation)
             state.regs.__setattr__('r%d' % (idx + i), data)
             # store the argument summary
@@ -81,10 +83,7 @@ class ArmelResolver(TaintResolver):
             data = claripy.BVV(typ.ptr, typ_size)
             argument_annotation = construct_annotation(argument_type, argument_name)
             # argument_annotation = jobjectAnnotation(source=argument_name, obj_type=argument_type, fields_info=list())
-            argument_annotation.taint_info['is_taint'] = True
-            argument_annotation.taint_info['taint_type'] = ['_SOURCE_', '_ARGUMENT_']
-            argument_annotation.taint_info['taint_info'] = ['SENSITIVE_INFO']
-            argument_annotation.taint_info['source_kind'] = 'api_source'
+            argument_annotation.taint_info.set_taint(SOURCE, ARGUMENT, SENSITIVE_INFO, source_kind_bit=API_SOURCE)
             data = data.annotate(argument_annotation)
             state.stack_push(data)
             # store the argument summary
@@ -115,7 +114,7 @@ class ArmelResolver(TaintResolver):
         :param angr.sim_type.SimState input_state: SimState of current program point.
         :param list final_states: Final SimState of current point.
         :param list positions: Taint argument candidates.
-        :param list tags: Taint tags.
+        :param int tags: Taint tag bits.
         :return: Tainted args
         :rtype: list
         """
@@ -130,8 +129,7 @@ class ArmelResolver(TaintResolver):
                     reg_arg = input_state.regs.get('r%d' % reg_position)
                     for annotation in reg_arg.annotations:
                         if isinstance(annotation, JobjectAnnotation):
-                            if annotation.taint_info['is_taint']:
-                                # if TaintResolver._is_taint(annotation.obj_taint_position, tags):
+                            if self._is_taint(annotation, tags):
                                 args.append(reg_arg)
                     for pos in stack_position:
                         # siutable for android_main
@@ -139,6 +137,6 @@ class ArmelResolver(TaintResolver):
                         stack_arg = input_state.memory.load(input_state.regs.sp + offset, size, endness='Iend_LE')
                         for annotation in stack_arg.annotations:
                             if isinstance(annotation, JobjectAnnotation):
-                                if annotation.taint_info['is_taint']:
+                                if self._is_taint(annotation, tags):
                                     args.append(stack_arg)
         return args
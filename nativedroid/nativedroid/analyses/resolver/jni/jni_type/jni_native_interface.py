@@ -1,3 +1,5 @@
+import threading
+
 import angr
 
 from angr.sim_type import *
@@ -6,6 +8,8 @@ from cle.backends.externs import ExternObject
 from nativedroid.analyses.resolver.annotation import *
 from nativedroid.analyses.resolver.jni.java_type import *
 from nativedroid.analyses.resolver.jni.jni_helper import *
+from nativedroid.analyses.taint_tags import API, API_SOURCE, ARGUMENT_ELEMENT, ARGUMENT_FIELD, CLASS_FIELD, \
+    FROM_ARGUMENT, ICC_SOURCE, SENSITIVE_INFO, SINK, SOURCE, STMT, STRING_SOURCE
 from nativedroid.protobuf.jnsaf_grpc_pb2 import *
 
 __author__ = "Xingwei Lin, Fengguo Wei"
@@ -15,238 +19,6 @@ __license__ = "Apache v2.0"
 nativedroid_logger = logging.getLogger('nativedroid.jni_native_interface')
 nativedroid_logger.setLevel(logging.INFO)
 
-jni_native_interface_origin_usage = {
-    'GetVersion': 0,
-    'DefineClass': 0,
-    'FindClass': 0,
-    'FromReflectedMethod': 0,
-    'FromReflectedField': 0,
-    'ToReflectedMethod': 0,
-    'GetSuperClass': 0,
-    'IsAssignableFrom': 0,
-    'ToReflectedField': 0,
-    'Throw': 0,
-    'ThrowNew': 0,
-    'ExceptionOccurred': 0,
-    'ExceptionDescribe': 0,
-    'ExceptionClear': 0,
-    'FatalError': 0,
-    'PushLocalFrame': 0,
-    'PopLocalFrame': 0,
-    'NewGlobalRef': 0,
-    'DeleteGlobalRef': 0,
-    'DeleteLocalRef': 0,
-    'IsSameObject': 0,
-    'NewLocalRef': 0,
-    'EnsureLocalCapacity': 0,
-    'AllocObject': 0,
-    'NewObject': 0,
-    'NewObjectV': 0,
-    'NewObjectA': 0,
-    'GetObjectClass': 0,
-    'IsInstanceOf': 0,
-    'GetMethodID': 0,
-    'CallObjectMethod': 0,
-    'CallObjectMethodV': 0,
-    'CallObjectMethodA': 0,
-    'CallBooleanMethod': 0,
-    'CallBooleanMethodV': 0,
-    'CallBooleanMethodA': 0,
-    'CallByteMethod': 0,
-    'CallByteMethodV': 0,
-    'CallByteMethodA': 0,
-    'CallCharMethod': 0,
-    'CallCharMethodV': 0,
-    'CallCharMethodA': 0,
-    'CallShortMethod': 0,
-    'CallShortMethodV': 0,
-    'CallShortMethodA': 0,
-    'CallIntMethod': 0,
-    'CallIntMethodV': 0,
-    'CallIntMethodA': 0,
-    'CallLongMethod': 0,
-    'CallLongMethodV': 0,
-    'CallLongMethodA': 0,
-    'CallFloatMethod': 0,
-    'CallFloatMethodV': 0,
-    'CallFloatMethodA': 0,
-    'CallDoubleMethod': 0,
-    'CallDoubleMethodV': 0,
-    'CallDoubleMethodA': 0,
-    'CallVoidMethod': 0,
-    'CallVoidMethodV': 0,
-    'CallVoidMethodA': 0,
-    'CallNonvirtualObjectMethod': 0,
-    'CallNonvirtualObjectMethodV': 0,
-    'CallNonvirtualObjectMethodA': 0,
-    'CallNonvirtualBooleanMethod': 0,
-    'CallNonvirtualBooleanMethodV': 0,
-    'CallNonvirtualBooleanMethodA': 0,
-    'CallNonvirtualByteMethod': 0,
-    'CallNonvirtualByteMethodV': 0,
-    'CallNonvirtualByteMethodA': 0,
-    'CallNonvirtualCharMethod': 0,
-    'CallNonvirtualCharMethodV': 0,
-    'CallNonvirtualCharMethodA': 0,
-    'CallNonvirtualShortMethod': 0,
-    'CallNonvirtualShortMethodV': 0,
-    'CallNonvirtualShortMethodA': 0,
-    'CallNonvirtualIntMethod': 0,
-    'CallNonvirtualIntMethodV': 0,
-    'CallNonvirtualIntMethodA': 0,
-    'CallNonvirtualLongMethod': 0,
-    'CallNonvirtualLongMethodV': 0,
-    'CallNonvirtualLongMethodA': 0,
-    'CallNonvirtualFloatMethod': 0,
-    'CallNonvirtualFloatMethodV': 0,
-    'CallNonvirtualFloatMethodA': 0,
-    'CallNonvirtualDoubleMethod': 0,
-    'CallNonvirtualDoubleMethodV': 0,
-    'CallNonvirtualDoubleMethodA': 0,
-    'CallNonvirtualVoidMethod': 0,
-    'CallNonvirtualVoidMethodV': 0,
-    'CallNonvirtualVoidMethodA': 0,
-    'GetFieldID': 0,
-    'GetObjectField': 0,
-    'GetBooleanField': 0,
-    'GetByteField': 0,
-    'GetCharField': 0,
-    'GetShortField': 0,
-    'GetIntField': 0,
-    'GetLongField': 0,
-    'GetFloatField': 0,
-    'GetDoubleField': 0,
-    'SetObjectField': 0,
-    'SetBooleanField': 0,
-    'SetByteField': 0,
-    'SetCharField': 0,
-    'SetShortField': 0,
-    'SetIntField': 0,
-    'SetLongField': 0,
-    'SetFloatField': 0,
-    'SetDoubleField': 0,
-    'GetStaticMethodID': 0,
-    'CallStaticObjectMethod': 0,
-    'CallStaticObjectMethodV': 0,
-    'CallStaticObjectMethodA': 0,
-    'CallStaticBooleanMethod': 0,
-    'CallStaticBooleanMethodV': 0,
-    'CallStaticBooleanMethodA': 0,
-    'CallStaticByteMethod': 0,
-    'CallStaticByteMethodV': 0,
-    'CallStaticByteMethodA': 0,
-    'CallStaticCharMethod': 0,
-    'CallStaticCharMethodV': 0,
-    'CallStaticCharMethodA': 0,
-    'CallStaticShortMethod': 0,
-    'CallStaticShortMethodV': 0,
-    'CallStaticShortMethodA': 0,
-    'CallStaticIntMethod': 0,
-    'CallStaticIntMethodV': 0,
-    'CallStaticIntMethodA': 0,
-    'CallStaticLongMethod': 0,
-    'CallStaticLongMethodV': 0,
-    'CallStaticLongMethodA': 0,
-    'CallStaticFloatMethod': 0,
-    'CallStaticFloatMethodV': 0,
-    'CallStaticFloatMethodA': 0,
-    'CallStaticDoubleMethod': 0,
-    'CallStaticDoubleMethodV': 0,
-    'CallStaticDoubleMethodA': 0,
-    'CallStaticVoidMethod': 0,
-    'CallStaticVoidMethodV': 0,
-    'CallStaticVoidMethodA': 0,
-    'GetStaticFieldID': 0,
-    'GetStaticObjectField': 0,
-    'GetStaticBooleanField': 0,
-    'GetStaticByteField': 0,
-    'GetStaticCharField': 0,
-    'GetStaticShortField': 0,
-    'GetStaticIntField': 0,
-    'GetStaticLongField': 0,
-    'GetStaticFloatField': 0,
-    'GetStaticDoubleField': 0,
-    'SetStaticObjectField': 0,
-    'SetStaticBooleanField': 0,
-    'SetStaticByteField': 0,
-    'SetStaticCharField': 0,
-    'SetStaticShortField': 0,
-    'SetStaticIntField': 0,
-    'SetStaticLongField': 0,
-    'SetStaticFloatField': 0,
-    'SetStaticDoubleField': 0,
-    'NewString': 0,
-    'GetStringLength': 0,
-    'GetStringChars': 0,
-    'ReleaseStringChars': 0,
-    'NewStringUTF': 0,
-    'GetStringUTFLength': 0,
-    'GetStringUTFChars': 0,
-    'ReleaseStringUTFChars': 0,
-    'GetArrayLength': 0,
-    'NewObjectArray': 0,
-    'GetObjectArrayElement': 0,
-    'SetObjectArrayElement': 0,
-    'NewBooleanArray': 0,
-    'NewByteArray': 0,
-    'NewCharArray': 0,
-    'NewShortArray': 0,
-    'NewIntArray': 0,
-    'NewLongArray': 0,
-    'NewFloatArray': 0,
-    'NewDoubleArray': 0,
-    'GetBooleanArrayElements': 0,
-    'GetByteArrayElements': 0,
-    'GetCharArrayElements': 0,
-    'GetShortArrayElements': 0,
-    'GetIntArrayElements': 0,
-    'GetLongArrayElements': 0,
-    'GetFloatArrayElements': 0,
-    'GetDoubleArrayElements': 0,
-    'ReleaseBooleanArrayElements': 0,
-    'ReleaseByteArrayElements': 0,
-    'ReleaseCharArrayElements': 0,
-    'ReleaseShortArrayElements': 0,
-    'ReleaseIntArrayElements': 0,
-    'ReleaseLongArrayElements': 0,
-    'ReleaseFloatArrayElements': 0,
-    'ReleaseDoubleArrayElements': 0,
-    'GetBooleanArrayRegion': 0,
-    'GetByteArrayRegion': 0,
-    'GetCharArrayRegion': 0,
-    'GetShortArrayRegion': 0,
-    'GetIntArrayRegion': 0,
-    'GetLongArrayRegion': 0,
-    'GetFloatArrayRegion': 0,
-    'GetDoubleArrayRegion': 0,
-    'SetBooleanArrayRegion': 0,
-    'SetByteArrayRegion': 0,
-    'SetCharArrayRegion': 0,
-    'SetShortArrayRegion': 0,
-    'SetIntArrayRegion': 0,
-    'SetLongArrayRegion': 0,
-    'SetFloatArrayRegion': 0,
-    'SetDoubleArrayRegion': 0,
-    'RegisterNatives': 0,
-    'UnregisterNatives': 0,
-    'MonitorEnter': 0,
-    'MonitorExit': 0,
-    'GetJavaVM': 0,
-    'GetStringRegion': 0,
-    'GetStringUTFRegion': 0,
-    'GetPrimitiveArrayCritical': 0,
-    'ReleasePrimitiveArrayCritical': 0,
-    'GetStringCritical': 0,
-    'ReleaseStringCritical': 0,
-    'NewWeakGlobalRef': 0,
-    'DeleteWeakGlobalRef': 0,
-    'ExceptionCheck': 0,
-    'NewDirectByteBuffer': 0,
-    'GetDirectBufferAddress': 0,
-    'GetDirectBufferCapacity': 0,
-    'GetObjectRefType': 0
-}
-
 
 def icc_handle(analysis_center, class_name, method_name, return_annotation, simproc):
     """
@@ -273,15 +45,12 @@ def icc_handle(analysis_center, class_name, method_name, return_annotation, simp
                     extra_key = annotation.value
             for annotation in simproc.arg(4).annotations:
                 if isinstance(annotation, JobjectAnnotation):
-                    extra_value = copy.deepcopy(annotation)
+                    extra_value = annotation.copy()
             return_annotation.icc_info['extra'] = {extra_key: extra_value}
         elif method_name == 'getStringExtra':
             for annotation in simproc.arg(3).annotations:
                 if isinstance(annotation, JstringAnnotation):
-                    return_annotation.taint_info['is_taint'] = True
-                    return_annotation.taint_info['taint_type'] = ['_SOURCE_', '_API_']
-                    return_annotation.taint_info['taint_info'] = ['SENSITIVE_INFO']
-                    return_annotation.taint_info['source_kind'] = 'icc_source'
+                    return_annotation.taint_info.set_taint(SOURCE, API, SENSITIVE_INFO, source_kind_bit=ICC_SOURCE)
                     return_annotation.icc_info['is_icc'] = True
                     return_annotation.icc_info['extra'] = {annotation.value: None}
     elif class_name == 'android/content/Context':
@@ -313,42 +82,23 @@ def icc_handle(analysis_center, class_name, method_name, return_annotation, simp
 
 
 class NativeDroidSimProcedure(angr.SimProcedure):
+    # Argument names of procedures generated from JNI_FUNCTIONS, others take them from the signature of run.
+    ARGUMENTS = None
+
     def __init__(
             self, analysis_center, project=None, cc=None, symbolic_return=None,
             returns=None, is_syscall=None, is_stub=False,
             num_args=None, display_name=None, library_name=None,
             is_function=None, **kwargs
     ):
+        if num_args is None and self.ARGUMENTS is not None:
+            num_args = len(self.ARGUMENTS)
         super(NativeDroidSimProcedure, self).__init__(project, cc, symbolic_return, returns,
                                                       is_syscall, is_stub, num_args, display_name,
                                                       library_name, is_function, **kwargs)
         self._analysis_center = analysis_center
 
 
-class GetVersion(NativeDroidSimProcedure):
-    def run(self, env):
-        nativedroid_logger.info('JNINativeInterface SimProcedure: %s', self)
-
-        jint = JInt(self.project)
-        return_value = claripy.BVV(jint.ptr, self.project.arch.bits)
-        return return_value
-
-    def __repr__(self):
-        return 'GetVersion'
-
-
-class DefineClass(NativeDroidSimProcedure):
-    def run(self, env, name, loader, buf, bufLen):
-        nativedroid_logger.info('JNINativeInterface SimProcedure: %s', self)
-
-        jclass = JClass(self.project)
-        return_value = claripy.BVV(jclass.ptr, self.project.arch.bits)
-        return return_value
-
-    def __repr__(self):
-        return 'DefineClass'
-
-
 class FindClass(NativeDroidSimProcedure):
     def run(self, env, name):
         nativedroid_logger.info('JNINativeInterface SimProcedure: %s', self)
@@ -368,243 +118,6 @@ class FindClass(NativeDroidSimProcedure):
         return 'FindClass'
 
 
-class FromReflectedMethod(NativeDroidSimProcedure):
-    def run(self, env, method):
-        nativedroid_logger.info('JNINativeInterface SimProcedure: %s', self)
-
-        jmethod_id = JMethodID(self.project)
-        return_value = claripy.BVV(jmethod_id.ptr, self.project.arch.bits)
-
-        return return_value
-
-    def __repr__(self):
-        return 'FromReflectedMethod'
-
-
-class FromReflectedField(NativeDroidSimProcedure):
-    def run(self, env, field):
-        nativedroid_logger.info('JNINativeInterface SimProcedure: %s', self)
-
-        jfield_id = JFieldID(self.project)
-        return_value = claripy.BVV(jfield_id.ptr, self.project.arch.bits)
-
-        return return_value
-
-    def __repr__(self):
-        return 'FromReflectedField'
-
-
-class ToReflectedMethod(NativeDroidSimProcedure):
-    def run(self, env, cls, method_id, is_static):
-        nativedroid_logger.info('JNINativeInterface SimProcedure: %s', self)
-
-        jobject = JObject(self.project)
-        return_value = claripy.BVV(jobject.ptr, self.project.arch.bits)
-        return return_value
-
-    def __repr__(self):
-        return 'ToReflectedMethod'
-
-
-class GetSuperClass(NativeDroidSimProcedure):
-    def run(self, env, clazz):
-        nativedroid_logger.info('JNINativeInterface SimProcedure: %s', self)
-
-        jclass = JClass(self.project)
-        return_value = claripy.BVV(jclass.ptr, self.project.arch.bits)
-
-        return return_value
-
-    def __repr__(self):
-        return 'GetSuperClass'
-
-
-class IsAssignableFrom(NativeDroidSimProcedure):
-    def run(self, env, clazz1, clazz2):
-        nativedroid_logger.info('JNINativeInterface SimProcedure: %s', self)
-
-        jboolean = JBoolean(self.project)
-        return_value = claripy.BVV(jboolean.ptr, self.project.arch.bits)
-
-        return return_value
-
-    def __repr__(self):
-        return 'IsAssignableFrom'
-
-
-class ToReflectedField(NativeDroidSimProcedure):
-    def run(self, env, cls, fieldID, isStatic):
-        nativedroid_logger.info('JNINativeInterface SimProcedure: %s', self)
-
-        jobject = JObject(self.project)
-        return_value = claripy.BVV(jobject.ptr, self.project.arch.bits)
-
-        return return_value
-
-    def __repr__(self):
-        return 'ToReflectedField'
-
-
-class Throw(NativeDroidSimProcedure):
-    def run(self, env, obj):
-        nativedroid_logger.info('JNINativeInterface SimProcedure: %s', self)
-
-        jint = JInt(self.project)
-        return_value = claripy.BVV(jint.ptr, self.project.arch.bits)
-        return return_value
-
-    def __repr__(self):
-        return 'Throw'
-
-
-class ThrowNew(NativeDroidSimProcedure):
-    def run(self, env, clazz, message):
-        nativedroid_logger.info('JNINativeInterface SimProcedure: %s', self)
-
-        jint = JInt(self.project)
-        return_value = claripy.BVV(jint.ptr, self.project.arch.bits)
-        return return_value
-
-    def __repr__(self):
-        return 'ThrowNew'
-
-
-class ExceptionOccurred(NativeDroidSimProcedure):
-    def run(self, env):
-        nativedroid_logger.info('JNINativeInterface SimProcedure: %s', self)
-
-        jthrowable = JThrowlable(self.project)
-        return_value = claripy.BVV(jthrowable.ptr, self.project.arch.bits)
-        return return_value
-
-    def __repr__(self):
-        return 'ExceptionOccurred'
-
-
-class ExceptionDescribe(NativeDroidSimProcedure):
-    def run(self, env):
-        nativedroid_logger.info('JNINativeInterface SimProcedure: %s', self)
-
-    def __repr__(self):
-        return 'ExceptionDescribe'
-
-
-class ExceptionClear(NativeDroidSimProcedure):
-    def run(self, env):
-        nativedroid_logger.info('JNINativeInterface SimProcedure: %s', self)
-
-    def __repr__(self):
-        return 'ExceptionClear'
-
-
-class FatalError(NativeDroidSimProcedure):
-    def run(self, env, msg):
-        nativedroid_logger.info('JNINativeInterface SimProcedure: %s', self)
-
-    def __repr__(self):
-        return 'FatalError'
-
-
-class PushLocalFrame(NativeDroidSimProcedure):
-    def run(self, env, capacity):
-        nativedroid_logger.info('JNINativeInterface SimProcedure: %s', self)
-
-        jint = JInt(self.project)
-        return_value = claripy.BVV(jint.ptr, self.project.arch.bits)
-        return return_value
-
-    def __repr__(self):
-        return 'PushLocalFrame'
-
-
-class PopLocalFrame(NativeDroidSimProcedure):
-    def run(self, env, result):
-        nativedroid_logger.info('JNINativeInterface SimProcedure: %s', self)
-
-        jobject = JObject(self.project)
-        return_value = claripy.BVV(jobject.ptr, self.project.arch.bits)
-        return return_value
-
-    def __repr__(self):
-        return 'PopLocalFrame'
-
-
-class NewGlobalRef(NativeDroidSimProcedure):
-    def run(self, env, obj):
-        nativedroid_logger.info('JNINativeInterface SimProcedure: %s', self)
-
-        jobject = JObject(self.project)
-        return_value = claripy.BVV(jobject.ptr, self.project.arch.bits)
-        return return_value
-
-    def __repr__(self):
-        return 'NewGlobalRef'
-
-
-class DeleteGlobalRef(NativeDroidSimProcedure):
-    def run(self, env, globalRef):
-        nativedroid_logger.info('JNINativeInterface SimProcedure: %s', self)
-
-    def __repr__(self):
-        return 'DeleteGlobalRef'
-
-
-class DeleteLocalRef(NativeDroidSimProcedure):
-    def run(self, env, localRef):
-        nativedroid_logger.info('JNINativeInterface SimProcedure: %s', self)
-
-    def __repr__(self):
-        return 'DeleteLocalRef'
-
-
-class IsSameObject(NativeDroidSimProcedure):
-    def run(self, env, ref1, ref2):
-        nativedroid_logger.info('JNINativeInterface SimProcedure: %s', self)
-
-        jboolean = JBoolean(self.project)
-        return_value = claripy.BVV(jboolean.ptr, self.project.arch.bits)
-        return return_value
-
-    def __repr__(self):
-        return 'IsSameObject'
-
-
-class NewLocalRef(NativeDroidSimProcedure):
-    def run(self, env, ref):
-        nativedroid_logger.info('JNINativeInterface SimProcedure: %s', self)
-
-        jobject = JObject(self.project)
-        return_value = claripy.BVV(jobject.ptr, self.project.arch.bits)
-        return return_value
-
-    def __repr__(self):
-        return 'NewLocalRef'
-
-
-class EnsureLocalCapacity(NativeDroidSimProcedure):
-    def run(self, env, capacity):
-        nativedroid_logger.info('JNINativeInterface SimProcedure: %s', self)
-
-        jint = JInt(self.project)
-        return_value = claripy.BVV(jint.ptr, self.project.arch.bits)
-        return return_value
-
-    def __repr__(self):
-        return 'EnsureLocalCapacity'
-
-
-class AllocObject(NativeDroidSimProcedure):
-    def run(self, env, clazz):
-        nativedroid_logger.info('JNINativeInterface SimProcedure: %s', self)
-
-        jobject = JObject(self.project)
-        return_value = claripy.BVV(jobject.ptr, self.project.arch.bits)
-        return return_value
-
-    def __repr__(self):
-        return 'AllocObject'
-
-
 class NewObject(NativeDroidSimProcedure):
     def run(self, env, clazz, methodID):
         nativedroid_logger.info('JNINativeInterface SimProcedure: %s', self)
@@ -623,16 +136,6 @@ class NewObject(NativeDroidSimProcedure):
         return 'NewObject'
 
 
-class NewObjectV(NewObject):
-    def __repr__(self):
-        return 'NewObjectV'
-
-
-class NewObjectA(NewObject):
-    def __repr__(self):
-        return 'NewObjectA'
-
-
 class GetObjectClass(NativeDroidSimProcedure):
     def run(self, env, obj):
         nativedroid_logger.info('JNINativeInterface SimProcedure: %s', self)
@@ -650,19 +153,6 @@ class GetObjectClass(NativeDroidSimProcedure):
         return 'GetObjectClass'
 
 
-class IsInstanceOf(NativeDroidSimProcedure):
-    def run(self, env, obj, clazz):
-        nativedroid_logger.info('JNINativeInterface SimProcedure: %s', self)
-
-        jboolean = JInt(self.project)
-        return_value = claripy.BVV(jboolean.ptr, self.project.arch.bits)
-
-        return return_value
-
-    def __repr__(self):
-        return 'IsInstanceOf'
-
-
 class GetMethodID(NativeDroidSimProcedure):
     def run(self, env, clazz, name, sig):
         nativedroid_logger.info('JNINativeInterface SimProcedure: %s', self)
@@ -684,6 +174,11 @@ class GetMethodID(NativeDroidSimProcedure):
         nativedroid_logger.info('METHOD: %s', name_str)
         nativedroid_logger.info('SIGN: %s', signature_str)
 
+        # Start fetching the summary now, so JNSaf generates it while we step to the Call*Method.
+        jnsaf_client = self._analysis_center.get_jnsaf_client()
+        if jnsaf_client and class_name:
+            jnsaf_client.prefetch_summary(get_method_full_signature(class_name, name_str, signature_str), gen=True)
+
         return_value = return_value.annotate(
             JmethodIDAnnotation(class_name=class_name, method_name=name_str, method_signature=signature_str))
 
@@ -697,17 +192,23 @@ class CallObjectMethod(NativeDroidSimProcedure):
 
     @staticmethod
     def get_method_taint_attribute(ssm, method_full_signature):
+        """
+        Get the taint attribute of a java method.
+
+        :param SourceAndSinkManager ssm: Source and sink manager
+        :param str method_full_signature: Method signature
+        :return: [role bit, sink positions, kind bit, tag bits] or None, the sink positions are None for sources
+        :rtype: list
+        """
         if method_full_signature:
-            source_tags = ssm.get_source_tags(method_full_signature)
-            source_kind = ssm.get_source_kind(method_full_signature)
+            source_tags = ssm.get_source_tag_bits(method_full_signature)
             if source_tags:
-                return ['_SOURCE_', '|'.join(source_tags), source_kind]
-            tags = ssm.get_sink_tags(method_full_signature)
+                return [SOURCE, None, ssm.get_source_kind_bit(method_full_signature), source_tags]
+            tags = ssm.get_sink_tag_bits(method_full_signature)
             if tags:
                 poss = tags[0]
                 info = 'ALL' if not poss else '|'.join(map(str, poss))
-                sink_kind = ssm.get_sink_kind(method_full_signature)
-                return ['_SINK_', info, sink_kind]
+                return [SINK, info, ssm.get_sink_kind_bit(method_full_signature), tags[1]]
         return None
 
     def get_sink_args(self, method_name, num_args, idx, tags):
@@ -763,16 +264,13 @@ class CallObjectMethod(NativeDroidSimProcedure):
                 ssm = self._analysis_center.get_source_sink_manager()
                 heap_summary = None
                 if jnsaf_client:
-                    request = GetSummaryRequest(
-                        apk_digest=jnsaf_client.apk_digest,
-                        component_name=jnsaf_client.component_name,
-                        signature=method_full_signature, gen=True,
-                        depth=jnsaf_client.depth)
-                    response = jnsaf_client.GetSummary(request)
-                    if response.taint_result:
-                        ssm.parse_lines(response.taint_result)
-                    if response.heap_summary:
-                        heap_summary = response.heap_summary
+                    response = jnsaf_client.get_summary(method_full_signature,
+                                                        self._analysis_center.get_analysis_budget())
+                    if response is not None:
+                        if response.taint_result:
+                            ssm.parse_lines(response.taint_result)
+                        if response.heap_summary:
+                            heap_summary = response.heap_summary
                 jni_return_type = get_jni_return_type(method_signature)
                 java_return_type = get_java_return_type(method_signature)
                 typ = get_type(self.project, java_return_type)
@@ -781,34 +279,28 @@ class CallObjectMethod(NativeDroidSimProcedure):
                 return_annotation = construct_annotation(jni_return_type, 'from_reflection_call')
                 method_taint_attribute = CallObjectMethod.get_method_taint_attribute(ssm, method_full_signature)
                 if method_taint_attribute:
-                    if method_taint_attribute[0] == '_SOURCE_':
-                        return_annotation.taint_info['is_taint'] = True
-                        return_annotation.taint_info['taint_type'] = [method_taint_attribute[0], '_API_']
-                        return_annotation.taint_info['taint_info'] = [method_taint_attribute[1]]
-                        return_annotation.taint_info['source_kind'] = method_taint_attribute[2]
-                    elif method_taint_attribute[0] == '_SINK_':
-                        process_args = self.get_sink_args(method_name, num_args, idx, method_taint_attribute[1])
+                    role, positions, kind, tags = method_taint_attribute
+                    if role == SOURCE:
+                        return_annotation.taint_info.set_taint(SOURCE, API, tags, source_kind_bit=kind)
+                    elif role == SINK:
+                        process_args = self.get_sink_args(method_name, num_args, idx, positions)
                         for parg in process_args:
                             for anno in parg.annotations:
                                 if isinstance(anno, JobjectAnnotation):
-                                    if anno.taint_info['is_taint']:
-                                        anno.taint_info['sink_kind'] = method_taint_attribute[2]
-                                        if '_SOURCE_' in anno.taint_info['taint_type'][0]:
-                                            if '_API_' in anno.taint_info['taint_type'][1]:
-                                                anno.taint_info['taint_type'] = ['_SINK_', '_SOURCE_']
-                                                anno.taint_info['taint_info'] = \
-                                                    [method_taint_attribute[1]]
-                                            elif '_ARGUMENT_' in anno.taint_info['taint_type'][1]:
-                                                anno.taint_info['taint_type'] = \
-                                                    ['_SINK_', anno.taint_info['taint_type'][1]]
-                                                anno.taint_info['taint_info'] = \
-                                                    [method_taint_attribute[1]]
+                                    taint_info = anno.taint_info
+                                    if taint_info['is_taint']:
+                                        taint_info.sink_kind_bit = kind
+                                        if taint_info.role == SOURCE:
+                                            if taint_info.origin == API:
+                                                taint_info.set_taint(SINK, SOURCE, tags)
+                                            elif taint_info.origin & FROM_ARGUMENT:
+                                                taint_info.set_taint(SINK, taint_info.origin, tags)
                 obj = None if idx == 1 else self.arg(1)
                 if obj and isinstance(obj, SimActionObject):
                     for anno in obj.annotations:
                         if isinstance(anno, JobjectAnnotation):
                             if anno.taint_info['is_taint']:
-                                if '_ARGUMENT_' in anno.taint_info['taint_type'][1] and heap_summary:
+                                if anno.taint_info.origin & FROM_ARGUMENT and heap_summary:
                                     for rule in heap_summary.rules:
                                         if rule.binary_rule and rule.binary_rule.rule_lhs.ret:
                                             if rule.binary_rule.rule_rhs.this:
@@ -822,22 +314,17 @@ class CallObjectMethod(NativeDroidSimProcedure):
                                                         field_anno.field_info['field_name'] = \
                                                             access.field_access.field_name
                                                         field_anno.field_info['base_annotation'] = anno
-                                                        field_anno.taint_info['is_taint'] = True
-                                                        field_anno.taint_info['taint_type'] = \
-                                                            [anno.taint_info['taint_type'][0], '_ARGUMENT_FIELD_']
-                                                        field_anno.taint_info['taint_info'] = \
-                                                            anno.taint_info['taint_info']
-                                                        field_anno.taint_info['source_kind'] = \
-                                                            anno.taint_info['source_kind']
-                                                        field_anno.taint_info['sink_kind'] = \
-                                                            anno.taint_info['sink_kind']
+                                                        field_anno.taint_info.set_taint(
+                                                            anno.taint_info.role, ARGUMENT_FIELD,
+                                                            anno.taint_info.tag_bits,
+                                                            source_kind_bit=anno.taint_info.source_kind_bit,
+                                                            sink_kind_bit=anno.taint_info.sink_kind_bit)
                                                         return_annotation = field_anno
                             else:
                                 if anno.fields_info:
                                     for field_info in anno.fields_info:
                                         if field_info.is_tainted:
-                                            return_annotation.taint_info = copy.deepcopy(
-                                                field_info.taint_info)
+                                            return_annotation.taint_info = copy_taint_info(field_info.taint_info)
                 return_annotation = icc_handle(self._analysis_center, class_name, method_name, return_annotation, self)
                 return_value = return_value.append_annotation(return_annotation)
                 return return_value
@@ -854,339 +341,44 @@ class CallTypeMethod(CallObjectMethod):
         return 'CallTypeMethod'
 
 
-class CallObjectMethodV(CallTypeMethod):
-    def __repr__(self):
-        return 'CallObjectMethodV'
-
-
-class CallObjectMethodA(CallTypeMethod):
-    def __repr__(self):
-        return 'CallObjectMethodA'
-
-
-class CallBooleanMethod(CallTypeMethod):
-    def __repr__(self):
-        return 'CallBooleanMethod'
-
-
-class CallBooleanMethodV(CallTypeMethod):
-    def __repr__(self):
-        return 'CallBooleanMethodV'
-
-
-class CallBooleanMethodA(CallTypeMethod):
-    def __repr__(self):
-        return 'CallBooleanMethodA'
-
-
-class CallByteMethod(CallTypeMethod):
-    def __repr__(self):
-        return 'CallByteMethod'
-
-
-class CallByteMethodV(CallTypeMethod):
+class CallNonvirtualTypeMethod(CallTypeMethod):
     def __repr__(self):
-        return 'CallByteMethodV'
-
+        return 'CallNonvirtual<Type>Method'
 
-class CallByteMethodA(CallTypeMethod):
-    def __repr__(self):
-        return 'CallByteMethodA'
 
+class GetFieldID(NativeDroidSimProcedure):
+    def run(self, env, clazz, name, sig):
+        nativedroid_logger.info('JNINativeInterface SimProcedure: %s', self)
 
-class CallCharMethod(CallTypeMethod):
-    def __repr__(self):
-        return 'CallCharMethod'
+        class_name = None
+        for annotation in clazz.annotations:
+            if isinstance(annotation, JclassAnnotation):
+                class_name = annotation.class_type
 
+        strlen_simproc = angr.SIM_PROCEDURES['libc']['strlen']
+        name_strlen = self.inline_call(strlen_simproc, name)
+        name_str = self.state.solver.eval(self.state.memory.load(name, name_strlen.ret_expr), cast_to=str)
+        signature_strlen = self.inline_call(strlen_simproc, sig)
+        sig_str = self.state.solver.eval(self.state.memory.load(sig, signature_strlen.ret_expr),
+                                         cast_to=str)
+        nativedroid_logger.info('CLASS: %s', class_name)
+        nativedroid_logger.info('FIELD: %s', name_str)
+        nativedroid_logger.info('SIGN: %s', sig_str)
 
-class CallCharMethodV(CallTypeMethod):
-    def __repr__(self):
-        return 'CallCharMethodV'
+        jfield_id = JFieldID(self.project)
+        return_value = claripy.BVV(jfield_id.ptr, self.project.arch.bits)
+        return_value = return_value.annotate(
+            JfieldIDAnnotation(class_name=class_name, field_name=name_str, field_signature=sig_str))
 
+        return return_value
 
-class CallCharMethodA(CallTypeMethod):
     def __repr__(self):
-        return 'CallCharMethodA'
+        return 'GetFieldID'
 
 
-class CallShortMethod(CallTypeMethod):
-    def __repr__(self):
-        return 'CallShortMethod'
-
-
-class CallShortMethodV(CallTypeMethod):
-    def __repr__(self):
-        return 'CallShortMethodV'
-
-
-class CallShortMethodA(CallTypeMethod):
-    def __repr__(self):
-        return 'CallShortMethodA'
-
-
-class CallIntMethod(CallTypeMethod):
-    def __repr__(self):
-        return 'CallIntMethod'
-
-
-class CallIntMethodV(CallTypeMethod):
-    def __repr__(self):
-        return 'CallIntMethodV'
-
-
-class CallIntMethodA(CallTypeMethod):
-    def __repr__(self):
-        return 'CallIntMethodA'
-
-
-class CallLongMethod(CallTypeMethod):
-    def __repr__(self):
-        return 'CallLongMethod'
-
-
-class CallLongMethodV(CallTypeMethod):
-    def __repr__(self):
-        return 'CallLongMethodV'
-
-
-class CallLongMethodA(CallTypeMethod):
-    def __repr__(self):
-        return 'CallLongMethodA'
-
-
-class CallFloatMethod(CallTypeMethod):
-    def __repr__(self):
-        return 'CallFloatMethod'
-
-
-class CallFloatMethodV(CallTypeMethod):
-    def __repr__(self):
-        return 'CallFloatMethodV'
-
-
-class CallFloatMethodA(CallTypeMethod):
-    def __repr__(self):
-        return 'CallFloatMethodA'
-
-
-class CallDoubleMethod(CallTypeMethod):
-    def __repr__(self):
-        return 'CallDoubleMethod'
-
-
-class CallDoubleMethodV(CallTypeMethod):
-    def __repr__(self):
-        return 'CallDoubleMethodV'
-
-
-class CallDoubleMethodA(CallTypeMethod):
-    def __repr__(self):
-        return 'CallDoubleMethodA'
-
-
-class CallVoidMethod(CallTypeMethod):
-    def __repr__(self):
-        return 'CallVoidMethod'
-
-
-class CallVoidMethodV(CallVoidMethod):
-    def __repr__(self):
-        return 'CallVoidMethodV'
-
-
-class CallVoidMethodA(CallVoidMethod):
-    def __repr__(self):
-        return 'CallVoidMethodA'
-
-
-class CallNonvirtualTypeMethod(CallTypeMethod):
-    def __repr__(self):
-        return 'CallNonvirtual<Type>Method'
-
-
-class CallNonvirtualObjectMethod(CallNonvirtualTypeMethod):
-    def __repr__(self):
-        return 'CallNonvirtualObjectMethod'
-
-
-class CallNonvirtualObjectMethodV(CallNonvirtualTypeMethod):
-    def __repr__(self):
-        return 'CallNonvirtualObjectMethodV'
-
-
-class CallNonvirtualObjectMethodA(CallNonvirtualTypeMethod):
-    def __repr__(self):
-        return 'CallNonvirtualObjectMethodA'
-
-
-class CallNonvirtualBooleanMethod(CallNonvirtualTypeMethod):
-    def __repr__(self):
-        return 'CallNonvirtualBooleanMethod'
-
-
-class CallNonvirtualBooleanMethodV(CallNonvirtualTypeMethod):
-    def __repr__(self):
-        return 'CallNonvirtualBooleanMethodV'
-
-
-class CallNonvirtualBooleanMethodA(CallNonvirtualTypeMethod):
-    def __repr__(self):
-        return 'CallNonvirtualBooleanMethodA'
-
-
-class CallNonvirtualByteMethod(CallNonvirtualTypeMethod):
-    def __repr__(self):
-        return 'CallNonvirtualByteMethod'
-
-
-class CallNonvirtualByteMethodV(CallNonvirtualTypeMethod):
-    def __repr__(self):
-        return 'CallNonvirtualByteMethodV'
-
-
-class CallNonvirtualByteMethodA(CallNonvirtualTypeMethod):
-    def __repr__(self):
-        return 'CallNonvirtualByteMethodA'
-
-
-class CallNonvirtualCharMethod(CallNonvirtualTypeMethod):
-    def __repr__(self):
-        return 'CallNonvirtualCharMethod'
-
-
-class CallNonvirtualCharMethodV(CallNonvirtualTypeMethod):
-    def __repr__(self):
-        return 'CallNonvirtualCharMethodV'
-
-
-class CallNonvirtualCharMethodA(CallNonvirtualTypeMethod):
-    def __repr__(self):
-        return 'CallNonvirtualCharMethodA'
-
-
-class CallNonvirtualShortMethod(CallNonvirtualTypeMethod):
-    def __repr__(self):
-        return 'CallNonvirtualShortMethod'
-
-
-class CallNonvirtualShortMethodV(CallNonvirtualTypeMethod):
-    def __repr__(self):
-        return 'CallNonvirtualShortMethodV'
-
-
-class CallNonvirtualShortMethodA(CallNonvirtualTypeMethod):
-    def __repr__(self):
-        return 'CallNonvirtualShortMethodA'
-
-
-class CallNonvirtualIntMethod(CallNonvirtualTypeMethod):
-    def __repr__(self):
-        return 'CallNonvirtualIntMethod'
-
-
-class CallNonvirtualIntMethodV(CallNonvirtualTypeMethod):
-    def __repr__(self):
-        return 'CallNonvirtualIntMethodV'
-
-
-class CallNonvirtualIntMethodA(CallNonvirtualTypeMethod):
-    def __repr__(self):
-        return 'CallNonvirtualIntMethodA'
-
-
-class CallNonvirtualLongMethod(CallNonvirtualTypeMethod):
-    def __repr__(self):
-        return 'CallNonvirtualLongMethod'
-
-
-class CallNonvirtualLongMethodV(CallNonvirtualTypeMethod):
-    def __repr__(self):
-        return 'CallNonvirtualLongMethodV'
-
-
-class CallNonvirtualLongMethodA(CallNonvirtualTypeMethod):
-    def __repr__(self):
-        return 'CallNonvirtualLongMethodA'
-
-
-class CallNonvirtualFloatMethod(CallNonvirtualTypeMethod):
-    def __repr__(self):
-        return 'CallNonvirtualFloatMethod'
-
-
-class CallNonvirtualFloatMethodV(CallNonvirtualTypeMethod):
-    def __repr__(self):
-        return 'CallNonvirtualFloatMethodV'
-
-
-class CallNonvirtualFloatMethodA(CallNonvirtualTypeMethod):
-    def __repr__(self):
-        return 'CallNonvirtualFloatMethodA'
-
-
-class CallNonvirtualDoubleMethod(CallNonvirtualTypeMethod):
-    def __repr__(self):
-        return 'CallNonvirtualDoubleMethod'
-
-
-class CallNonvirtualDoubleMethodV(CallNonvirtualTypeMethod):
-    def __repr__(self):
-        return 'CallNonvirtualDoubleMethodV'
-
-
-class CallNonvirtualDoubleMethodA(CallNonvirtualTypeMethod):
-    def __repr__(self):
-        return 'CallNonvirtualDoubleMethodA'
-
-
-class CallNonvirtualVoidMethod(CallTypeMethod):
-    def __repr__(self):
-        return 'CallNonvirtualVoidMethod'
-
-
-class CallNonvirtualVoidMethodV(CallNonvirtualVoidMethod):
-    def __repr__(self):
-        return 'CallNonvirtualVoidMethodV'
-
-
-class CallNonvirtualVoidMethodA(CallNonvirtualVoidMethod):
-    def __repr__(self):
-        return 'CallNonvirtualVoidMethodA'
-
-
-class GetFieldID(NativeDroidSimProcedure):
-    def run(self, env, clazz, name, sig):
-        nativedroid_logger.info('JNINativeInterface SimProcedure: %s', self)
-
-        class_name = None
-        for annotation in clazz.annotations:
-            if isinstance(annotation, JclassAnnotation):
-                class_name = annotation.class_type
-
-        strlen_simproc = angr.SIM_PROCEDURES['libc']['strlen']
-        name_strlen = self.inline_call(strlen_simproc, name)
-        name_str = self.state.solver.eval(self.state.memory.load(name, name_strlen.ret_expr), cast_to=str)
-        signature_strlen = self.inline_call(strlen_simproc, sig)
-        sig_str = self.state.solver.eval(self.state.memory.load(sig, signature_strlen.ret_expr),
-                                         cast_to=str)
-        nativedroid_logger.info('CLASS: %s', class_name)
-        nativedroid_logger.info('FIELD: %s', name_str)
-        nativedroid_logger.info('SIGN: %s', sig_str)
-
-        jfield_id = JFieldID(self.project)
-        return_value = claripy.BVV(jfield_id.ptr, self.project.arch.bits)
-        return_value = return_value.annotate(
-            JfieldIDAnnotation(class_name=class_name, field_name=name_str, field_signature=sig_str))
-
-        return return_value
-
-    def __repr__(self):
-        return 'GetFieldID'
-
-
-class GetObjectField(NativeDroidSimProcedure):
-    def run(self, env, obj, fieldID):
-        nativedroid_logger.info('JNINativeInterface SimProcedure: %s', self)
+class GetObjectField(NativeDroidSimProcedure):
+    def run(self, env, obj, fieldID):
+        nativedroid_logger.info('JNINativeInterface SimProcedure: %s', self)
 
         for annotation in fieldID.annotations:
             if isinstance(annotation, JfieldIDAnnotation):
@@ -1197,21 +389,19 @@ class GetObjectField(NativeDroidSimProcedure):
                 typ = get_type(self.project, java_return_type)
                 typ_size = get_type_size(self.project, java_return_type)
                 return_value = claripy.BVV(typ.ptr, typ_size)
+                heap_abstraction = self._analysis_center.get_heap_abstraction()
                 for anno in obj.annotations:
                     if isinstance(anno, JobjectAnnotation):
-                        field_exist = False
-                        field_index = 0
-                        for index, field_info in enumerate(anno.fields_info):
-                            if field_info.field_info['field_name'] == field_name and \
-                                    field_info.obj_type == jni_return_type:
-                                field_exist = True
-                                field_index = index
-                        if field_exist:
-                            return_annotation = copy.deepcopy(anno.fields_info[field_index])
+                        field = heap_abstraction.find_field(anno, field_name, jni_return_type)
+                        if field is not None:
+                            return_annotation = field.copy()
                             return_annotation.heap = anno.heap + '.' + field_name if anno.heap else None
                             return_annotation.field_info = {'is_field': True, 'field_name': field_name,
                                                             'base_annotation': anno}
                             return_value = return_value.append_annotation(return_annotation)
+                        elif heap_abstraction.is_summary(anno):
+                            # Fields beyond the depth limit are summarized by the object itself.
+                            return_value = return_value.append_annotation(anno)
                         else:
                             jni_return_type = get_jni_return_type(field_signature)
                             return_annotation = construct_annotation(jni_return_type, anno.source)
@@ -1219,1068 +409,229 @@ class GetObjectField(NativeDroidSimProcedure):
                             return_annotation.field_info = {'is_field': True, 'field_name': field_name,
                                                             'base_annotation': anno}
                             if anno.source.startswith('arg'):
-                                return_annotation.taint_info['is_taint'] = True
-                                return_annotation.taint_info['taint_type'] = ['_SOURCE_', '_ARGUMENT_FIELD_']
-                                return_annotation.taint_info['taint_info'] = ['SENSITIVE_INFO']
-                                return_annotation.taint_info['source_kind'] = anno.taint_info['source_kind']
-                                return_annotation.taint_info['sink_kind'] = anno.taint_info['sink_kind']
+                                return_annotation.taint_info.set_taint(
+                                    SOURCE, ARGUMENT_FIELD, SENSITIVE_INFO,
+                                    source_kind_bit=anno.taint_info.source_kind_bit,
+                                    sink_kind_bit=anno.taint_info.sink_kind_bit)
                             return_value = return_value.append_annotation(return_annotation)
                 return return_value
         jobject = JObject(self.project)
-        return_value = claripy.BVV(jobject.ptr, self.project.arch.bits)
-        return return_value
-
-    def __repr__(self):
-        return 'GetObjectField'
-
-
-class GetBooleanField(NativeDroidSimProcedure):
-    def run(self, env, obj, fieldID):
-        nativedroid_logger.info('JNINativeInterface SimProcedure: %s', self)
-
-        jboolean = JBoolean(self.project)
-        return_value = claripy.BVV(jboolean.ptr, self.project.arch.bits)
-        return return_value
-
-    def __repr__(self):
-        return 'GetBooleanField'
-
-
-class GetByteField(NativeDroidSimProcedure):
-    def run(self, env, obj, fieldID):
-        nativedroid_logger.info('JNINativeInterface SimProcedure: %s', self)
-
-        jbyte = JInt(self.project)
-        return_value = claripy.BVV(jbyte.ptr, self.project.arch.bits)
-        return return_value
-
-    def __repr__(self):
-        return 'GetByteField'
-
-
-class GetCharField(NativeDroidSimProcedure):
-    def run(self, env, obj, fieldID):
-        nativedroid_logger.info('JNINativeInterface SimProcedure: %s', self)
-
-        jchar = JInt(self.project)
-        return_value = claripy.BVV(jchar.ptr, self.project.arch.bits)
-        return return_value
-
-    def __repr__(self):
-        return 'GetCharField'
-
-
-class GetShortField(NativeDroidSimProcedure):
-    def run(self, env, obj, fieldID):
-        nativedroid_logger.info('JNINativeInterface SimProcedure: %s', self)
-
-        jshort = JInt(self.project)
-        return_value = claripy.BVV(jshort.ptr, self.project.arch.bits)
-        return return_value
-
-    def __repr__(self):
-        return 'GetShortField'
-
-
-class GetIntField(NativeDroidSimProcedure):
-    def run(self, env, obj, fieldID):
-        nativedroid_logger.info('JNINativeInterface SimProcedure: %s', self)
-
-        jint = JInt(self.project)
-        return_value = claripy.BVV(jint.ptr, self.project.arch.bits)
-        return return_value
-
-    def __repr__(self):
-        return 'GetIntField'
-
-
-class GetLongField(NativeDroidSimProcedure):
-    def run(self, env, obj, fieldID):
-        nativedroid_logger.info('JNINativeInterface SimProcedure: %s', self)
-
-        jlong = JLong(self.project)
-        return_value = claripy.BVV(jlong.ptr, self.project.arch.bits)
-        return return_value
-
-    def __repr__(self):
-        return 'GetLongField'
-
-
-class GetFloatField(NativeDroidSimProcedure):
-    def run(self, env, obj, fieldID):
-        nativedroid_logger.info('JNINativeInterface SimProcedure: %s', self)
-
-        jfloat = JFloat(self.project)
-        return_value = claripy.BVV(jfloat.ptr, self.project.arch.bits)
-        return return_value
-
-    def __repr__(self):
-        return 'GetFloatField'
-
-
-class GetDoubleField(NativeDroidSimProcedure):
-    def run(self, env, obj, fieldID):
-        nativedroid_logger.info('JNINativeInterface SimProcedure: %s', self)
-
-        jdouble = JDouble(self.project)
-        return_value = claripy.BVV(jdouble.ptr, self.project.arch.bits)
-        return return_value
-
-    def __repr__(self):
-        return 'GetDoubleField'
-
-
-class SetTypeField(NativeDroidSimProcedure):
-    def run(self, env, obj, fieldID, value):
-        nativedroid_logger.info('JNINativeInterface SimProcedure: %s', self)
-
-    def __repr__(self):
-        return 'Set<Type>Field'
-
-
-class SetObjectField(NativeDroidSimProcedure):
-    def run(self, env, obj, fieldID, value):
-        nativedroid_logger.info('JNINativeInterface SimProcedure: %s', self)
-
-        field_annotation = None
-        for annotation in value.annotations:
-            if isinstance(annotation, JobjectAnnotation) or isinstance(annotation, PrimitiveTypeAnnotation):
-                field_annotation = copy.deepcopy(annotation)
-
-        id_annotation = None
-        for annotation in fieldID.annotations:
-            if isinstance(annotation, JfieldIDAnnotation):
-                id_annotation = annotation
-        for annotation in obj.annotations:
-            if isinstance(annotation, JobjectAnnotation):
-                field_exist = False
-                for field_info in annotation.fields_info:
-                    if field_info.field_name == \
-                            id_annotation.field_name and field_info.field_signature == id_annotation.field_signature:
-                        field_exist = True
-                if field_exist:
-                    # TODO need refactor logic
-                    pass
-                else:
-                    field_annotation.field_info['is_field'] = True
-                    field_annotation.field_info['field_name'] = id_annotation.field_name
-                    field_annotation.field_info['base_annotation'] = annotation
-                    annotation.fields_info.append(field_annotation)
-
-    def __repr__(self):
-        return 'SetObjectField'
-
-
-class SetBooleanField(SetTypeField):
-    def __repr__(self):
-        return 'SetBooleanField'
-
-
-class SetByteField(SetTypeField):
-    def __repr__(self):
-        return 'SetByteField'
-
-
-class SetCharField(SetTypeField):
-    def __repr__(self):
-        return 'SetCharField'
-
-
-class SetShortField(SetTypeField):
-    def __repr__(self):
-        return 'SetShortField'
-
-
-class SetIntField(SetTypeField):
-    def run(self, env, obj, fieldID, value):
-        nativedroid_logger.info('JNINativeInterface SimProcedure: %s', self)
-
-        field_annotation = None
-        for annotation in value.annotations:
-            if isinstance(annotation, JintAnnotation):
-                field_annotation = annotation
-        if field_annotation is None:
-            field_annotation = JintAnnotation(source='from_native', value=value.ast.args[0])
-
-        id_annotation = None
-        for annotation in fieldID.annotations:
-            if isinstance(annotation, JfieldIDAnnotation):
-                id_annotation = annotation
-        for annotation in obj.annotations:
-            if isinstance(annotation, JobjectAnnotation):
-                field_exist = False
-                for index, field_info in enumerate(annotation.fields_info):
-                    if field_info.field_info['field_name'] == \
-                            id_annotation.field_name and \
-                            field_info.field_info['field_signature'] == id_annotation.field_signature:
-                        field_exist = True
-                if field_exist:
-                    # TODO need refactor logic
-                    pass
-                else:
-                    field_annotation.heap = annotation.heap + '.' + id_annotation.field_name \
-                        if annotation.heap else None
-                    field_annotation.field_info['is_field'] = True
-                    field_annotation.field_info['field_name'] = id_annotation.field_name
-                    field_annotation.field_info['base_annotation'] = annotation
-                    annotation.fields_info.append(field_annotation)
-
-    def __repr__(self):
-        return 'SetIntField'
-
-
-class SetLongField(SetTypeField):
-    def __repr__(self):
-        return 'SetLongField'
-
-
-class SetFloatField(SetTypeField):
-    def __repr__(self):
-        return 'SetFloatField'
-
-
-class SetDoubleField(SetTypeField):
-    def __repr__(self):
-        return 'SetDoubleField'
-
-
-class GetStaticMethodID(GetMethodID):
-    def __repr__(self):
-        return 'GetStaticMethodID'
-
-
-class CallStaticTypeMethod(CallTypeMethod):
-    def __repr__(self):
-        return 'CallStatic<Type>Method'
-
-
-class CallStaticObjectMethod(CallStaticTypeMethod):
-    def __repr__(self):
-        return 'CallStaticObjectMethod'
-
-
-class CallStaticObjectMethodV(CallStaticTypeMethod):
-    def __repr__(self):
-        return 'CallStaticObjectMethodV'
-
-
-class CallStaticObjectMethodA(CallStaticTypeMethod):
-    def __repr__(self):
-        return 'CallStaticObjectMethodA'
-
-
-class CallStaticBooleanMethod(CallStaticTypeMethod):
-    def __repr__(self):
-        return 'CallStaticBooleanMethod'
-
-
-class CallStaticBooleanMethodV(CallStaticTypeMethod):
-    def __repr__(self):
-        return 'CallStaticBooleanMethodV'
-
-
-class CallStaticBooleanMethodA(CallStaticTypeMethod):
-    def __repr__(self):
-        return 'CallStaticBooleanMethodA'
-
-
-class CallStaticByteMethod(CallStaticTypeMethod):
-    def __repr__(self):
-        return 'CallStaticByteMethod'
-
-
-class CallStaticByteMethodV(CallStaticTypeMethod):
-    def __repr__(self):
-        return 'CallStaticByteMethodV'
-
-
-class CallStaticByteMethodA(CallStaticTypeMethod):
-    def __repr__(self):
-        return 'CallStaticByteMethodA'
-
-
-class CallStaticCharMethod(CallStaticTypeMethod):
-    def __repr__(self):
-        return 'CallStaticCharMethod'
-
-
-class CallStaticCharMethodV(CallStaticTypeMethod):
-    def __repr__(self):
-        return 'CallStaticCharMethodV'
-
-
-class CallStaticCharMethodA(CallStaticTypeMethod):
-    def __repr__(self):
-        return 'CallStaticCharMethodA'
-
-
-class CallStaticShortMethod(CallStaticTypeMethod):
-    def __repr__(self):
-        return 'CallStaticShortMethod'
-
-
-class CallStaticShortMethodV(CallStaticTypeMethod):
-    def __repr__(self):
-        return 'CallStaticShortMethodV'
-
-
-class CallStaticShortMethodA(CallStaticTypeMethod):
-    def __repr__(self):
-        return 'CallStaticShortMethodA'
-
-
-class CallStaticIntMethod(CallStaticTypeMethod):
-    def __repr__(self):
-        return 'CallStaticIntMethod'
-
-
-class CallStaticIntMethodV(CallStaticTypeMethod):
-    def __repr__(self):
-        return 'CallStaticIntMethodV'
-
-
-class CallStaticIntMethodA(CallStaticTypeMethod):
-    def __repr__(self):
-        return 'CallStaticIntMethodA'
-
-
-class CallStaticLongMethod(CallStaticTypeMethod):
-    def __repr__(self):
-        return 'CallStaticLongMethod'
-
-
-class CallStaticLongMethodV(CallStaticTypeMethod):
-    def __repr__(self):
-        return 'CallStaticLongMethodV'
-
-
-class CallStaticLongMethodA(CallStaticTypeMethod):
-    def __repr__(self):
-        return 'CallStaticLongMethodA'
-
-
-class CallStaticFloatMethod(CallStaticTypeMethod):
-    def __repr__(self):
-        return 'CallStaticFloatMethod'
-
-
-class CallStaticFloatMethodV(CallStaticTypeMethod):
-    def __repr__(self):
-        return 'CallStaticFloatMethodV'
-
-
-class CallStaticFloatMethodA(CallStaticTypeMethod):
-    def __repr__(self):
-        return 'CallStaticFloatMethodA'
-
-
-class CallStaticDoubleMethod(CallStaticTypeMethod):
-    def __repr__(self):
-        return 'CallStaticDoubleMethod'
-
-
-class CallStaticDoubleMethodV(CallStaticTypeMethod):
-    def __repr__(self):
-        return 'CallStaticDoubleMethodV'
-
-
-class CallStaticDoubleMethodA(CallStaticTypeMethod):
-    def __repr__(self):
-        return 'CallStaticDoubleMethodA'
-
-
-class CallStaticVoidMethod(CallStaticTypeMethod):
-    def __repr__(self):
-        return 'CallStaticVoidMethod'
-
-
-class CallStaticVoidMethodV(CallStaticVoidMethod):
-    def __repr__(self):
-        return 'CallStaticVoidMethodV'
-
-
-class CallStaticVoidMethodA(CallStaticVoidMethod):
-    def __repr__(self):
-        return 'CallStaticVoidMethodA'
-
-
-class GetStaticFieldID(GetFieldID):
-    def __repr__(self):
-        return 'GetStaticFieldID'
-
-
-class GetStaticObjectField(GetObjectField):
-    def run(self, env, clazz, fieldID):
-        nativedroid_logger.info('JNINativeInterface SimProcedure: %s', self)
-
-        for annotation in fieldID.annotations:
-            if isinstance(annotation, JfieldIDAnnotation):
-                field_name = annotation.field_name
-                field_signature = annotation.field_signature
-                java_return_type = get_java_return_type(field_signature)
-                typ = get_type(self.project, java_return_type)
-                typ_size = get_type_size(self.project, java_return_type)
-                return_value = claripy.BVV(typ.ptr, typ_size)
-                for anno in clazz.annotations:
-                    if isinstance(anno, JclassAnnotation):
-                        field_exist = False
-                        field_index = 0
-                        for index, field_info in enumerate(anno.fields_info):
-                            if field_info.field_info['field_name'] == field_name and \
-                                    field_info.obj_type == java_return_type:
-                                field_exist = True
-                                field_index = index
-                        if field_exist:
-                            return_value = return_value.append_annotation(
-                                copy.deepcopy(anno.fields_info[field_index]))
-                        else:
-                            jni_return_type = get_jni_return_type(field_signature)
-                            return_annotation = construct_annotation(jni_return_type, 'from_class')
-                            # return_annotation.source = 'from_class'
-                            # return_annotation.obj_type = jni_return_type
-                            return_annotation.field_info['is_field'] = True
-                            return_annotation.field_info['field_name'] = field_name
-                            return_annotation.field_info['base_annotation'] = anno
-
-                            return_annotation.taint_info['is_taint'] = True
-                            return_annotation.taint_info['taint_type'] = ['_SOURCE_', '_CLASS_FIELD_']
-                            return_annotation.taint_info['taint_info'] = ['SENSITIVE_INFO']
-                            return_annotation.taint_info['source_kind'] = 'api_source'
-                            return_value = return_value.append_annotation(return_annotation)
-                return return_value
-        jobject = JObject(self.project)
-        return_value = claripy.BVV(jobject.ptr, self.project.arch.bits)
-        return return_value
-
-    def __repr__(self):
-        return 'GetStaticObjectField'
-
-
-class GetStaticBooleanField(GetBooleanField):
-    def __repr__(self):
-        return 'GetStaticBooleanField'
-
-
-class GetStaticByteField(GetByteField):
-    def __repr__(self):
-        return 'GetStaticByteField'
-
-
-class GetStaticCharField(GetCharField):
-    def __repr__(self):
-        return 'GetStaticCharField'
-
-
-class GetStaticShortField(GetShortField):
-    def __repr__(self):
-        return 'GetStaticShortField'
-
-
-class GetStaticIntField(GetIntField):
-    def __repr__(self):
-        return 'GetStaticIntField'
-
-
-class GetStaticLongField(GetLongField):
-    def __repr__(self):
-        return 'GetStaticLongField'
-
-
-class GetStaticFloatField(GetFloatField):
-    def __repr__(self):
-        return 'GetStaticFloatField'
-
-
-class GetStaticDoubleField(GetDoubleField):
-    def __repr__(self):
-        return 'GetStaticDoubleField'
-
-
-class SetStaticObjectField(SetObjectField):
-    def __repr__(self):
-        return 'SetStaticObjectField'
-
-
-class SetStaticBooleanField(SetBooleanField):
-    def __repr__(self):
-        return 'SetStaticBooleanField'
-
-
-class SetStaticByteField(SetByteField):
-    def __repr__(self):
-        return 'SetStaticByteField'
-
-
-class SetStaticCharField(SetCharField):
-    def __repr__(self):
-        return 'SetStaticCharField'
-
-
-class SetStaticShortField(SetShortField):
-    def __repr__(self):
-        return 'SetStaticShortField'
-
-
-class SetStaticIntField(SetIntField):
-    def __repr__(self):
-        return 'SetStaticIntField'
-
-
-class SetStaticLongField(SetLongField):
-    def __repr__(self):
-        return 'SetStaticLongField'
-
-
-class SetStaticFloatField(SetFloatField):
-    def __repr__(self):
-        return 'SetStaticFloatField'
-
-
-class SetStaticDoubleField(SetDoubleField):
-    def __repr__(self):
-        return 'SetStaticDoubleField'
-
-
-class NewString(NativeDroidSimProcedure):
-    def run(self, env, unicodeChars, length):
-        nativedroid_logger.info('JNINativeInterface SimProcedure: %s', self)
-
-        jstring = JString(self.project)
-        return_value = claripy.BVV(jstring.ptr, self.project.arch.bits)
-        return return_value
-
-    def __repr__(self):
-        return 'NewString'
-
-
-class GetStringLength(NativeDroidSimProcedure):
-    def run(self, env, string):
-        nativedroid_logger.info('JNINativeInterface SimProcedure: %s', self)
-
-        jsize = JSize(self.project)
-        return_value = claripy.BVV(jsize.ptr, self.project.arch.bits)
-        return return_value
-
-    def __repr__(self):
-        return 'GetStringLength'
-
-
-class GetStringChars(NativeDroidSimProcedure):
-    def run(self, env, string, isCopy):
-        nativedroid_logger.info('JNINativeInterface SimProcedure: %s', self)
-
-        return string
-
-    def __repr__(self):
-        return 'GetStringChars'
-
-
-class ReleaseStringChars(NativeDroidSimProcedure):
-    def run(self, env, string, chars):
-        nativedroid_logger.info('JNINativeInterface SimProcedure: %s', self)
-
-    def __repr__(self):
-        return 'ReleaseStringChars'
-
-
-class NewStringUTF(NativeDroidSimProcedure):
-    _SENSITIVE_STRINGS = [
-        '/', '.', '?', 'ELF'
-    ]
-
-    def run(self, env, mybytes):
-        nativedroid_logger.info('JNINativeInterface SimProcedure: %s', self)
-
-        strlen_simproc = angr.SIM_PROCEDURES['libc']['strlen']
-        name_strlen = self.inline_call(strlen_simproc, mybytes)
-        string_arg = self.state.solver.eval(self.state.memory.load(mybytes, name_strlen.ret_expr), cast_to=str)
-        nativedroid_logger.info('String: %s', string_arg)
-
-        jstring = JString(self.project)
-        annotation = JstringAnnotation(source='from_native', value=string_arg)
-        for s in self._SENSITIVE_STRINGS:
-            if s in string_arg:
-                annotation.taint_info['is_taint'] = True
-                annotation.taint_info['taint_type'] = ['_SOURCE_', '_STMT_']
-                annotation.taint_info['taint_info'] = ['SENSITIVE_INFO']
-                annotation.taint_info['source_kind'] = 'string_source'
-                break
-        return_value = claripy.BVV(jstring.ptr, self.project.arch.bits)
-        return_value = return_value.annotate(annotation)
-        return return_value
-
-    def __repr__(self):
-        return 'NewStringUTF'
-
-
-class GetStringUTFLength(NativeDroidSimProcedure):
-    def run(self, env, string):
-        nativedroid_logger.info('JNINativeInterface SimProcedure: %s', self)
-
-        jsize = JSize(self.project)
-        return_value = claripy.BVV(jsize.ptr, self.project.arch.bits)
-        return return_value
-
-    def __repr__(self):
-        return 'GetStringUTFLength'
-
-
-class GetStringUTFChars(NativeDroidSimProcedure):
-    def run(self, env, string, isCopy):
-        nativedroid_logger.info('JNINativeInterface SimProcedure: %s', self)
-        return string
-
-    def __repr__(self):
-        return 'GetStringUTFChars'
-
-
-class ReleaseStringUTFChars(NativeDroidSimProcedure):
-    def run(self, env, string, utf):
-        nativedroid_logger.info('JNINativeInterface SimProcedure: %s', self)
-
-    def __repr__(self):
-        return 'ReleaseStringUTFChars'
-
-
-class GetArrayLength(NativeDroidSimProcedure):
-    def run(self, env, array):
-        nativedroid_logger.info('JNINativeInterface SimProcedure: %s', self)
-
-        jsize = JSize(self.project)
-        return_value = claripy.BVV(jsize.ptr, self.project.arch.bits)
-        return return_value
-
-    def __repr__(self):
-        return 'GetArrayLength'
-
-
-class NewObjectArray(NativeDroidSimProcedure):
-    def run(self, env, length, elementClass, initialElement):
-        nativedroid_logger.info('JNINativeInterface SimProcedure: %s', self)
-
-        jobject_array = JObjectArray(self.project)
-        return_value = claripy.BVV(jobject_array.ptr, self.project.arch.bits)
-        return return_value
-
-    def __repr__(self):
-        return 'NewObjectArray'
-
-
-class GetObjectArrayElement(NativeDroidSimProcedure):
-    def run(self, env, array, index):
-        nativedroid_logger.info('JNINativeInterface SimProcedure: %s', self)
-
-        jobject = JObject(self.project)
-        return_value = claripy.BVV(jobject.ptr, self.project.arch.bits)
-        element_index = index.ast.args[0]
-        array_annotation = array.annotations[0]
-        element_type = array_annotation.obj_type.split('[]')[0]
-        element_annotation = construct_annotation(element_type, array_annotation.source)
-        element_annotation.heap = array_annotation.heap + '[]' if array_annotation.heap else None
-        element_annotation.array_info['is_element'] = True
-        element_annotation.array_info['element_index'] = element_index
-        element_annotation.array_info['base_annotation'] = copy.deepcopy(array_annotation)
-        if array.annotations[0].source.startswith('arg'):
-            element_annotation.taint_info['is_taint'] = True
-            element_annotation.taint_info['taint_type'] = ['_SOURCE_', '_ARGUMENT_ELEMENT_']
-            element_annotation.taint_info['taint_info'] = ['SENSITIVE_INFO']
-            element_annotation.taint_info['source_kind'] = array_annotation.taint_info['source_kind']
-            element_annotation.taint_info['sink_kind'] = array_annotation.taint_info['sink_kind']
-        return_value = return_value.annotate(element_annotation)
-        return return_value
-
-    def __repr__(self):
-        return 'GetObjectArrayElement'
-
-
-class SetObjectArrayElement(NativeDroidSimProcedure):
-    def run(self, env, array, index, value):
-        nativedroid_logger.info('JNINativeInterface SimProcedure: %s', self)
-
-    def __repr__(self):
-        return 'SetObjectArrayElement'
-
-
-class NewBooleanArray(NativeDroidSimProcedure):
-    def run(self, env, length):
-        nativedroid_logger.info('JNINativeInterface SimProcedure: %s', self)
-
-        jboolean_array = JBooleanArray(self.project)
-        return_value = claripy.BVV(jboolean_array.ptr, self.project.arch.bits)
-        return return_value
-
-    def __repr__(self):
-        return 'NewBooleanArray'
-
-
-class NewByteArray(NativeDroidSimProcedure):
-    def run(self, env, length):
-        nativedroid_logger.info('JNINativeInterface SimProcedure: %s', self)
-
-        jbyte_array = JByteArray(self.project)
-        return_value = claripy.BVV(jbyte_array.ptr, self.project.arch.bits)
-        return return_value
-
-    def __repr__(self):
-        return 'NewByteArray'
-
-
-class NewCharArray(NativeDroidSimProcedure):
-    def run(self, env, length):
-        nativedroid_logger.info('JNINativeInterface SimProcedure: %s', self)
-
-        jchar_array = JCharArray(self.project)
-        return_value = claripy.BVV(jchar_array.ptr, self.project.arch.bits)
-        return return_value
-
-    def __repr__(self):
-        return 'NewCharArray'
-
-
-class NewShortArray(NativeDroidSimProcedure):
-    def run(self, env, length):
-        nativedroid_logger.info('JNINativeInterface SimProcedure: %s', self)
-
-        jshort_array = JShortArray(self.project)
-        return_value = claripy.BVV(jshort_array.ptr, self.project.arch.bits)
-        return return_value
-
-    def __repr__(self):
-        return 'NewShortArray'
-
-
-class NewIntArray(NativeDroidSimProcedure):
-    def run(self, env, length):
-        nativedroid_logger.info('JNINativeInterface SimProcedure: %s', self)
-
-        jint_array = JIntArray(self.project)
-        return_value = claripy.BVV(jint_array.ptr, self.project.arch.bits)
-        return return_value
-
-    def __repr__(self):
-        return 'NewIntArray'
-
-
-class NewLongArray(NativeDroidSimProcedure):
-    def run(self, env, length):
-        nativedroid_logger.info('JNINativeInterface SimProcedure: %s', self)
-
-        jlong_array = JLongArray(self.project)
-        return_value = claripy.BVV(jlong_array.ptr, self.project.arch.bits)
-        return return_value
-
-    def __repr__(self):
-        return 'NewLongArray'
-
-
-class NewFloatArray(NativeDroidSimProcedure):
-    def run(self, env, length):
-        nativedroid_logger.info('JNINativeInterface SimProcedure: %s', self)
-
-        jfloat_array = JFloatArray(self.project)
-        return_value = claripy.BVV(jfloat_array.ptr, self.project.arch.bits)
-        return return_value
-
-    def __repr__(self):
-        return 'NewFloatArray'
-
-
-class NewDoubleArray(NativeDroidSimProcedure):
-    def run(self, env, length):
-        nativedroid_logger.info('JNINativeInterface SimProcedure: %s', self)
-
-        jdouble_array = JDoubleArray(self.project)
-        return_value = claripy.BVV(jdouble_array.ptr, self.project.arch.bits)
-        return return_value
-
-    def __repr__(self):
-        return 'NewDoubleArray'
-
-
-class GetBooleanArrayElements(NativeDroidSimProcedure):
-    def run(self, env, array, isCopy):
-        nativedroid_logger.info('JNINativeInterface SimProcedure: %s', self)
-
-        jsize = JSize(self.project)
-        return_value = claripy.BVV(jsize.ptr, self.project.arch.bits)
-        return return_value
-
-    def __repr__(self):
-        return 'GetBooleanArrayElements'
-
-
-class GetByteArrayElements(NativeDroidSimProcedure):
-    def run(self, env, array, isCopy):
-        nativedroid_logger.info('JNINativeInterface SimProcedure: %s', self)
-
-        return array
-
-    def __repr__(self):
-        return 'GetByteArrayElements'
-
-
-class GetCharArrayElements(NativeDroidSimProcedure):
-    def run(self, env, array, isCopy):
-        nativedroid_logger.info('JNINativeInterface SimProcedure: %s', self)
-
-        jsize = JSize(self.project)
-        return_value = claripy.BVV(jsize.ptr, self.project.arch.bits)
-        return return_value
-
-    def __repr__(self):
-        return 'GetCharArrayElements'
-
-
-class GetShortArrayElements(NativeDroidSimProcedure):
-    def run(self, env, array, isCopy):
-        nativedroid_logger.info('JNINativeInterface SimProcedure: %s', self)
-
-        jsize = JSize(self.project)
-        return_value = claripy.BVV(jsize.ptr, self.project.arch.bits)
-        return return_value
-
-    def __repr__(self):
-        return 'GetShortArrayElements'
-
-
-class GetIntArrayElements(NativeDroidSimProcedure):
-    def run(self, env, array, isCopy):
-        nativedroid_logger.info('JNINativeInterface SimProcedure: %s', self)
-
-        jsize = JSize(self.project)
-        return_value = claripy.BVV(jsize.ptr, self.project.arch.bits)
-        return return_value
-
-    def __repr__(self):
-        return 'GetIntArrayElements'
-
-
-class GetLongArrayElements(NativeDroidSimProcedure):
-    def run(self, env, array, isCopy):
-        nativedroid_logger.info('JNINativeInterface SimProcedure: %s', self)
-
-        jsize = JSize(self.project)
-        return_value = claripy.BVV(jsize.ptr, self.project.arch.bits)
-        return return_value
-
-    def __repr__(self):
-        return 'GetLongArrayElements'
-
-
-class GetFloatArrayElements(NativeDroidSimProcedure):
-    def run(self, env, array, isCopy):
-        nativedroid_logger.info('JNINativeInterface SimProcedure: %s', self)
-
-        jsize = JSize(self.project)
-        return_value = claripy.BVV(jsize.ptr, self.project.arch.bits)
-        return return_value
-
-    def __repr__(self):
-        return 'GetFloatArrayElements'
-
-
-class GetDoubleArrayElements(NativeDroidSimProcedure):
-    def run(self, env, array, isCopy):
-        nativedroid_logger.info('JNINativeInterface SimProcedure: %s', self)
-
-        jsize = JSize(self.project)
-        return_value = claripy.BVV(jsize.ptr, self.project.arch.bits)
-        return return_value
-
-    def __repr__(self):
-        return 'GetDoubleArrayElements'
-
-
-class ReleaseBooleanArrayElements(NativeDroidSimProcedure):
-    def run(self, env, array, elems, mode):
-        nativedroid_logger.info('JNINativeInterface SimProcedure: %s', self)
-
-    def __repr__(self):
-        return 'ReleaseBooleanArrayElements'
-
-
-class ReleaseByteArrayElements(NativeDroidSimProcedure):
-    def run(self, env, array, elems, mode):
-        nativedroid_logger.info('JNINativeInterface SimProcedure: %s', self)
-
-    def __repr__(self):
-        return 'ReleaseByteArrayElements'
-
-
-class ReleaseCharArrayElements(NativeDroidSimProcedure):
-    def run(self, env, array, elems, mode):
-        nativedroid_logger.info('JNINativeInterface SimProcedure: %s', self)
-
-    def __repr__(self):
-        return 'ReleaseCharArrayElements'
-
-
-class ReleaseShortArrayElements(NativeDroidSimProcedure):
-    def run(self, env, array, elems, mode):
-        nativedroid_logger.info('JNINativeInterface SimProcedure: %s', self)
-
-    def __repr__(self):
-        return 'ReleaseShortArrayElements'
-
-
-class ReleaseIntArrayElements(NativeDroidSimProcedure):
-    def run(self, env, array, elems, mode):
-        nativedroid_logger.info('JNINativeInterface SimProcedure: %s', self)
-
-    def __repr__(self):
-        return 'ReleaseIntArrayElements'
-
-
-class ReleaseLongArrayElements(NativeDroidSimProcedure):
-    def run(self, env, array, elems, mode):
-        nativedroid_logger.info('JNINativeInterface SimProcedure: %s', self)
-
-    def __repr__(self):
-        return 'ReleaseLongArrayElements'
-
-
-class ReleaseFloatArrayElements(NativeDroidSimProcedure):
-    def run(self, env, array, elems, mode):
-        nativedroid_logger.info('JNINativeInterface SimProcedure: %s', self)
-
-    def __repr__(self):
-        return 'ReleaseFloatArrayElements'
-
-
-class ReleaseDoubleArrayElements(NativeDroidSimProcedure):
-    def run(self, env, array, elems, mode):
-        nativedroid_logger.info('JNINativeInterface SimProcedure: %s', self)
-
-    def __repr__(self):
-        return 'ReleaseDoubleArrayElements'
-
-
-class GetBooleanArrayRegion(NativeDroidSimProcedure):
-    def run(self, env, array, start, length, buf):
-        nativedroid_logger.info('JNINativeInterface SimProcedure: %s', self)
+        return_value = claripy.BVV(jobject.ptr, self.project.arch.bits)
+        return return_value
 
     def __repr__(self):
-        return 'GetBooleanArrayRegion'
+        return 'GetObjectField'
 
 
-class GetByteArrayRegion(NativeDroidSimProcedure):
-    def run(self, env, array, start, length, buf):
+class SetTypeField(NativeDroidSimProcedure):
+    def run(self, env, obj, fieldID, value):
         nativedroid_logger.info('JNINativeInterface SimProcedure: %s', self)
 
     def __repr__(self):
-        return 'GetByteArrayRegion'
+        return 'Set<Type>Field'
 
 
-class GetCharArrayRegion(NativeDroidSimProcedure):
-    def run(self, env, array, start, length, buf):
+class SetObjectField(NativeDroidSimProcedure):
+    def run(self, env, obj, fieldID, value):
         nativedroid_logger.info('JNINativeInterface SimProcedure: %s', self)
 
-    def __repr__(self):
-        return 'GetCharArrayRegion'
-
+        field_annotation = None
+        for annotation in value.annotations:
+            if isinstance(annotation, JobjectAnnotation) or isinstance(annotation, PrimitiveTypeAnnotation):
+                field_annotation = annotation.copy()
 
-class GetShortArrayRegion(NativeDroidSimProcedure):
-    def run(self, env, array, start, length, buf):
-        nativedroid_logger.info('JNINativeInterface SimProcedure: %s', self)
+        id_annotation = None
+        for annotation in fieldID.annotations:
+            if isinstance(annotation, JfieldIDAnnotation):
+                id_annotation = annotation
+        heap_abstraction = self._analysis_center.get_heap_abstraction()
+        for annotation in obj.annotations:
+            if isinstance(annotation, JobjectAnnotation):
+                if heap_abstraction.find_field(annotation, id_annotation.field_name) is not None:
+                    # TODO need refactor logic
+                    pass
+                elif heap_abstraction.is_summary(annotation):
+                    heap_abstraction.join_taint(annotation, field_annotation)
+                else:
+                    field_annotation.field_info['is_field'] = True
+                    field_annotation.field_info['field_name'] = id_annotation.field_name
+                    field_annotation.field_info['base_annotation'] = annotation
+                    annotation.fields_info.append(field_annotation)
 
     def __repr__(self):
-        return 'GetShortArrayRegion'
+        return 'SetObjectField'
 
 
-class GetIntArrayRegion(NativeDroidSimProcedure):
-    def run(self, env, array, start, length, buf):
+class SetIntField(SetTypeField):
+    def run(self, env, obj, fieldID, value):
         nativedroid_logger.info('JNINativeInterface SimProcedure: %s', self)
 
-    def __repr__(self):
-        return 'GetIntArrayRegion'
-
+        field_annotation = None
+        for annotation in value.annotations:
+            if isinstance(annotation, JintAnnotation):
+                field_annotation = annotation
+        if field_annotation is None:
+            field_annotation = JintAnnotation(source='from_native', value=value.ast.args[0])
 
-class GetLongArrayRegion(NativeDroidSimProcedure):
-    def run(self, env, array, start, length, buf):
-        nativedroid_logger.info('JNINativeInterface SimProcedure: %s', self)
+        id_annotation = None
+        for annotation in fieldID.annotations:
+            if isinstance(annotation, JfieldIDAnnotation):
+                id_annotation = annotation
+        heap_abstraction = self._analysis_center.get_heap_abstraction()
+        field_type = get_jni_return_type(id_annotation.field_signature)
+        for annotation in obj.annotations:
+            if isinstance(annotation, JobjectAnnotation):
+                if heap_abstraction.find_field(annotation, id_annotation.field_name, field_type) is not None:
+                    # TODO need refactor logic
+                    pass
+                elif heap_abstraction.is_summary(annotation):
+                    heap_abstraction.join_taint(annotation, field_annotation)
+                else:
+                    field_annotation.heap = annotation.heap + '.' + id_annotation.field_name \
+                        if annotation.heap else None
+                    field_annotation.field_info['is_field'] = True
+                    field_annotation.field_info['field_name'] = id_annotation.field_name
+                    field_annotation.field_info['base_annotation'] = annotation
+                    annotation.fields_info.append(field_annotation)
 
     def __repr__(self):
-        return 'GetLongArrayRegion'
-
+        return 'SetIntField'
 
-class GetFloatArrayRegion(NativeDroidSimProcedure):
-    def run(self, env, array, start, length, buf):
-        nativedroid_logger.info('JNINativeInterface SimProcedure: %s', self)
 
+class CallStaticTypeMethod(CallTypeMethod):
     def __repr__(self):
-        return 'GetFloatArrayRegion'
+        return 'CallStatic<Type>Method'
 
 
-class GetDoubleArrayRegion(NativeDroidSimProcedure):
-    def run(self, env, array, start, length, buf):
+class GetStaticObjectField(GetObjectField):
+    def run(self, env, clazz, fieldID):
         nativedroid_logger.info('JNINativeInterface SimProcedure: %s', self)
 
-    def __repr__(self):
-        return 'GetDoubleArrayRegion'
-
+        for annotation in fieldID.annotations:
+            if isinstance(annotation, JfieldIDAnnotation):
+                field_name = annotation.field_name
+                field_signature = annotation.field_signature
+                java_return_type = get_java_return_type(field_signature)
+                typ = get_type(self.project, java_return_type)
+                typ_size = get_type_size(self.project, java_return_type)
+                return_value = claripy.BVV(typ.ptr, typ_size)
+                for anno in clazz.annotations:
+                    if isinstance(anno, JclassAnnotation):
+                        field_exist = False
+                        field_index = 0
+                        for index, field_info in enumerate(anno.fields_info):
+                            if field_info.field_info['field_name'] == field_name and \
+                                    field_info.obj_type == java_return_type:
+                                field_exist = True
+                                field_index = index
+                        if field_exist:
+                            return_value = return_value.append_annotation(anno.fields_info[field_index].copy())
+                        else:
+                            jni_return_type = get_jni_return_type(field_signature)
+                            return_annotation = construct_annotation(jni_return_type, 'from_class')
+                            # return_annotation.source = 'from_class'
+                            # return_annotation.obj_type = jni_return_type
+                            return_annotation.field_info['is_field'] = True
+                            return_annotation.field_info['field_name'] = field_name
+                            return_annotation.field_info['base_annotation'] = anno
 
-class SetBooleanArrayRegion(NativeDroidSimProcedure):
-    def run(self, env, array, start, length, buf):
-        nativedroid_logger.info('JNINativeInterface SimProcedure: %s', self)
+                            return_annotation.taint_info.set_taint(SOURCE, CLASS_FIELD, SENSITIVE_INFO,
+                                                                   source_kind_bit=API_SOURCE)
+                            return_value = return_value.append_annotation(return_annotation)
+                return return_value
+        jobject = JObject(self.project)
+        return_value = claripy.BVV(jobject.ptr, self.project.arch.bits)
+        return return_value
 
     def __repr__(self):
-        return 'SetBooleanArrayRegion'
+        return 'GetStaticObjectField'
 
 
-class SetByteArrayRegion(NativeDroidSimProcedure):
-    def run(self, env, array, start, length, buf):
+class GetStringChars(NativeDroidSimProcedure):
+    def run(self, env, string, isCopy):
         nativedroid_logger.info('JNINativeInterface SimProcedure: %s', self)
 
+        return string
+
     def __repr__(self):
-        return 'SetBooleanArrayRegion'
+        return 'GetStringChars'
 
 
-class SetCharArrayRegion(NativeDroidSimProcedure):
-    def run(self, env, array, start, length, buf):
-        nativedroid_logger.info('JNINativeInterface SimProcedure: %s', self)
+class NewStringUTF(NativeDroidSimProcedure):
+    _SENSITIVE_STRINGS = [
+        '/', '.', '?', 'ELF'
+    ]
 
-    def __repr__(self):
-        return 'SetCharArrayRegion'
+    def run(self, env, mybytes):
+        nativedroid_logger.info('JNINativeInterface SimProcedure: %s', self)
 
+        strlen_simproc = angr.SIM_PROCEDURES['libc']['strlen']
+        name_strlen = self.inline_call(strlen_simproc, mybytes)
+        string_arg = self.state.solver.eval(self.state.memory.load(mybytes, name_strlen.ret_expr), cast_to=str)
+        nativedroid_logger.info('String: %s', string_arg)
 
-class SetShortArrayRegion(NativeDroidSimProcedure):
-    def run(self, env, array, start, length, buf):
-        nativedroid_logger.info('JNINativeInterface SimProcedure: %s', self)
+        jstring = JString(self.project)
+        annotation = JstringAnnotation(source='from_native', value=string_arg)
+        for s in self._SENSITIVE_STRINGS:
+            if s in string_arg:
+                annotation.taint_info.set_taint(SOURCE, STMT, SENSITIVE_INFO, source_kind_bit=STRING_SOURCE)
+                break
+        return_value = claripy.BVV(jstring.ptr, self.project.arch.bits)
+        return_value = return_value.annotate(annotation)
+        return return_value
 
     def __repr__(self):
-        return 'SetShortArrayRegion'
+        return 'NewStringUTF'
 
 
-class SetIntArrayRegion(NativeDroidSimProcedure):
-    def run(self, env, array, start, length, buf):
+class GetStringUTFChars(NativeDroidSimProcedure):
+    def run(self, env, string, isCopy):
         nativedroid_logger.info('JNINativeInterface SimProcedure: %s', self)
+        return string
 
     def __repr__(self):
-        return 'SetIntArrayRegion'
+        return 'GetStringUTFChars'
 
 
-class SetLongArrayRegion(NativeDroidSimProcedure):
-    def run(self, env, array, start, length, buf):
+class GetObjectArrayElement(NativeDroidSimProcedure):
+    def run(self, env, array, index):
         nativedroid_logger.info('JNINativeInterface SimProcedure: %s', self)
 
-    def __repr__(self):
-        return 'SetLongArrayRegion'
+        jobject = JObject(self.project)
+        return_value = claripy.BVV(jobject.ptr, self.project.arch.bits)
+        element_index = index.ast.args[0]
+        array_annotation = array.annotations[0]
+        element_type = array_annotation.obj_type.split('[]')[0]
+        heap_abstraction = self._analysis_center.get_heap_abstraction()
 
+        def make_element():
+            element_annotation = construct_annotation(element_type, array_annotation.source)
+            element_annotation.heap = array_annotation.heap + '[]' if array_annotation.heap else None
+            element_annotation.array_info['is_element'] = True
+            # The smashed element stands for any index.
+            element_annotation.array_info['element_index'] = None if heap_abstraction.smash_arrays else element_index
+            element_annotation.array_info['base_annotation'] = array_annotation
+            if array_annotation.source.startswith('arg'):
+                element_annotation.taint_info.set_taint(SOURCE, ARGUMENT_ELEMENT, SENSITIVE_INFO,
+                                                        source_kind_bit=array_annotation.taint_info.source_kind_bit,
+                                                        sink_kind_bit=array_annotation.taint_info.sink_kind_bit)
+            return element_annotation
 
-class SetFloatArrayRegion(NativeDroidSimProcedure):
-    def run(self, env, array, start, length, buf):
-        nativedroid_logger.info('JNINativeInterface SimProcedure: %s', self)
+        return_value = return_value.annotate(heap_abstraction.get_element(array_annotation, make_element))
+        return return_value
 
     def __repr__(self):
-        return 'SetFloatArrayRegion'
+        return 'GetObjectArrayElement'
 
 
-class SetDoubleArrayRegion(NativeDroidSimProcedure):
-    def run(self, env, array, start, length, buf):
+class GetByteArrayElements(NativeDroidSimProcedure):
+    def run(self, env, array, isCopy):
         nativedroid_logger.info('JNINativeInterface SimProcedure: %s', self)
 
+        return array
+
     def __repr__(self):
-        return 'SetDoubleArrayRegion'
+        return 'GetByteArrayElements'
 
 
 class RegisterNatives(NativeDroidSimProcedure):
@@ -2302,418 +653,346 @@ class RegisterNatives(NativeDroidSimProcedure):
         return 'RegisterNatives'
 
 
-class UnregisterNatives(NativeDroidSimProcedure):
-    def run(self, env, clazz):
-        nativedroid_logger.info('JNINativeInterface SimProcedure: %s', self)
-
-        jint = JInt(self.project)
-        return_value = claripy.BVV(jint.ptr, self.project.arch.bits)
-        return return_value
-
-    def __repr__(self):
-        return 'UnregisterNatives'
-
-
-class MonitorEnter(NativeDroidSimProcedure):
-    def run(self, env, obj):
-        nativedroid_logger.info('JNINativeInterface SimProcedure: %s', self)
-
-        jint = JInt(self.project)
-        return_value = claripy.BVV(jint.ptr, self.project.arch.bits)
-        return return_value
-
-    def __repr__(self):
-        return 'MonitorEnter'
-
-
-class MonitorExit(NativeDroidSimProcedure):
-    def run(self, env, obj):
-        nativedroid_logger.info('JNINativeInterface SimProcedure: %s', self)
-
-        jint = JInt(self.project)
-        return_value = claripy.BVV(jint.ptr, self.project.arch.bits)
-        return return_value
-
-    def __repr__(self):
-        return 'MonitorExit'
-
-
-class GetJavaVM(NativeDroidSimProcedure):
-    def run(self, env, vm):
-        nativedroid_logger.info('JNINativeInterface SimProcedure: %s', self)
-
-        jint = JInt(self.project)
-        return_value = claripy.BVV(jint.ptr, self.project.arch.bits)
-        return return_value
-
-    def __repr__(self):
-        return 'GetJavaVM'
-
-
-class GetStringRegion(NativeDroidSimProcedure):
-    def run(self, env, string, start, length, buf):
-        nativedroid_logger.info('JNINativeInterface SimProcedure: %s', self)
-
-    def __repr__(self):
-        return 'GetStringRegion'
-
-
-class GetStringUTFRegion(NativeDroidSimProcedure):
-    def run(self, env, string, start, length, buf):
-        nativedroid_logger.info('JNINativeInterface SimProcedure: %s', self)
-
-    def __repr__(self):
-        return 'GetStringUTFRegion'
-
-
-class GetPrimitiveArrayCritical(NativeDroidSimProcedure):
-    def run(self, env, array, isCopy):
-        nativedroid_logger.info('JNINativeInterface SimProcedure: %s', self)
-
-    def __repr__(self):
-        return 'GetPrimitiveArrayCritical'
-
-
-class ReleasePrimitiveArrayCritical(NativeDroidSimProcedure):
-    def run(self, env, array, carray, mode):
-        nativedroid_logger.info('JNINativeInterface SimProcedure: %s', self)
-
-    def __repr__(self):
-        return 'ReleasePrimitiveArrayCritical'
-
-
-class GetStringCritical(NativeDroidSimProcedure):
-    def run(self, env, string, isCopy):
-        nativedroid_logger.info('JNINativeInterface SimProcedure: %s', self)
-
-        jobject = JObject(self.project)
-        return_value = claripy.BVV(jobject.ptr, self.project.arch.bits)
-        return return_value
-
-    def __repr__(self):
-        return 'GetStringCritical'
-
-
-class ReleaseStringCritical(NativeDroidSimProcedure):
-    def run(self, env, string, carray):
-        nativedroid_logger.info('JNINativeInterface SimProcedure: %s', self)
-
-    def __repr__(self):
-        return 'ReleaseStringCritical'
+class ReturnJType(NativeDroidSimProcedure):
+    """
+    Model of a JNI function returning a new value of RETURN_TYPE.
+    """
 
+    RETURN_TYPE = None
 
-class NewWeakGlobalRef(NativeDroidSimProcedure):
-    def run(self, env, obj):
+    def run(self, *args):
         nativedroid_logger.info('JNINativeInterface SimProcedure: %s', self)
 
-        jweak = JWeak(self.project)
-        return_value = claripy.BVV(jweak.ptr, self.project.arch.bits)
-        return return_value
+        jtype = self.RETURN_TYPE(self.project)
+        return claripy.BVV(jtype.ptr, self.project.arch.bits)
 
     def __repr__(self):
-        return 'NewWeakGlobalRef'
-
+        return self.display_name
 
-class DeleteWeakGlobalRef(NativeDroidSimProcedure):
-    def run(self, env, obj):
-        nativedroid_logger.info('JNINativeInterface SimProcedure: %s', self)
-
-    def __repr__(self):
-        return 'DeleteWeakGlobalRef'
 
+class ReturnVoid(NativeDroidSimProcedure):
+    """
+    Model of a JNI function without effect on the analysis.
+    """
 
-class ExceptionCheck(NativeDroidSimProcedure):
-    def run(self, env):
+    def run(self, *args):
         nativedroid_logger.info('JNINativeInterface SimProcedure: %s', self)
 
-        jboolean = JBoolean(self.project)
-        return_value = claripy.BVV(jboolean.ptr, self.project.arch.bits)
-        return return_value
-
     def __repr__(self):
-        return 'ExceptionCheck'
-
-
-class NewDirectByteBuffer(NativeDroidSimProcedure):
-    def run(self, env, address, capacity):
-        nativedroid_logger.info('JNINativeInterface SimProcedure: %s', self)
-
-        jobject = JObject(self.project)
-        return_value = claripy.BVV(jobject.ptr, self.project.arch.bits)
-        return return_value
+        return self.display_name
 
-    def __repr__(self):
-        return 'NewDirectByteBuffer'
 
+def _repr_display_name(self):
+    return self.display_name
 
-class GetDirectBufferAddress(NativeDroidSimProcedure):
-    def run(self, env, buf):
-        nativedroid_logger.info('JNINativeInterface SimProcedure: %s', self)
 
-    def __repr__(self):
-        return 'GetDirectBufferAddress'
+def define_jni_procedure(name, model, arguments):
+    """
+    Get the SimProcedure class of a JNI function.
 
+    :param str name: JNINativeInterface function name
+    :param model: A JType class returned by the function, a NativeDroidSimProcedure class or None for no return value
+    :param str arguments: Space separated argument names, only used for generated procedures
+    :rtype: type
+    """
+    if isinstance(model, type) and issubclass(model, NativeDroidSimProcedure):
+        if model.__name__ == name:
+            return model
+        return type(name, (model,), {'__repr__': _repr_display_name})
+    if model is None:
+        return type(name, (ReturnVoid,), {'ARGUMENTS': tuple(arguments.split())})
+    return type(name, (ReturnJType,), {'RETURN_TYPE': model, 'ARGUMENTS': tuple(arguments.split())})
+
+
+# The JNINativeInterface function table in slot order: (name, model, arguments), see define_jni_procedure. Functions
+# modeled by a SimProcedure class take its behaviour and arguments, the others are generated on import.
+JNI_FUNCTIONS = (
+    ('reserved0', None, None),
+    ('reserved1', None, None),
+    ('reserved2', None, None),
+    ('reserved3', None, None),
+    ('GetVersion', JInt, 'env'),
+    ('DefineClass', JClass, 'env name loader buf bufLen'),
+    ('FindClass', FindClass, None),
+    ('FromReflectedMethod', JMethodID, 'env method'),
+    ('FromReflectedField', JFieldID, 'env field'),
+    ('ToReflectedMethod', JObject, 'env cls method_id is_static'),
+    ('GetSuperclass', JClass, 'env clazz'),
+    ('IsAssignableFrom', JBoolean, 'env clazz1 clazz2'),
+    ('ToReflectedField', JObject, 'env cls fieldID isStatic'),
+    ('Throw', JInt, 'env obj'),
+    ('ThrowNew', JInt, 'env clazz message'),
+    ('ExceptionOccurred', JThrowlable, 'env'),
+    ('ExceptionDescribe', None, 'env'),
+    ('ExceptionClear', None, 'env'),
+    ('FatalError', None, 'env msg'),
+    ('PushLocalFrame', JInt, 'env capacity'),
+    ('PopLocalFrame', JObject, 'env result'),
+    ('NewGlobalRef', JObject, 'env obj'),
+    ('DeleteGlobalRef', None, 'env globalRef'),
+    ('DeleteLocalRef', None, 'env localRef'),
+    ('IsSameObject', JBoolean, 'env ref1 ref2'),
+    ('NewLocalRef', JObject, 'env ref'),
+    ('EnsureLocalCapacity', JInt, 'env capacity'),
+    ('AllocObject', JObject, 'env clazz'),
+    ('NewObject', NewObject, None),
+    ('NewObjectV', NewObject, None),
+    ('NewObjectA', NewObject, None),
+    ('GetObjectClass', GetObjectClass, None),
+    ('IsInstanceOf', JInt, 'env obj clazz'),
+    ('GetMethodID', GetMethodID, None),
+    ('CallObjectMethod', CallObjectMethod, None),
+    ('CallObjectMethodV', CallTypeMethod, None),
+    ('CallObjectMethodA', CallTypeMethod, None),
+    ('CallBooleanMethod', CallTypeMethod, None),
+    ('CallBooleanMethodV', CallTypeMethod, None),
+    ('CallBooleanMethodA', CallTypeMethod, None),
+    ('CallByteMethod', CallTypeMethod, None),
+    ('CallByteMethodV', CallTypeMethod, None),
+    ('CallByteMethodA', CallTypeMethod, None),
+    ('CallCharMethod', CallTypeMethod, None),
+    ('CallCharMethodV', CallTypeMethod, None),
+    ('CallCharMethodA', CallTypeMethod, None),
+    ('CallShortMethod', CallTypeMethod, None),
+    ('CallShortMethodV', CallTypeMethod, None),
+    ('CallShortMethodA', CallTypeMethod, None),
+    ('CallIntMethod', CallTypeMethod, None),
+    ('CallIntMethodV', CallTypeMethod, None),
+    ('CallIntMethodA', CallTypeMethod, None),
+    ('CallLongMethod', CallTypeMethod, None),
+    ('CallLongMethodV', CallTypeMethod, None),
+    ('CallLongMethodA', CallTypeMethod, None),
+    ('CallFloatMethod', CallTypeMethod, None),
+    ('CallFloatMethodV', CallTypeMethod, None),
+    ('CallFloatMethodA', CallTypeMethod, None),
+    ('CallDoubleMethod', CallTypeMethod, None),
+    ('CallDoubleMethodV', CallTypeMethod, None),
+    ('CallDoubleMethodA', CallTypeMethod, None),
+    ('CallVoidMethod', CallTypeMethod, None),
+    ('CallVoidMethodV', CallTypeMethod, None),
+    ('CallVoidMethodA', CallTypeMethod, None),
+    ('CallNonvirtualObjectMethod', CallNonvirtualTypeMethod, None),
+    ('CallNonvirtualObjectMethodV', CallNonvirtualTypeMethod, None),
+    ('CallNonvirtualObjectMethodA', CallNonvirtualTypeMethod, None),
+    ('CallNonvirtualBooleanMethod', CallNonvirtualTypeMethod, None),
+    ('CallNonvirtualBooleanMethodV', CallNonvirtualTypeMethod, None),
+    ('CallNonvirtualBooleanMethodA', CallNonvirtualTypeMethod, None),
+    ('CallNonvirtualByteMethod', CallNonvirtualTypeMethod, None),
+    ('CallNonvirtualByteMethodV', CallNonvirtualTypeMethod, None),
+    ('CallNonvirtualByteMethodA', CallNonvirtualTypeMethod, None),
+    ('CallNonvirtualCharMethod', CallNonvirtualTypeMethod, None),
+    ('CallNonvirtualCharMethodV', CallNonvirtualTypeMethod, None),
+    ('CallNonvirtualCharMethodA', CallNonvirtualTypeMethod, None),
+    ('CallNonvirtualShortMethod', CallNonvirtualTypeMethod, None),
+    ('CallNonvirtualShortMethodV', CallNonvirtualTypeMethod, None),
+    ('CallNonvirtualShortMethodA', CallNonvirtualTypeMethod, None),
+    ('CallNonvirtualIntMethod', CallNonvirtualTypeMethod, None),
+    ('CallNonvirtualIntMethodV', CallNonvirtualTypeMethod, None),
+    ('CallNonvirtualIntMethodA', CallNonvirtualTypeMethod, None),
+    ('CallNonvirtualLongMethod', CallNonvirtualTypeMethod, None),
+    ('CallNonvirtualLongMethodV', CallNonvirtualTypeMethod, None),
+    ('CallNonvirtualLongMethodA', CallNonvirtualTypeMethod, None),
+    ('CallNonvirtualFloatMethod', CallNonvirtualTypeMethod, None),
+    ('CallNonvirtualFloatMethodV', CallNonvirtualTypeMethod, None),
+    ('CallNonvirtualFloatMethodA', CallNonvirtualTypeMethod, None),
+    ('CallNonvirtualDoubleMethod', CallNonvirtualTypeMethod, None),
+    ('CallNonvirtualDoubleMethodV', CallNonvirtualTypeMethod, None),
+    ('CallNonvirtualDoubleMethodA', CallNonvirtualTypeMethod, None),
+    ('CallNonvirtualVoidMethod', CallTypeMethod, None),
+    ('CallNonvirtualVoidMethodV', CallTypeMethod, None),
+    ('CallNonvirtualVoidMethodA', CallTypeMethod, None),
+    ('GetFieldID', GetFieldID, None),
+    ('GetObjectField', GetObjectField, None),
+    ('GetBooleanField', JBoolean, 'env obj fieldID'),
+    ('GetByteField', JInt, 'env obj fieldID'),
+    ('GetCharField', JInt, 'env obj fieldID'),
+    ('GetShortField', JInt, 'env obj fieldID'),
+    ('GetIntField', JInt, 'env obj fieldID'),
+    ('GetLongField', JLong, 'env obj fieldID'),
+    ('GetFloatField', JFloat, 'env obj fieldID'),
+    ('GetDoubleField', JDouble, 'env obj fieldID'),
+    ('SetObjectField', SetObjectField, None),
+    ('SetBooleanField', SetTypeField, None),
+    ('SetByteField', SetTypeField, None),
+    ('SetCharField', SetTypeField, None),
+    ('SetShortField', SetTypeField, None),
+    ('SetIntField', SetIntField, None),
+    ('SetLongField', SetTypeField, None),
+    ('SetFloatField', SetTypeField, None),
+    ('SetDoubleField', SetTypeField, None),
+    ('GetStaticMethodID', GetMethodID, None),
+    ('CallStaticObjectMethod', CallStaticTypeMethod, None),
+    ('CallStaticObjectMethodV', CallStaticTypeMethod, None),
+    ('CallStaticObjectMethodA', CallStaticTypeMethod, None),
+    ('CallStaticBooleanMethod', CallStaticTypeMethod, None),
+    ('CallStaticBooleanMethodV', CallStaticTypeMethod, None),
+    ('CallStaticBooleanMethodA', CallStaticTypeMethod, None),
+    ('CallStaticByteMethod', CallStaticTypeMethod, None),
+    ('CallStaticByteMethodV', CallStaticTypeMethod, None),
+    ('CallStaticByteMethodA', CallStaticTypeMethod, None),
+    ('CallStaticCharMethod', CallStaticTypeMethod, None),
+    ('CallStaticCharMethodV', CallStaticTypeMethod, None),
+    ('CallStaticCharMethodA', CallStaticTypeMethod, None),
+    ('CallStaticShortMethod', CallStaticTypeMethod, None),
+    ('CallStaticShortMethodV', CallStaticTypeMethod, None),
+    ('CallStaticShortMethodA', CallStaticTypeMethod, None),
+    ('CallStaticIntMethod', CallStaticTypeMethod, None),
+    ('CallStaticIntMethodV', CallStaticTypeMethod, None),
+    ('CallStaticIntMethodA', CallStaticTypeMethod, None),
+    ('CallStaticLongMethod', CallStaticTypeMethod, None),
+    ('CallStaticLongMethodV', CallStaticTypeMethod, None),
+    ('CallStaticLongMethodA', CallStaticTypeMethod, None),
+    ('CallStaticFloatMethod', CallStaticTypeMethod, None),
+    ('CallStaticFloatMethodV', CallStaticTypeMethod, None),
+    ('CallStaticFloatMethodA', CallStaticTypeMethod, None),
+    ('CallStaticDoubleMethod', CallStaticTypeMethod, None),
+    ('CallStaticDoubleMethodV', CallStaticTypeMethod, None),
+    ('CallStaticDoubleMethodA', CallStaticTypeMethod, None),
+    ('CallStaticVoidMethod', CallStaticTypeMethod, None),
+    ('CallStaticVoidMethodV', CallStaticTypeMethod, None),
+    ('CallStaticVoidMethodA', CallStaticTypeMethod, None),
+    ('GetStaticFieldID', GetFieldID, None),
+    ('GetStaticObjectField', GetStaticObjectField, None),
+    ('GetStaticBooleanField', JBoolean, 'env obj fieldID'),
+    ('GetStaticByteField', JInt, 'env obj fieldID'),
+    ('GetStaticCharField', JInt, 'env obj fieldID'),
+    ('GetStaticShortField', JInt, 'env obj fieldID'),
+    ('GetStaticIntField', JInt, 'env obj fieldID'),
+    ('GetStaticLongField', JLong, 'env obj fieldID'),
+    ('GetStaticFloatField', JFloat, 'env obj fieldID'),
+    ('GetStaticDoubleField', JDouble, 'env obj fieldID'),
+    ('SetStaticObjectField', SetObjectField, None),
+    ('SetStaticBooleanField', SetTypeField, None),
+    ('SetStaticByteField', SetTypeField, None),
+    ('SetStaticCharField', SetTypeField, None),
+    ('SetStaticShortField', SetTypeField, None),
+    ('SetStaticIntField', SetIntField, None),
+    ('SetStaticLongField', SetTypeField, None),
+    ('SetStaticFloatField', SetTypeField, None),
+    ('SetStaticDoubleField', SetTypeField, None),
+    ('NewString', JString, 'env unicodeChars length'),
+    ('GetStringLength', JSize, 'env string'),
+    ('GetStringChars', GetStringChars, None),
+    ('ReleaseStringChars', None, 'env string chars'),
+    ('NewStringUTF', NewStringUTF, None),
+    ('GetStringUTFLength', JSize, 'env string'),
+    ('GetStringUTFChars', GetStringUTFChars, None),
+    ('ReleaseStringUTFChars', None, 'env string utf'),
+    ('GetArrayLength', JSize, 'env array'),
+    ('NewObjectArray', JObjectArray, 'env length elementClass initialElement'),
+    ('GetObjectArrayElement', GetObjectArrayElement, None),
+    ('SetObjectArrayElement', None, 'env array index value'),
+    ('NewBooleanArray', JBooleanArray, 'env length'),
+    ('NewByteArray', JByteArray, 'env length'),
+    ('NewCharArray', JCharArray, 'env length'),
+    ('NewShortArray', JShortArray, 'env length'),
+    ('NewIntArray', JIntArray, 'env length'),
+    ('NewLongArray', JLongArray, 'env length'),
+    ('NewFloatArray', JFloatArray, 'env length'),
+    ('NewDoubleArray', JDoubleArray, 'env length'),
+    ('GetBooleanArrayElements', JSize, 'env array isCopy'),
+    ('GetByteArrayElements', GetByteArrayElements, None),
+    ('GetCharArrayElements', JSize, 'env array isCopy'),
+    ('GetShortArrayElements', JSize, 'env array isCopy'),
+    ('GetIntArrayElements', JSize, 'env array isCopy'),
+    ('GetLongArrayElements', JSize, 'env array isCopy'),
+    ('GetFloatArrayElements', JSize, 'env array isCopy'),
+    ('GetDoubleArrayElements', JSize, 'env array isCopy'),
+    ('ReleaseBooleanArrayElements', None, 'env array elems mode'),
+    ('ReleaseByteArrayElements', None, 'env array elems mode'),
+    ('ReleaseCharArrayElements', None, 'env array elems mode'),
+    ('ReleaseShortArrayElements', None, 'env array elems mode'),
+    ('ReleaseIntArrayElements', None, 'env array elems mode'),
+    ('ReleaseLongArrayElements', None, 'env array elems mode'),
+    ('ReleaseFloatArrayElements', None, 'env array elems mode'),
+    ('ReleaseDoubleArrayElements', None, 'env array elems mode'),
+    ('GetBooleanArrayRegion', None, 'env array start length buf'),
+    ('GetByteArrayRegion', None, 'env array start length buf'),
+    ('GetCharArrayRegion', None, 'env array start length buf'),
+    ('GetShortArrayRegion', None, 'env array start length buf'),
+    ('GetIntArrayRegion', None, 'env array start length buf'),
+    ('GetLongArrayRegion', None, 'env array start length buf'),
+    ('GetFloatArrayRegion', None, 'env array start length buf'),
+    ('GetDoubleArrayRegion', None, 'env array start length buf'),
+    ('SetBooleanArrayRegion', None, 'env array start length buf'),
+    ('SetByteArrayRegion', None, 'env array start length buf'),
+    ('SetCharArrayRegion', None, 'env array start length buf'),
+    ('SetShortArrayRegion', None, 'env array start length buf'),
+    ('SetIntArrayRegion', None, 'env array start length buf'),
+    ('SetLongArrayRegion', None, 'env array start length buf'),
+    ('SetFloatArrayRegion', None, 'env array start length buf'),
+    ('SetDoubleArrayRegion', None, 'env array start length buf'),
+    ('RegisterNatives', RegisterNatives, None),
+    ('UnregisterNatives', JInt, 'env clazz'),
+    ('MonitorEnter', JInt, 'env obj'),
+    ('MonitorExit', JInt, 'env obj'),
+    ('GetJavaVM', JInt, 'env vm'),
+    ('GetStringRegion', None, 'env string start length buf'),
+    ('GetStringUTFRegion', None, 'env string start length buf'),
+    ('GetPrimitiveArrayCritical', None, 'env array isCopy'),
+    ('ReleasePrimitiveArrayCritical', None, 'env array carray mode'),
+    ('GetStringCritical', JObject, 'env string isCopy'),
+    ('ReleaseStringCritical', None, 'env string carray'),
+    ('NewWeakGlobalRef', JWeak, 'env obj'),
+    ('DeleteWeakGlobalRef', None, 'env obj'),
+    ('ExceptionCheck', JBoolean, 'env'),
+    ('NewDirectByteBuffer', JObject, 'env address capacity'),
+    ('GetDirectBufferAddress', None, 'env buf'),
+    ('GetDirectBufferCapacity', JLong, 'env buf'),
+    ('GetObjectRefType', JObjectRefType, 'env obj'),
+)
+
+JNI_PROCEDURES = {name: define_jni_procedure(name, model, arguments)
+                  for name, model, arguments in JNI_FUNCTIONS if not name.startswith('reserved')}
+globals().update(JNI_PROCEDURES)
+
+jni_native_interface_origin_usage = {name: 0 for name in JNI_PROCEDURES}
+
+
+_jni_struct_lock = threading.Lock()
+_jni_struct_defined = False
+
+
+def define_jni_structs():
+    """
+    Define the JNINativeMethod struct resolved in RegisterNatives SimProcedure. Struct definitions are global to angr,
+    so they are parsed once per process.
+    """
+    global _jni_struct_defined
+    with _jni_struct_lock:
+        if not _jni_struct_defined:
+            angr.sim_type.define_struct('struct JNINativeMethod {const char* name;const char* signature;void* fnPtr;}')
+            _jni_struct_defined = True
 
-class GetDirectBufferCapacity(NativeDroidSimProcedure):
-    def run(self, env, buf):
-        nativedroid_logger.info('JNINativeInterface SimProcedure: %s', self)
 
-        jlong = JLong(self.project)
-        return_value = claripy.BVV(jlong.ptr, self.project.arch.bits)
-        return return_value
+class LazyJNIProcedure(object):
+    """
+    Placeholder hooked at a JNINativeInterface function. The SimProcedure is only created when the hook is first used,
+    i.e. when execution or a CFG reaches the function, and then replaces the placeholder.
 
-    def __repr__(self):
-        return 'GetDirectBufferCapacity'
+    :param JNINativeInterface interface: Owning function table
+    :param int addr: Hooked address
+    :param str name: JNINativeInterface function name
+    """
 
+    __slots__ = ('_interface', '_addr', '_name')
 
-class GetObjectRefType(NativeDroidSimProcedure):
-    def run(self, env, obj):
-        nativedroid_logger.info('JNINativeInterface SimProcedure: %s', self)
+    def __init__(self, interface, addr, name):
+        self._interface = interface
+        self._addr = addr
+        self._name = name
 
-        jobject_ref_type = JObjectRefType(self.project)
-        return_value = claripy.BVV(jobject_ref_type.ptr, self.project.arch.bits)
-        return return_value
+    def __getattr__(self, item):
+        if item.startswith('__'):
+            raise AttributeError(item)
+        return getattr(self._interface.materialize(self._addr, self._name), item)
 
     def __repr__(self):
-        return 'GetObjectRefType'
+        return '<LazyJNIProcedure %s>' % self._name
 
 
 class JNINativeInterface(ExternObject):
-    JNINativeInterface_index_to_name = {
-        0: "reserved0",
-        1: "reserved1",
-        2: "reserved2",
-        3: "reserved3",
-        4: "GetVersion",
-        5: "DefineClass",
-        6: "FindClass",
-        7: "FromReflectedMethod",
-        8: "FromReflectedField",
-        9: "ToReflectedMethod",
-        10: "GetSuperclass",
-        11: "IsAssignableFrom",
-        12: "ToReflectedField",
-        13: "Throw",
-        14: "ThrowNew",
-        15: "ExceptionOccurred",
-        16: "ExceptionDescribe",
-        17: "ExceptionClear",
-        18: "FatalError",
-        19: "PushLocalFrame",
-        20: "PopLocalFrame",
-        21: "NewGlobalRef",
-        22: "DeleteGlobalRef",
-        23: "DeleteLocalRef",
-        24: "IsSameObject",
-        25: "NewLocalRef",
-        26: "EnsureLocalCapacity",
-        27: "AllocObject",
-        28: "NewObject",
-        29: "NewObjectV",
-        30: "NewObjectA",
-        31: "GetObjectClass",
-        32: "IsInstanceOf",
-        33: "GetMethodID",
-        34: "CallObjectMethod",
-        35: "CallObjectMethodV",
-        36: "CallObjectMethodA",
-        37: "CallBooleanMethod",
-        38: "CallBooleanMethodV",
-        39: "CallBooleanMethodA",
-        40: "CallByteMethod",
-        41: "CallByteMethodV",
-        42: "CallByteMethodA",
-        43: "CallCharMethod",
-        44: "CallCharMethodV",
-        45: "CallCharMethodA",
-        46: "CallShortMethod",
-        47: "CallShortMethodV",
-        48: "CallShortMethodA",
-        49: "CallIntMethod",
-        50: "CallIntMethodV",
-        51: "CallIntMethodA",
-        52: "CallLongMethod",
-        53: "CallLongMethodV",
-        54: "CallLongMethodA",
-        55: "CallFloatMethod",
-        56: "CallFloatMethodV",
-        57: "CallFloatMethodA",
-        58: "CallDoubleMethod",
-        59: "CallDoubleMethodV",
-        60: "CallDoubleMethodA",
-        61: "CallVoidMethod",
-        62: "CallVoidMethodV",
-        63: "CallVoidMethodA",
-        64: "CallNonvirtualObjectMethod",
-        65: "CallNonvirtualObjectMethodV",
-        66: "CallNonvirtualObjectMethodA",
-        67: "CallNonvirtualBooleanMethod",
-        68: "CallNonvirtualBooleanMethodV",
-        69: "CallNonvirtualBooleanMethodA",
-        70: "CallNonvirtualByteMethod",
-        71: "CallNonvirtualByteMethodV",
-        72: "CallNonvirtualByteMethodA",
-        73: "CallNonvirtualCharMethod",
-        74: "CallNonvirtualCharMethodV",
-        75: "CallNonvirtualCharMethodA",
-        76: "CallNonvirtualShortMethod",
-        77: "CallNonvirtualShortMethodV",
-        78: "CallNonvirtualShortMethodA",
-        79: "CallNonvirtualIntMethod",
-        80: "CallNonvirtualIntMethodV",
-        81: "CallNonvirtualIntMethodA",
-        82: "CallNonvirtualLongMethod",
-        83: "CallNonvirtualLongMethodV",
-        84: "CallNonvirtualLongMethodA",
-        85: "CallNonvirtualFloatMethod",
-        86: "CallNonvirtualFloatMethodV",
-        87: "CallNonvirtualFloatMethodA",
-        88: "CallNonvirtualDoubleMethod",
-        89: "CallNonvirtualDoubleMethodV",
-        90: "CallNonvirtualDoubleMethodA",
-        91: "CallNonvirtualVoidMethod",
-        92: "CallNonvirtualVoidMethodV",
-        93: "CallNonvirtualVoidMethodA",
-        94: "GetFieldID",
-        95: "GetObjectField",
-        96: "GetBooleanField",
-        97: "GetByteField",
-        98: "GetCharField",
-        99: "GetShortField",
-        100: "GetIntField",
-        101: "GetLongField",
-        102: "GetFloatField",
-        103: "GetDoubleField",
-        104: "SetObjectField",
-        105: "SetBooleanField",
-        106: "SetByteField",
-        107: "SetCharField",
-        108: "SetShortField",
-        109: "SetIntField",
-        110: "SetLongField",
-        111: "SetFloatField",
-        112: "SetDoubleField",
-        113: "GetStaticMethodID",
-        114: "CallStaticObjectMethod",
-        115: "CallStaticObjectMethodV",
-        116: "CallStaticObjectMethodA",
-        117: "CallStaticBooleanMethod",
-        118: "CallStaticBooleanMethodV",
-        119: "CallStaticBooleanMethodA",
-        120: "CallStaticByteMethod",
-        121: "CallStaticByteMethodV",
-        122: "CallStaticByteMethodA",
-        123: "CallStaticCharMethod",
-        124: "CallStaticCharMethodV",
-        125: "CallStaticCharMethodA",
-        126: "CallStaticShortMethod",
-        127: "CallStaticShortMethodV",
-        128: "CallStaticShortMethodA",
-        129: "CallStaticIntMethod",
-        130: "CallStaticIntMethodV",
-        131: "CallStaticIntMethodA",
-        132: "CallStaticLongMethod",
-        133: "CallStaticLongMethodV",
-        134: "CallStaticLongMethodA",
-        135: "CallStaticFloatMethod",
-        136: "CallStaticFloatMethodV",
-        137: "CallStaticFloatMethodA",
-        138: "CallStaticDoubleMethod",
-        139: "CallStaticDoubleMethodV",
-        140: "CallStaticDoubleMethodA",
-        141: "CallStaticVoidMethod",
-        142: "CallStaticVoidMethodV",
-        143: "CallStaticVoidMethodA",
-        144: "GetStaticFieldID",
-        145: "GetStaticObjectField",
-        146: "GetStaticBooleanField",
-        147: "GetStaticByteField",
-        148: "GetStaticCharField",
-        149: "GetStaticShortField",
-        150: "GetStaticIntField",
-        151: "GetStaticLongField",
-        152: "GetStaticFloatField",
-        153: "GetStaticDoubleField",
-        154: "SetStaticObjectField",
-        155: "SetStaticBooleanField",
-        156: "SetStaticByteField",
-        157: "SetStaticCharField",
-        158: "SetStaticShortField",
-        159: "SetStaticIntField",
-        160: "SetStaticLongField",
-        161: "SetStaticFloatField",
-        162: "SetStaticDoubleField",
-        163: "NewString",
-        164: "GetStringLength",
-        165: "GetStringChars",
-        166: "ReleaseStringChars",
-        167: "NewStringUTF",
-        168: "GetStringUTFLength",
-        169: "GetStringUTFChars",
-        170: "ReleaseStringUTFChars",
-        171: "GetArrayLength",
-        172: "NewObjectArray",
-        173: "GetObjectArrayElement",
-        174: "SetObjectArrayElement",
-        175: "NewBooleanArray",
-        176: "NewByteArray",
-        177: "NewCharArray",
-        178: "NewShortArray",
-        179: "NewIntArray",
-        180: "NewLongArray",
-        181: "NewFloatArray",
-        182: "NewDoubleArray",
-        183: "GetBooleanArrayElements",
-        184: "GetByteArrayElements",
-        185: "GetCharArrayElements",
-        186: "GetShortArrayElements",
-        187: "GetIntArrayElements",
-        188: "GetLongArrayElements",
-        189: "GetFloatArrayElements",
-        190: "GetDoubleArrayElements",
-        191: "ReleaseBooleanArrayElements",
-        192: "ReleaseByteArrayElements",
-        193: "ReleaseCharArrayElements",
-        194: "ReleaseShortArrayElements",
-        195: "ReleaseIntArrayElements",
-        196: "ReleaseLongArrayElements",
-        197: "ReleaseFloatArrayElements",
-        198: "ReleaseDoubleArrayElements",
-        199: "GetBooleanArrayRegion",
-        200: "GetByteArrayRegion",
-        201: "GetCharArrayRegion",
-        202: "GetShortArrayRegion",
-        203: "GetIntArrayRegion",
-        204: "GetLongArrayRegion",
-        205: "GetFloatArrayRegion",
-        206: "GetDoubleArrayRegion",
-        207: "SetBooleanArrayRegion",
-        208: "SetByteArrayRegion",
-        209: "SetCharArrayRegion",
-        210: "SetShortArrayRegion",
-        211: "SetIntArrayRegion",
-        212: "SetLongArrayRegion",
-        213: "SetFloatArrayRegion",
-        214: "SetDoubleArrayRegion",
-        215: "RegisterNatives",
-        216: "UnregisterNatives",
-        217: "MonitorEnter",
-        218: "MonitorExit",
-        219: "GetJavaVM",
-        220: "GetStringRegion",
-        221: "GetStringUTFRegion",
-        222: "GetPrimitiveArrayCritical",
-        223: "ReleasePrimitiveArrayCritical",
-        224: "GetStringCritical",
-        225: "ReleaseStringCritical",
-        226: "NewWeakGlobalRef",
-        227: "DeleteWeakGlobalRef",
-        228: "ExceptionCheck",
-        229: "NewDirectByteBuffer",
-        230: "GetDirectBufferAddress",
-        231: "GetDirectBufferCapacity",
-        232: "GetObjectRefType",
-    }
+    JNINativeInterface_index_to_name = dict(enumerate(name for name, _, _ in JNI_FUNCTIONS))
     JNINativeInterface_sig = {
         '_ZN7_JNIEnv10GetVersionEv': 'GetVersion',
         '_ZN7_JNIEnv11DefineClassEPKcP8_jobjectPKai': 'DefineClass',
@@ -2951,237 +1230,7 @@ class JNINativeInterface(ExternObject):
         '_ZN7_JNIEnv16GetObjectRefTypeEP8_jobject': 'GetObjectRefType',
 
     }
-    JNINativeInterface_name_to_simproc = {
-        'GetVersion': GetVersion,
-        'DefineClass': DefineClass,
-        'FindClass': FindClass,
-        'FromReflectedMethod': FromReflectedMethod,
-        'FromReflectedField': FromReflectedField,
-        'ToReflectedMethod': ToReflectedMethod,
-        'GetSuperClass': GetSuperClass,
-        'IsAssignableFrom': IsAssignableFrom,
-        'ToReflectedField': ToReflectedField,
-        'Throw': Throw,
-        'ThrowNew': ThrowNew,
-        'ExceptionOccurred': ExceptionOccurred,
-        'ExceptionDescribe': ExceptionDescribe,
-        'ExceptionClear': ExceptionClear,
-        'FatalError': FatalError,
-        'PushLocalFrame': PushLocalFrame,
-        'PopLocalFrame': PopLocalFrame,
-        'NewGlobalRef': NewGlobalRef,
-        'DeleteGlobalRef': DeleteGlobalRef,
-        'DeleteLocalRef': DeleteLocalRef,
-        'IsSameObject': IsSameObject,
-        'NewLocalRef': NewLocalRef,
-        'EnsureLocalCapacity': EnsureLocalCapacity,
-        'AllocObject': AllocObject,
-        'NewObject': NewObject,
-        'NewObjectV': NewObjectV,
-        'NewObjectA': NewObjectA,
-        'GetObjectClass': GetObjectClass,
-        'IsInstanceOf': IsInstanceOf,
-        'GetMethodID': GetMethodID,
-        'CallObjectMethod': CallObjectMethod,
-        'CallObjectMethodV': CallObjectMethodV,
-        'CallObjectMethodA': CallObjectMethodA,
-        'CallBooleanMethod': CallBooleanMethod,
-        'CallBooleanMethodV': CallBooleanMethodV,
-        'CallBooleanMethodA': CallBooleanMethodA,
-        'CallByteMethod': CallByteMethod,
-        'CallByteMethodV': CallByteMethodV,
-        'CallByteMethodA': CallByteMethodA,
-        'CallCharMethod': CallCharMethod,
-        'CallCharMethodV': CallCharMethodV,
-        'CallCharMethodA': CallCharMethodA,
-        'CallShortMethod': CallShortMethod,
-        'CallShortMethodV': CallShortMethodV,
-        'CallShortMethodA': CallShortMethodA,
-        'CallIntMethod': CallIntMethod,
-        'CallIntMethodV': CallIntMethodV,
-        'CallIntMethodA': CallIntMethodA,
-        'CallLongMethod': CallLongMethod,
-        'CallLongMethodV': CallLongMethodV,
-        'CallLongMethodA': CallLongMethodA,
-        'CallFloatMethod': CallFloatMethod,
-        'CallFloatMethodV': CallFloatMethodV,
-        'CallFloatMethodA': CallFloatMethodA,
-        'CallDoubleMethod': CallDoubleMethod,
-        'CallDoubleMethodV': CallDoubleMethodV,
-        'CallDoubleMethodA': CallDoubleMethodA,
-        'CallVoidMethod': CallVoidMethod,
-        'CallVoidMethodV': CallVoidMethodV,
-        'CallVoidMethodA': CallVoidMethodA,
-        'CallNonvirtualObjectMethod': CallNonvirtualObjectMethod,
-        'CallNonvirtualObjectMethodV': CallNonvirtualObjectMethodV,
-        'CallNonvirtualObjectMethodA': CallNonvirtualObjectMethodA,
-        'CallNonvirtualBooleanMethod': CallNonvirtualBooleanMethod,
-        'CallNonvirtualBooleanMethodV': CallNonvirtualBooleanMethodV,
-        'CallNonvirtualBooleanMethodA': CallNonvirtualBooleanMethodA,
-        'CallNonvirtualByteMethod': CallNonvirtualByteMethod,
-        'CallNonvirtualByteMethodV': CallNonvirtualByteMethodV,
-        'CallNonvirtualByteMethodA': CallNonvirtualByteMethodA,
-        'CallNonvirtualCharMethod': CallNonvirtualCharMethod,
-        'CallNonvirtualCharMethodV': CallNonvirtualCharMethodV,
-        'CallNonvirtualCharMethodA': CallNonvirtualCharMethodA,
-        'CallNonvirtualShortMethod': CallNonvirtualShortMethod,
-        'CallNonvirtualShortMethodV': CallNonvirtualShortMethodV,
-        'CallNonvirtualShortMethodA': CallNonvirtualShortMethodA,
-        'CallNonvirtualIntMethod': CallNonvirtualIntMethod,
-        'CallNonvirtualIntMethodV': CallNonvirtualIntMethodV,
-        'CallNonvirtualIntMethodA': CallNonvirtualIntMethodA,
-        'CallNonvirtualLongMethod': CallNonvirtualLongMethod,
-        'CallNonvirtualLongMethodV': CallNonvirtualLongMethodV,
-        'CallNonvirtualLongMethodA': CallNonvirtualLongMethodA,
-        'CallNonvirtualFloatMethod': CallNonvirtualFloatMethod,
-        'CallNonvirtualFloatMethodV': CallNonvirtualFloatMethodV,
-        'CallNonvirtualFloatMethodA': CallNonvirtualFloatMethodA,
-        'CallNonvirtualDoubleMethod': CallNonvirtualDoubleMethod,
-        'CallNonvirtualDoubleMethodV': CallNonvirtualDoubleMethodV,
-        'CallNonvirtualDoubleMethodA': CallNonvirtualDoubleMethodA,
-        'CallNonvirtualVoidMethod': CallNonvirtualVoidMethod,
-        'CallNonvirtualVoidMethodV': CallNonvirtualVoidMethodV,
-        'CallNonvirtualVoidMethodA': CallNonvirtualVoidMethodA,
-        'GetFieldID': GetFieldID,
-        'GetObjectField': GetObjectField,
-        'GetBooleanField': GetBooleanField,
-        'GetByteField': GetByteField,
-        'GetCharField': GetCharField,
-        'GetShortField': GetShortField,
-        'GetIntField': GetIntField,
-        'GetLongField': GetLongField,
-        'GetFloatField': GetFloatField,
-        'GetDoubleField': GetDoubleField,
-        'SetObjectField': SetObjectField,
-        'SetBooleanField': SetBooleanField,
-        'SetByteField': SetByteField,
-        'SetCharField': SetCharField,
-        'SetShortField': SetShortField,
-        'SetIntField': SetIntField,
-        'SetLongField': SetLongField,
-        'SetFloatField': SetFloatField,
-        'SetDoubleField': SetDoubleField,
-        'GetStaticMethodID': GetStaticMethodID,
-        'CallStaticObjectMethod': CallStaticObjectMethod,
-        'CallStaticObjectMethodV': CallStaticObjectMethodV,
-        'CallStaticObjectMethodA': CallStaticObjectMethodA,
-        'CallStaticBooleanMethod': CallStaticBooleanMethod,
-        'CallStaticBooleanMethodV': CallStaticBooleanMethodV,
-        'CallStaticBooleanMethodA': CallStaticBooleanMethodA,
-        'CallStaticByteMethod': CallStaticByteMethod,
-        'CallStaticByteMethodV': CallStaticByteMethodV,
-        'CallStaticByteMethodA': CallStaticByteMethodA,
-        'CallStaticCharMethod': CallStaticCharMethod,
-        'CallStaticCharMethodV': CallStaticCharMethodV,
-        'CallStaticCharMethodA': CallStaticCharMethodA,
-        'CallStaticShortMethod': CallStaticShortMethod,
-        'CallStaticShortMethodV': CallStaticShortMethodV,
-        'CallStaticShortMethodA': CallStaticShortMethodA,
-        'CallStaticIntMethod': CallStaticIntMethod,
-        'CallStaticIntMethodV': CallStaticIntMethodV,
-        'CallStaticIntMethodA': CallStaticIntMethodA,
-        'CallStaticLongMethod': CallStaticLongMethod,
-        'CallStaticLongMethodV': CallStaticLongMethodV,
-        'CallStaticLongMethodA': CallStaticLongMethodA,
-        'CallStaticFloatMethod': CallStaticFloatMethod,
-        'CallStaticFloatMethodV': CallStaticFloatMethodV,
-        'CallStaticFloatMethodA': CallStaticFloatMethodA,
-        'CallStaticDoubleMethod': CallStaticDoubleMethod,
-        'CallStaticDoubleMethodV': CallStaticDoubleMethodV,
-        'CallStaticDoubleMethodA': CallStaticDoubleMethodA,
-        'CallStaticVoidMethod': CallStaticVoidMethod,
-        'CallStaticVoidMethodV': CallStaticVoidMethodV,
-        'CallStaticVoidMethodA': CallStaticVoidMethodA,
-        'GetStaticFieldID': GetStaticFieldID,
-        'GetStaticObjectField': GetStaticObjectField,
-        'GetStaticBooleanField': GetStaticBooleanField,
-        'GetStaticByteField': GetStaticByteField,
-        'GetStaticCharField': GetStaticCharField,
-        'GetStaticShortField': GetStaticShortField,
-        'GetStaticIntField': GetStaticIntField,
-        'GetStaticLongField': GetStaticLongField,
-        'GetStaticFloatField': GetStaticFloatField,
-        'GetStaticDoubleField': GetStaticDoubleField,
-        'SetStaticObjectField': SetStaticObjectField,
-        'SetStaticBooleanField': SetStaticBooleanField,
-        'SetStaticByteField': SetStaticByteField,
-        'SetStaticCharField': SetStaticCharField,
-        'SetStaticShortField': SetStaticShortField,
-        'SetStaticIntField': SetStaticIntField,
-        'SetStaticLongField': SetStaticLongField,
-        'SetStaticFloatField': SetStaticFloatField,
-        'SetStaticDoubleField': SetStaticDoubleField,
-        'NewString': NewString,
-        'GetStringLength': GetStringLength,
-        'GetStringChars': GetStringChars,
-        'ReleaseStringChars': ReleaseStringChars,
-        'NewStringUTF': NewStringUTF,
-        'GetStringUTFLength': GetStringUTFLength,
-        'GetStringUTFChars': GetStringUTFChars,
-        'ReleaseStringUTFChars': ReleaseStringUTFChars,
-        'GetArrayLength': GetArrayLength,
-        'NewObjectArray': NewObjectArray,
-        'GetObjectArrayElement': GetObjectArrayElement,
-        'SetObjectArrayElement': SetObjectArrayElement,
-        'NewBooleanArray': NewBooleanArray,
-        'NewByteArray': NewByteArray,
-        'NewCharArray': NewCharArray,
-        'NewShortArray': NewShortArray,
-        'NewIntArray': NewIntArray,
-        'NewLongArray': NewLongArray,
-        'NewFloatArray': NewFloatArray,
-        'NewDoubleArray': NewDoubleArray,
-        'GetBooleanArrayElements': GetBooleanArrayElements,
-        'GetByteArrayElements': GetByteArrayElements,
-        'GetCharArrayElements': GetCharArrayElements,
-        'GetShortArrayElements': GetShortArrayElements,
-        'GetIntArrayElements': GetIntArrayElements,
-        'GetLongArrayElements': GetLongArrayElements,
-        'GetFloatArrayElements': GetFloatArrayElements,
-        'GetDoubleArrayElements': GetDoubleArrayElements,
-        'ReleaseBooleanArrayElements': ReleaseBooleanArrayElements,
-        'ReleaseByteArrayElements': ReleaseByteArrayElements,
-        'ReleaseCharArrayElements': ReleaseCharArrayElements,
-        'ReleaseShortArrayElements': ReleaseShortArrayElements,
-        'ReleaseIntArrayElements': ReleaseIntArrayElements,
-        'ReleaseLongArrayElements': ReleaseLongArrayElements,
-        'ReleaseFloatArrayElements': ReleaseFloatArrayElements,
-        'ReleaseDoubleArrayElements': ReleaseDoubleArrayElements,
-        'GetBooleanArrayRegion': GetBooleanArrayRegion,
-        'GetByteArrayRegion': GetByteArrayRegion,
-        'GetCharArrayRegion': GetCharArrayRegion,
-        'GetShortArrayRegion': GetShortArrayRegion,
-        'GetIntArrayRegion': GetIntArrayRegion,
-        'GetLongArrayRegion': GetLongArrayRegion,
-        'GetFloatArrayRegion': GetFloatArrayRegion,
-        'GetDoubleArrayRegion': GetDoubleArrayRegion,
-        'SetBooleanArrayRegion': SetBooleanArrayRegion,
-        'SetByteArrayRegion': SetByteArrayRegion,
-        'SetCharArrayRegion': SetCharArrayRegion,
-        'SetShortArrayRegion': SetShortArrayRegion,
-        'SetIntArrayRegion': SetIntArrayRegion,
-        'SetLongArrayRegion': SetLongArrayRegion,
-        'SetFloatArrayRegion': SetFloatArrayRegion,
-        'SetDoubleArrayRegion': SetDoubleArrayRegion,
-        'RegisterNatives': RegisterNatives,
-        'UnregisterNatives': UnregisterNatives,
-        'MonitorEnter': MonitorEnter,
-        'MonitorExit': MonitorExit,
-        'GetJavaVM': GetJavaVM,
-        'GetStringRegion': GetStringRegion,
-        'GetStringUTFRegion': GetStringUTFRegion,
-        'GetPrimitiveArrayCritical': GetPrimitiveArrayCritical,
-        'ReleasePrimitiveArrayCritical': ReleasePrimitiveArrayCritical,
-        'GetStringCritical': GetStringCritical,
-        'ReleaseStringCritical': ReleaseStringCritical,
-        'NewWeakGlobalRef': NewWeakGlobalRef,
-        'DeleteWeakGlobalRef': DeleteWeakGlobalRef,
-        'ExceptionCheck': ExceptionCheck,
-        'NewDirectByteBuffer': NewDirectByteBuffer,
-        'GetDirectBufferAddress': GetDirectBufferAddress,
-        'GetDirectBufferCapacity': GetDirectBufferCapacity,
-        'GetObjectRefType': GetObjectRefType,
-    }
+    JNINativeInterface_name_to_simproc = JNI_PROCEDURES
 
     def __init__(self, project, analysis_center):
         super(JNINativeInterface, self).__init__(project.loader)
@@ -3190,10 +1239,13 @@ class JNINativeInterface(ExternObject):
         self._fptr_size = self._project.arch.bits / 8
         self._project.loader.add_object(self)
         self._analysis_center = analysis_center
+        # SimProcedures are copied on execution, so one instance per function serves all its hooks.
+        self._procedures = dict()
+        self._lock = threading.Lock()
+        self._return_unconstrained = angr.SIM_PROCEDURES['stubs']['ReturnUnconstrained']()
+        self._path_terminator = angr.SIM_PROCEDURES['stubs']['PathTerminator']()
         self._construct()
-        # Define JNINativeMethod Struct and then resolved in RegisterNatives SimProcedure.
-        angr.sim_type.define_struct('struct JNINativeMethod {const char* name;const char* signature;void* fnPtr;}')
-        angr.sim_type.parse_type('struct JNINativeMethod')
+        define_jni_structs()
 
     def _construct(self):
         # allocate memory for the fake JNINativeInterface struct
@@ -3203,36 +1255,59 @@ class JNINativeInterface(ExternObject):
         self._JNIEnv = self.allocate(self._fptr_size)
         self.memory.write_addr_at(self._JNIEnv - self.min_addr, self._JNINativeInterface)
 
-        # direct calls hook
-        for addr in self._project.loader.main_object.symbols_by_addr:
-            symb = self._project.loader.main_object.symbols_by_addr[addr]
-            if symb.name in self.JNINativeInterface_sig:
-                symb_name = symb.name
-                jni_native_interface_func_name = self.JNINativeInterface_sig[symb_name]
-                if jni_native_interface_func_name in self.JNINativeInterface_name_to_simproc:
-                    proc = self.JNINativeInterface_name_to_simproc[
-                        jni_native_interface_func_name](self._analysis_center)
-                    self._project.hook(addr, proc)
-                else:
-                    self._project.hook(addr, angr.SIM_PROCEDURES['stubs']['ReturnUnconstrained']())
+        # direct calls hook, the stubs are looked up by name instead of scanning all symbols of the binary
+        main_object = self._project.loader.main_object
+        for symb_name, name in self.JNINativeInterface_sig.iteritems():
+            symb = main_object.get_symbol(symb_name)
+            if symb is not None and symb.relative_addr:
+                self._hook(symb.rebased_addr, name)
 
         # iterate through the mapping
         for index, name in self.JNINativeInterface_index_to_name.iteritems():
+            addr = self.allocate(self._fptr_size)
             # if the mapped value is None (there are 4 reserved entries), hook it with PathTerminator
             if name.startswith('reserved'):
-                addr = self.allocate(self._fptr_size)
-                self._project.hook(addr, angr.SIM_PROCEDURES['stubs']['PathTerminator']())
+                self._project.hook(addr, self._path_terminator)
             else:
-                addr = self.allocate(self._fptr_size)
-                # if we have a custom simprocedure for that function, hook with that
-                if name in self.JNINativeInterface_name_to_simproc:
-                    proc = self.JNINativeInterface_name_to_simproc[name](self._analysis_center)
-                    self._project.hook(addr, proc)
-                # otherwise hook with ReturnUnconstrained
-                else:
-                    self._project.hook(addr, angr.SIM_PROCEDURES['stubs']['ReturnUnconstrained']())
+                self._hook(addr, name)
             self.memory.write_addr_at(self._JNINativeInterface - self.min_addr + index * self._fptr_size, addr)
 
+    def _hook(self, addr, name):
+        # if we have a custom simprocedure for that function, hook a placeholder creating it on first use
+        if name in self.JNINativeInterface_name_to_simproc:
+            self._project.hook(addr, LazyJNIProcedure(self, addr, name))
+        # otherwise hook with ReturnUnconstrained
+        else:
+            self._project.hook(addr, self._return_unconstrained)
+
+    def materialize(self, addr, name):
+        """
+        Replace the placeholder hooked at given address with the SimProcedure of the function.
+
+        :param int addr: Hooked address
+        :param str name: JNINativeInterface function name
+        :return: The SimProcedure
+        """
+        with self._lock:
+            proc = self._procedures.get(name)
+            if proc is None:
+                proc = self.JNINativeInterface_name_to_simproc[name](self._analysis_center)
+                self._procedures[name] = proc
+            if isinstance(self._project._sim_procedures.get(addr), LazyJNIProcedure):
+                self._project.hook(addr, proc, replace=True)
+            return proc
+
+    def bind(self, analysis_center):
+        """
+        Bind the hooked SimProcedures to another analysis center, so the hooks can be reused across analyses.
+
+        :param AnalysisCenter analysis_center: Analysis center of the next analysis
+        """
+        with self._lock:
+            self._analysis_center = analysis_center
+            for proc in self._procedures.itervalues():
+                proc._analysis_center = analysis_center
+
     @property
     def ptr(self):
         return self._JNIEnv
@@ -0,0 +1,41 @@
+import unittest
+
+import angr
+import pkg_resources
+
+from nativedroid.analyses.resolver.jni.java_type.primitive import JBoolean
+from nativedroid.analyses.resolver.jni.jni_type.jni_native_interface import *
+
+leak_so_file = pkg_resources.resource_filename('nativedroid.testdata', 'NativeLibs/native_leak/lib/armeabi/libleak.so')
+
+
+class JNINativeInterfaceTest(unittest.TestCase):
+    def testFunctionTable(self):
+        index_to_name = JNINativeInterface.JNINativeInterface_index_to_name
+        self.assertEqual(233, len(index_to_name))
+        self.assertEqual('GetVersion', index_to_name[4])
+        self.assertEqual('GetObjectRefType', index_to_name[232])
+        for name in index_to_name.itervalues():
+            if not name.startswith('reserved'):
+                self.assertEqual(name, JNINativeInterface.JNINativeInterface_name_to_simproc[name].__name__)
+
+    def testGeneratedProcedures(self):
+        proc = GetStaticBooleanField(None)
+        self.assertIs(JBoolean, proc.RETURN_TYPE)
+        self.assertEqual(3, proc.num_args)
+        self.assertEqual('GetStaticBooleanField', repr(proc))
+        self.assertEqual(5, SetDoubleArrayRegion(None).num_args)
+        self.assertIsInstance(CallStaticIntMethodV(None), CallStaticTypeMethod)
+        self.assertEqual('CallStaticIntMethodV', repr(CallStaticIntMethodV(None)))
+
+    def testLazyHooks(self):
+        project = angr.Project(leak_so_file, load_options={'main_opts': {'custom_base_addr': 0x0}})
+        jni_native_interface = JNINativeInterface(project, None)
+        addr = project.loader.memory.read_addr_at(jni_native_interface._JNINativeInterface + 6 * project.arch.bytes)
+        self.assertIsInstance(project.hooked_by(addr), LazyJNIProcedure)
+        self.assertEqual('FindClass', project.hooked_by(addr).display_name)
+        self.assertIsInstance(project.hooked_by(addr), FindClass)
+
+
+if __name__ == '__main__':
+    unittest.main()
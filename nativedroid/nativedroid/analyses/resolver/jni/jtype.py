@@ -1,3 +1,6 @@
+import threading
+import weakref
+
 from cle.backends.externs import ExternObject
 
 __author__ = "Xingwei Lin, Fengguo Wei"
@@ -5,26 +8,89 @@ __copyright__ = "Copyright 2018, The Argus-SAF Project"
 __license__ = "Apache v2.0"
 
 
-class JType(ExternObject):
+class JTypeRegion(ExternObject):
+    """
+    A large extern object registered to the loader once, JType handles are carved out of it.
+    """
+    def __init__(self, project, map_size):
+        super(JTypeRegion, self).__init__(project.loader, map_size)
+        self._provides = 'jtype_region'
+        project.loader.add_object(self)
+
+    def has_room(self, size, alignment):
+        return ((self.next_addr + alignment - 1) & ~(alignment - 1)) + size <= self.map_size
+
+
+class JTypeArena(object):
+    """
+    This class hands out JType handles of a project. Handles are distinct addresses within a few large regions,
+    so allocating one costs constant time and the loader only grows by one object per region_size bytes.
+
+    :param angr.project.Project project: angr project
+    :param int region_size: Size of each region
+    """
+
+    _arenas = weakref.WeakKeyDictionary()
+    _arenas_lock = threading.Lock()
+
+    def __init__(self, project, region_size=0x100000):
+        self._project = project
+        self._region_size = region_size
+        self._regions = list()
+        self._lock = threading.Lock()
+
+    @classmethod
+    def of(cls, project):
+        """
+        Get the arena of given project.
+
+        :param angr.project.Project project: angr project
+        :rtype: JTypeArena
+        """
+        with cls._arenas_lock:
+            arena = cls._arenas.get(project)
+            if arena is None:
+                arena = cls(project)
+                cls._arenas[project] = arena
+            return arena
+
+    @property
+    def regions(self):
+        return list(self._regions)
+
+    def allocate(self, size, alignment=8):
+        """
+        Allocate a handle.
+
+        :param int size: Bytes reserved for the handle
+        :param int alignment: Alignment of the handle
+        :return: Address of the handle
+        :rtype: int
+        """
+        with self._lock:
+            if not self._regions or not self._regions[-1].has_room(size, alignment):
+                self._regions.append(JTypeRegion(self._project, max(self._region_size, size)))
+            return self._regions[-1].allocate(size, alignment=alignment)
+
+
+class JType(object):
     """
     This class represents the java or jni types.
     """
-    def __init__(self, project, name, alloc_size=0x4000):
-        super(JType, self).__init__(project.loader)
+    def __init__(self, project, name, alloc_size=0x10):
         self._provides = name
         self._project = project
         self._alloc_size = alloc_size
         self._fptr_size = project.arch.bits / 8
-        # register before construct because of rebasing
-        self._project.loader.add_object(self)
         self._construct()
 
     def _construct(self):
         # allocate memory for the fake JType object
-        self._jtype = self.allocate(self._alloc_size)
-        # # allocate memory to a pointer and make it to point to the fake env
-        # self._JNIEnv_struct_ptr = self.allocate(self._fptr_size)
-        # self.memory.write_addr_at(self._JNIEnv_struct_ptr - self.min_addr, self._JNIEnv_struct)
+        self._jtype = JTypeArena.of(self._project).allocate(self._alloc_size)
+
+    @property
+    def provides(self):
+        return self._provides
 
     @property
     def ptr(self):
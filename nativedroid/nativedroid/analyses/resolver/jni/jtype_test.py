@@ -0,0 +1,29 @@
+import unittest
+
+import angr
+import pkg_resources
+
+from nativedroid.analyses.resolver.jni.java_type.reference import JObject
+from nativedroid.analyses.resolver.jni.java_type.primitive import JInt
+from nativedroid.analyses.resolver.jni.jtype import JTypeArena
+
+leak_so_file = pkg_resources.resource_filename('nativedroid.testdata', 'NativeLibs/native_leak/lib/armeabi/libleak.so')
+
+
+class JTypeTest(unittest.TestCase):
+    def testArena(self):
+        project = angr.Project(leak_so_file, load_options={'main_opts': {'custom_base_addr': 0x0}})
+        num_objects = len(project.loader.all_objects)
+        ptrs = set()
+        for _ in xrange(10000):
+            ptrs.add(JObject(project).ptr)
+            ptrs.add(JInt(project).ptr)
+        self.assertEqual(20000, len(ptrs))
+        self.assertEqual(1, len(JTypeArena.of(project).regions))
+        self.assertEqual(num_objects + 1, len(project.loader.all_objects))
+        region = JTypeArena.of(project).regions[0]
+        self.assertTrue(all(region.min_addr <= ptr < region.max_addr for ptr in ptrs))
+
+
+if __name__ == '__main__':
+    unittest.main()
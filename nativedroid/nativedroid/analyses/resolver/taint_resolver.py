@@ -1,3 +1,5 @@
+from nativedroid.analyses.taint_tags import tags_match
+
 __author__ = "Xingwei Lin"
 __copyright__ = "Copyright 2018, The Argus-SAF Project"
 __license__ = "Apache v2.0"
@@ -29,7 +31,7 @@ class TaintResolver(object):
         :param angr.sim_type.SimState input_state: SimState of current program point.
         :param list final_states: Fianl SimStates of current point.
         :param list positions: Taint argument candidates.
-        :param list tags: Taint tags.
+        :param int tags: Taint tag bits.
         :return: Tainted args
         :rtype: list
         """
@@ -52,9 +54,9 @@ class TaintResolver(object):
         """
         Is given situation tainted.
 
-        :param TaintAnnotation annotation: taint annotation
-        :param list tags: taint tags
+        :param JavaTypeAnnotation annotation: taint annotation
+        :param int tags: taint tag bits
         :return: is tainted
         :rtype: bool
         """
-        return annotation.label is 'TOP' or 'TOP' in tags or annotation.label in tags
+        return annotation.taint_info['is_taint'] and tags_match(annotation.taint_info.tag_bits, tags)
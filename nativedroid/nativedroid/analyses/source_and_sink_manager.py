@@ -1,9 +1,72 @@
+import os
 import re
+import threading
+
+from nativedroid.analyses.source_and_sink_matcher import SourceAndSinkMatcher
+from nativedroid.analyses.taint_tags import API_SINK, API_SOURCE, ICC_SINK, ICC_SOURCE, TAINT_KINDS, TAINT_TAGS, TOP
 
 __author__ = "Xingwei Lin, Fengguo Wei"
 __copyright__ = "Copyright 2018, The Argus-SAF Project"
 __license__ = "Apache v2.0"
 
+#                        1            2                   3            4
+_LINE_PATTERN = re.compile("([^\\s]+)\\s+([^\\s]+)?\\s*->\\s+([^\\s]+)\\s*([^\\s]+)?\\s*")
+
+
+def _compile_methods(methods):
+    matcher = SourceAndSinkMatcher()
+    for method in methods:
+        matcher.add(method if ';.' in method else '*.' + method, True)
+    return matcher
+
+
+class SourceAndSinkSpec(object):
+    """
+    Sources and sinks parsed from specification lines. A spec built from the source and sink files is compiled once
+    per process and then only read, see SourceAndSinkSpec.from_files. Taint tags are kept as bits of TAINT_TAGS.
+    """
+
+    _compiled = dict()
+    _compiled_lock = threading.Lock()
+
+    def __init__(self):
+        self.sources = SourceAndSinkMatcher()
+        self.sinks = SourceAndSinkMatcher()
+
+    @classmethod
+    def from_files(cls, *ss_files):
+        """
+        Get the compiled spec of given files. Files are parsed again only if they were modified.
+
+        :param ss_files: Source and sink file paths
+        :rtype: SourceAndSinkSpec
+        """
+        mtimes = tuple(os.path.getmtime(ss_file) for ss_file in ss_files)
+        with cls._compiled_lock:
+            compiled_mtimes, spec = cls._compiled.get(ss_files, (None, None))
+            if compiled_mtimes != mtimes:
+                spec = cls()
+                for ss_file in ss_files:
+                    with open(ss_file, 'r') as f:
+                        for line in f:
+                            spec.parse_line(line)
+                cls._compiled[ss_files] = (mtimes, spec)
+            return spec
+
+    def parse_line(self, line):
+        m = _LINE_PATTERN.match(line)
+        if m:
+            api_name = m.group(1)
+            taint_tag_raw = m.group(2)
+            taint_tags = TOP if not taint_tag_raw else TAINT_TAGS.bits([taint_tag_raw])
+            tag = m.group(3)
+            pos_raw = m.group(4)
+            positions = [1, 2, 3, 4, 5, 6, 7, 8, 9, 10] if not pos_raw else map(int, pos_raw.split('|'))
+            if tag == "_SOURCE_":
+                self.sources.add(api_name, taint_tags)
+            elif tag == "_SINK_":
+                self.sinks.add(api_name, (positions, taint_tags))
+
 
 class SourceAndSinkManager(object):
     """
@@ -13,27 +76,28 @@ class SourceAndSinkManager(object):
     means arg 1,2,3 of __android_log_print is the sink points if the taint_tag contains LOG or SENSITIVE_DATA.
     No arg specified means any arg could be the sink points. (Try up to 10.)
     No tait_tag specified means any tainted data could be matched.
+    API names may use class, package and method name wildcards, see SourceAndSinkMatcher.
+
+    The files are compiled once per process and shared by all managers. Rules added later, e.g. the taint results
+    of JNSaf, only go to the overlay of this manager, so concurrent analyses never see each other's rules.
 
     :param native_ss_file: Native source and sink file path
     :param java_ss_file: Java source and sink file path
     """
 
     def __init__(self, native_ss_file, java_ss_file):
-        #                              1            2                   3            4
-        self._prog = re.compile("([^\\s]+)\\s+([^\\s]+)?\\s*->\\s+([^\\s]+)\\s*([^\\s]+)?\\s*")
-        self._sources = {}
-        self._sinks = {}
-        self._parse(native_ss_file)
-        self._parse(java_ss_file)
+        self._base = SourceAndSinkSpec.from_files(native_ss_file, java_ss_file)
+        self._overlay = SourceAndSinkSpec()
 
     _ICC_SOURCE_METHODS = [
         'Landroid/content/Intent;.getStringArrayExtra:(Ljava/lang/String;)[Ljava/lang/String;',
-        'Landroid/content/Intent;.getStringArrayListExtra:(Ljava/lang/String;)Ljava/util/ArrayList;'
+        'Landroid/content/Intent;.getStringArrayListExtra:(Ljava/lang/String;)Ljava/util/ArrayList;',
         'Landroid/content/Intent;.getStringExtra:(Ljava/lang/String;)Ljava/lang/String;'
     ]
 
+    # Methods without class are matched on any class, e.g. startActivity of Context and Activity.
     _ICC_SINK_METHODS = [
-        'Landroid/content/Context;startService:(Landroid/content/Intent;)Landroid/content/ComponentName;',
+        'startService:(Landroid/content/Intent;)Landroid/content/ComponentName;',
         'bindService:(Landroid/content/Intent;Landroid/content/ServiceConnection;I)Z',
         'startActivity:(Landroid/content/Intent;)V',
         'startActivity:(Landroid/content/Intent;Landroid/os/Bundle;)V',
@@ -56,45 +120,46 @@ class SourceAndSinkManager(object):
         'Landroid/content/BroadcastReceiver;Landroid/os/Handler;ILjava/lang/String;Landroid/os/Bundle;)V'
     ]
 
-    #
-    # Private methods.
-    #
-    def _parse(self, sas_file):
-        for line in open(sas_file, 'r'):
-            self.parse_line(line)
+    _ICC_SOURCE_MATCHER = _compile_methods(_ICC_SOURCE_METHODS)
+    _ICC_SINK_MATCHER = _compile_methods(_ICC_SINK_METHODS)
 
     def parse_lines(self, lines):
         for line in lines.splitlines():
             self.parse_line(line)
 
     def parse_line(self, line):
-        m = self._prog.match(line)
-        if m:
-            api_name = m.group(1)
-            taint_tag_raw = m.group(2)
-            taint_tags = ['TOP'] if not taint_tag_raw else taint_tag_raw.split('|')
-            tag = m.group(3)
-            pos_raw = m.group(4)
-            positions = [1, 2, 3, 4, 5, 6, 7, 8, 9, 10] if not pos_raw else map(int, pos_raw.split('|'))
-            if tag == "_SOURCE_":
-                self._sources[api_name] = taint_tags
-            elif tag == "_SINK_":
-                self._sinks[api_name] = (positions, taint_tags)
+        self._overlay.parse_line(line)
 
     def is_source(self, name):
-        return name in self._sources
+        return self.get_source_tag_bits(name) is not None
 
     def is_sink(self, name):
-        return name in self._sinks
+        return self.get_sink_tag_bits(name) is not None
+
+    def get_source_tag_bits(self, name):
+        tags = self._overlay.sources.match(name)
+        return tags if tags is not None else self._base.sources.match(name)
+
+    def get_sink_tag_bits(self, name):
+        tags = self._overlay.sinks.match(name)
+        return tags if tags is not None else self._base.sinks.match(name)
 
     def get_source_tags(self, name):
-        return self._sources.get(name)
+        tags = self.get_source_tag_bits(name)
+        return TAINT_TAGS.names(tags) if tags is not None else None
 
     def get_sink_tags(self, name):
-        return self._sinks.get(name)
+        tags = self.get_sink_tag_bits(name)
+        return (tags[0], TAINT_TAGS.names(tags[1])) if tags is not None else None
+
+    def get_source_kind_bit(self, name):
+        return ICC_SOURCE if name in self._ICC_SOURCE_MATCHER else API_SOURCE
+
+    def get_sink_kind_bit(self, name):
+        return ICC_SINK if name in self._ICC_SINK_MATCHER else API_SINK
 
     def get_source_kind(self, name):
-        return 'icc_source' if name in self._ICC_SOURCE_METHODS else 'api_source'
+        return TAINT_KINDS.name(self.get_source_kind_bit(name))
 
     def get_sink_kind(self, name):
-        return 'icc_sink' if name in self._ICC_SINK_METHODS else 'api_sink'
+        return TAINT_KINDS.name(self.get_sink_kind_bit(name))
@@ -0,0 +1,39 @@
+import unittest
+import pkg_resources
+from nativedroid.analyses.source_and_sink_manager import *
+
+native_ss_file = pkg_resources.resource_filename('nativedroid.data', 'sourceAndSinks/NativeSourcesAndSinks.txt')
+java_ss_file = pkg_resources.resource_filename('nativedroid.data', 'sourceAndSinks/TaintSourcesAndSinks.txt')
+
+
+class SourceAndSinkManagerTest(unittest.TestCase):
+    def testSharedBase(self):
+        self.assertIs(SourceAndSinkSpec.from_files(native_ss_file, java_ss_file),
+                      SourceAndSinkSpec.from_files(native_ss_file, java_ss_file))
+        ssm = SourceAndSinkManager(native_ss_file, java_ss_file)
+        self.assertTrue(ssm.is_sink('__android_log_print'))
+        self.assertEqual(['SENSITIVE_INFO'],
+                         ssm.get_source_tags('Landroid/telephony/TelephonyManager;.getDeviceId:()Ljava/lang/String;'))
+
+    def testOverlay(self):
+        ssm = SourceAndSinkManager(native_ss_file, java_ss_file)
+        other = SourceAndSinkManager(native_ss_file, java_ss_file)
+        ssm.parse_lines('Lcom/example/Foo;.leak:(Ljava/lang/String;)V -> _SINK_ 1\n'
+                        '__android_log_print LOG -> _SINK_ 2')
+        self.assertEqual(([1], ['TOP']), ssm.get_sink_tags('Lcom/example/Foo;.leak:(Ljava/lang/String;)V'))
+        self.assertEqual(([2], ['LOG']), ssm.get_sink_tags('__android_log_print'))
+        self.assertFalse(other.is_sink('Lcom/example/Foo;.leak:(Ljava/lang/String;)V'))
+        self.assertEqual((range(1, 11), ['TOP']), other.get_sink_tags('__android_log_print'))
+
+    def testKinds(self):
+        ssm = SourceAndSinkManager(native_ss_file, java_ss_file)
+        self.assertEqual('icc_source',
+                         ssm.get_source_kind('Landroid/content/Intent;.getStringExtra:(Ljava/lang/String;)'
+                                             'Ljava/lang/String;'))
+        self.assertEqual('icc_sink',
+                         ssm.get_sink_kind('Landroid/app/Activity;.startActivity:(Landroid/content/Intent;)V'))
+        self.assertEqual('api_sink', ssm.get_sink_kind('Landroid/util/Log;.i:(Ljava/lang/String;Ljava/lang/String;)I'))
+
+
+if __name__ == '__main__':
+    unittest.main()
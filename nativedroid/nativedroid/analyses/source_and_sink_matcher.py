@@ -0,0 +1,164 @@
+import zlib
+
+__author__ = "Fengguo Wei"
+__copyright__ = "Copyright 2018, The Argus-SAF Project"
+__license__ = "Apache v2.0"
+
+WILDCARD = '*'
+
+
+class BloomFilter(object):
+    """
+    Bloom filter over strings, used as the negative path of the matcher: a miss means the key was never added.
+
+    :param int num_bits: Size of the bit array
+    :param int num_hashes: Number of probes per key
+    """
+
+    def __init__(self, num_bits=1 << 14, num_hashes=3):
+        self._num_bits = num_bits
+        self._num_hashes = num_hashes
+        self._bits = bytearray(num_bits >> 3)
+
+    def _probes(self, key):
+        h1 = zlib.crc32(key) & 0xffffffff
+        h2 = (zlib.adler32(key) & 0xffffffff) | 1
+        for i in xrange(self._num_hashes):
+            yield (h1 + i * h2) % self._num_bits
+
+    def add(self, key):
+        for bit in self._probes(key):
+            self._bits[bit >> 3] |= 1 << (bit & 7)
+
+    def __contains__(self, key):
+        for bit in self._probes(key):
+            if not self._bits[bit >> 3] & (1 << (bit & 7)):
+                return False
+        return True
+
+
+def split_signature(name):
+    """
+    Split a Java method signature like `Lpkg/Cls;.name:(I)V` into class and method part.
+
+    :param str name: Method signature or native function name
+    :return: (class part, method part), class part is None for native function names.
+    :rtype: tuple
+    """
+    index = name.find(';.')
+    if index < 0:
+        if name.startswith(WILDCARD + '.'):
+            return WILDCARD, name[2:]
+        return None, name
+    return name[:index + 1], name[index + 2:]
+
+
+class SourceAndSinkMatcher(object):
+    """
+    Matches method signatures and native function names against source or sink rules. Rules are indexed by full
+    name, by class and by method name. Besides exact names, a rule may use wildcards:
+
+    - `Lpkg/Cls;.*` any method of a class.
+    - `Lpkg/*;.name:sig` a method of any class under a package (including sub packages).
+    - `*.name:sig` a method of any class.
+    - `Lpkg/Cls;.get*` methods with name and signature starting with a prefix, in any of the class forms above.
+    - `__android_*` native functions starting with a prefix.
+
+    When several rules match, the most specific wins: exact name, then class, then the longest package and then
+    any class. Names which share no class, package or method with any rule are rejected by a Bloom filter.
+    """
+
+    def __init__(self):
+        self._exact = dict()
+        # class -> [(method pattern, value)]
+        self._classes = dict()
+        # package prefix -> [(method pattern, value)]
+        self._packages = dict()
+        # method name -> value, for rules of any class
+        self._methods = dict()
+        # [(method prefix, value)], for prefix rules of any class
+        self._method_prefixes = list()
+        # [(name prefix, value)], for prefix rules of native functions
+        self._native_prefixes = list()
+        self._filter = BloomFilter()
+
+    def __contains__(self, name):
+        return self.match(name) is not None
+
+    @staticmethod
+    def _method_matches(pattern, method):
+        if pattern.endswith(WILDCARD):
+            return method.startswith(pattern[:-1])
+        return pattern == method
+
+    def add(self, pattern, value):
+        """
+        Add a rule, a later rule with the same pattern replaces the former one.
+
+        :param str pattern: Exact or wildcard name
+        :param value: Value returned on match
+        """
+        class_part, method_part = split_signature(pattern)
+        if WILDCARD not in pattern:
+            self._exact[pattern] = value
+            self._filter.add(pattern)
+        elif class_part is None:
+            self._native_prefixes.insert(0, (pattern.rstrip(WILDCARD), value))
+        elif class_part == WILDCARD:
+            if method_part.endswith(WILDCARD):
+                self._method_prefixes.append((method_part[:-1], value))
+            else:
+                self._methods[method_part] = value
+                self._filter.add(method_part)
+        elif class_part.endswith('/' + WILDCARD + ';'):
+            package = class_part[:-2]
+            self._packages.setdefault(package, list()).insert(0, (method_part, value))
+            self._filter.add(package)
+        else:
+            self._classes.setdefault(class_part, list()).insert(0, (method_part, value))
+            self._filter.add(class_part)
+
+    def _packages_of(self, class_part):
+        index = class_part.find('/')
+        while index >= 0:
+            yield class_part[:index + 1]
+            index = class_part.find('/', index + 1)
+
+    def match(self, name):
+        """
+        Find the value of the most specific rule matching name.
+
+        :param str name: Method signature or native function name
+        :return: Value of the rule, None if no rule matches.
+        """
+        if not name:
+            return None
+        class_part, method_part = split_signature(name)
+        if class_part is None:
+            if name in self._filter and name in self._exact:
+                return self._exact[name]
+            for prefix, value in self._native_prefixes:
+                if name.startswith(prefix):
+                    return value
+            return None
+        candidates = [name, class_part, method_part]
+        packages = list(self._packages_of(class_part)) if self._packages else list()
+        if not self._method_prefixes and not any(key in self._filter for key in candidates + packages):
+            return None
+        value = self._exact.get(name)
+        if value is not None:
+            return value
+        for pattern, value in self._classes.get(class_part, ()):
+            if self._method_matches(pattern, method_part):
+                return value
+        for package in reversed(packages):
+            for pattern, value in self._packages.get(package, ()):
+                if self._method_matches(pattern, method_part):
+                    return value
+        value = self._methods.get(method_part)
+        if value is not None:
+            return value
+        for prefix, value in self._method_prefixes:
+            if method_part.startswith(prefix):
+                return value
+        return None
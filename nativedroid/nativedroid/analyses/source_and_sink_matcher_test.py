@@ -0,0 +1,38 @@
+import unittest
+from nativedroid.analyses.source_and_sink_matcher import *
+
+
+class SourceAndSinkMatcherTest(unittest.TestCase):
+    def setUp(self):
+        self.matcher = SourceAndSinkMatcher()
+        self.matcher.add('Landroid/telephony/TelephonyManager;.getDeviceId:()Ljava/lang/String;', 'exact')
+        self.matcher.add('Landroid/location/Location;.*', 'class')
+        self.matcher.add('Landroid/accounts/*;.getPassword:(Landroid/accounts/Account;)Ljava/lang/String;', 'package')
+        self.matcher.add('*.sendTextMessage*', 'method')
+        self.matcher.add('__android_log_print', 'native')
+
+    def testExact(self):
+        self.assertEqual('exact', self.matcher.match(
+            'Landroid/telephony/TelephonyManager;.getDeviceId:()Ljava/lang/String;'))
+        self.assertEqual('native', self.matcher.match('__android_log_print'))
+
+    def testWildcards(self):
+        self.assertEqual('class', self.matcher.match('Landroid/location/Location;.getLatitude:()D'))
+        self.assertEqual('package', self.matcher.match(
+            'Landroid/accounts/sub/AccountManager;.getPassword:(Landroid/accounts/Account;)Ljava/lang/String;'))
+        self.assertEqual('method', self.matcher.match(
+            'Landroid/telephony/gsm/SmsManager;.sendTextMessage:(Ljava/lang/String;)V'))
+
+    def testMostSpecificWins(self):
+        self.matcher.add('Landroid/location/Location;.getTime:()J', 'exact')
+        self.assertEqual('exact', self.matcher.match('Landroid/location/Location;.getTime:()J'))
+
+    def testNoMatch(self):
+        self.assertIsNone(self.matcher.match('Ljava/lang/String;.length:()I'))
+        self.assertIsNone(self.matcher.match('Landroid/accounts/Account;.toString:()Ljava/lang/String;'))
+        self.assertIsNone(self.matcher.match('strlen'))
+        self.assertIsNone(self.matcher.match(None))
+
+
+if __name__ == '__main__':
+    unittest.main()
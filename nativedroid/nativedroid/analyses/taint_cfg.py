@@ -0,0 +1,54 @@
+from angr.analyses.cfg.cfg_accurate import CFGAccurate
+
+__author__ = "Fengguo Wei"
+__copyright__ = "Copyright 2018, The Argus-SAF Project"
+__license__ = "Apache v2.0"
+
+
+class TaintCFGAccurate(CFGAccurate):
+    """
+    CFGAccurate which hands the input and final states of every traced block to a TaintSiteIndex as soon as they are
+    produced. The index only keeps the register annotations it needs, so the states of a node are dropped once it is
+    recorded. The CFG is still built with keep_state: without it CFGAccurate replaces hooked SimProcedures which do
+    not add exits, such as the JNI models, with ReturnUnconstrained and their annotations would never be produced.
+    Every traced block is charged to the budget, the CFG is aborted as soon as the budget is exhausted and keeps what
+    it recovered so far.
+
+    :param TaintSiteIndex taint_sites: Index to record to, None to keep the states of all nodes as keep_state asks
+    :param AnalysisBudget budget: Budget of the analysis, None for unlimited
+    """
+
+    def __init__(self, taint_sites=None, budget=None, **kwargs):
+        # CFGAccurate analyzes in its constructor.
+        self._taint_sites = taint_sites
+        self._budget = budget
+        if taint_sites is not None:
+            kwargs['keep_state'] = True
+        if budget is None:
+            super(TaintCFGAccurate, self).__init__(**kwargs)
+        else:
+            with budget.tracing():
+                super(TaintCFGAccurate, self).__init__(**kwargs)
+
+    def _get_successors(self, job):
+        successors = super(TaintCFGAccurate, self)._get_successors(job)
+        sim_successors = job.sim_successors
+        if self._taint_sites is not None and sim_successors is not None:
+            fn = self.kb.functions.get(job.addr) if job.addr == job.func_addr else None
+            self._taint_sites.add_node(job.cfg_node, sim_successors.initial_state,
+                                       sim_successors.flat_successors + sim_successors.unconstrained_successors,
+                                       fn.name if fn else None)
+            if job.cfg_node is not None:
+                job.cfg_node.downsize()
+        if self._budget is not None:
+            instructions = len(job.cfg_node.instruction_addrs) if job.cfg_node is not None else 0
+            live_states = len(self._job_info_queue) + len(self._pending_jobs) + len(successors)
+            if self._budget.charge(instructions, live_states) is not None:
+                self.abort()
+        return successors
+
+    def _post_analysis(self):
+        super(TaintCFGAccurate, self)._post_analysis()
+        if self._taint_sites is not None:
+            # Path terminators get an entry state with keep_state.
+            self.downsize()
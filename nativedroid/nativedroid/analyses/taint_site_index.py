@@ -0,0 +1,162 @@
+import logging
+from collections import OrderedDict
+
+from nativedroid.analyses.resolver.annotation import JmethodIDAnnotation
+from nativedroid.analyses.resolver.jni.jni_helper import count_arg_nums
+
+__author__ = "Fengguo Wei"
+__copyright__ = "Copyright 2018, The Argus-SAF Project"
+__license__ = "Apache v2.0"
+
+nativedroid_logger = logging.getLogger('nativedroid.taint_site_index')
+nativedroid_logger.setLevel(logging.INFO)
+
+# Registers passing arguments on ARM, further arguments are passed on the stack.
+_ARGUMENT_REGISTERS = 4
+
+
+def _method_id_index(name):
+    if name.startswith('CallStatic'):
+        return 1
+    if name.startswith('CallNonvirtual'):
+        return 3
+    return 2
+
+
+def _call_registers(name, state):
+    """
+    Number of registers of a Call*Method call holding its return value, receiver, method ID and arguments.
+    """
+    idx = _method_id_index(name)
+    if name.endswith('V') or name.endswith('A'):
+        # The arguments are passed as va_list or jvalue array.
+        return min(_ARGUMENT_REGISTERS, idx + 2)
+    for annotation in state.regs.get('r%d' % idx).annotations:
+        if isinstance(annotation, JmethodIDAnnotation) and annotation.method_signature:
+            return min(_ARGUMENT_REGISTERS, idx + 1 + count_arg_nums(annotation.method_signature))
+    return _ARGUMENT_REGISTERS
+
+
+class TaintSiteIndex(object):
+    """
+    The register annotations at the sites taint post processing looks at: the return sites of the JNI function, the
+    Call*Method SimProcedures and the calls to sinks. Nodes are either added while the CFG is built, see
+    TaintCFGAccurate, or in one pass over a CFG which kept its states, so the collectors only touch the interesting
+    nodes.
+
+    Sites are keyed by the block ID of their CFG node. A node traced again replaces what was recorded for it, so
+    every site holds the annotations of the last visit of its node, which are the states a CFG built with
+    keep_state keeps. Both ways of indexing give the same sites.
+
+    :param int jni_method_addr: Address of the JNI function
+    :param SourceAndSinkManager ssm: Source and sink manager
+    :param TaintResolver resolver: Taint resolver of the architecture
+    """
+
+    def __init__(self, jni_method_addr=None, ssm=None, resolver=None):
+        self._jni_method_addr = jni_method_addr
+        self._ssm = ssm
+        self._resolver = resolver
+        self._return_sites = OrderedDict()
+        self._call_sites = OrderedDict()
+        self._sink_sites = OrderedDict()
+
+    @classmethod
+    def from_cfg(cls, cfg, jni_method_addr, ssm, resolver):
+        """
+        Index a CFG built with keep_state.
+
+        :param cfg: CFGAccurate
+        :param int jni_method_addr: Address of the JNI function
+        :param SourceAndSinkManager ssm: Source and sink manager
+        :param TaintResolver resolver: Taint resolver of the architecture
+        :rtype: TaintSiteIndex
+        """
+        index = cls(jni_method_addr, ssm, resolver)
+        for node in cfg.nodes():
+            fn = cfg.kb.functions.get(node.addr)
+            index.add_node(node, node.input_state, node.final_states, fn.name if fn else None)
+        return index
+
+    @staticmethod
+    def _flatten(sites):
+        return [annotation for annotations in sites.itervalues() for annotation in annotations]
+
+    @staticmethod
+    def _record(sites, block_id, annotations):
+        if annotations:
+            sites[block_id] = annotations
+        else:
+            sites.pop(block_id, None)
+
+    @property
+    def return_annotations(self):
+        """
+        Annotations of r0 at the return sites.
+        """
+        return self._flatten(self._return_sites)
+
+    @property
+    def call_annotations(self):
+        """
+        Annotations of the registers used by the Call*Method calls.
+        """
+        return self._flatten(self._call_sites)
+
+    @property
+    def sink_annotations(self):
+        """
+        Annotations of the tainted arguments of the calls to sinks.
+        """
+        return self._flatten(self._sink_sites)
+
+    def add_node(self, node, input_state, final_states, function_name=None):
+        """
+        Record the sites of a traced CFG node.
+
+        :param node: CFGNode
+        :param input_state: Input state of the node
+        :param list final_states: Final states of the node
+        :param str function_name: Name of the function starting at the node, if any
+        """
+        if node.is_simprocedure:
+            if node.name and node.name.startswith('Call'):
+                self.add_call_site(node.block_id, node.name, final_states)
+        elif node.function_address == self._jni_method_addr:
+            self.add_return_site(node.block_id, final_states)
+        if function_name:
+            sink_tags = self._ssm.get_sink_tag_bits(function_name)
+            if sink_tags is not None:
+                self.add_sink_site(node.block_id, input_state, final_states, *sink_tags)
+
+    def add_return_site(self, block_id, final_states):
+        """
+        Record r0 of the final states leaving the JNI function, final states of other exits are ignored.
+        """
+        annotations = list()
+        for final_state in final_states:
+            if final_state.history.jumpkind == 'Ijk_Ret':
+                annotations.extend(final_state.regs.r0.annotations)
+        self._record(self._return_sites, block_id, annotations)
+
+    def add_call_site(self, block_id, name, final_states):
+        """
+        Record the registers of a Call*Method SimProcedure used by the call.
+        """
+        annotations = list()
+        for final_state in final_states:
+            for reg in xrange(_call_registers(name, final_state)):
+                annotations.extend(final_state.regs.get('r%d' % reg).annotations)
+        self._record(self._call_sites, block_id, annotations)
+
+    def add_sink_site(self, block_id, input_state, final_states, positions, tags):
+        """
+        Record the tainted arguments of a call to a sink.
+        """
+        annotations = list()
+        args = self._resolver.get_taint_args(input_state, final_states, positions, tags)
+        if args:
+            nativedroid_logger.debug('tainted: %s, belong_obj: %s', args, final_states[0].regs.r0)
+            for arg in args:
+                annotations.extend(arg.annotations)
+        self._record(self._sink_sites, block_id, annotations)
@@ -0,0 +1,109 @@
+import unittest
+
+from nativedroid.analyses.resolver.annotation import *
+from nativedroid.analyses.taint_site_index import TaintSiteIndex
+
+
+class _Value(object):
+    def __init__(self, *annotations):
+        self.annotations = annotations
+
+
+class _Registers(object):
+    def __init__(self, values):
+        self._values = values
+
+    def get(self, name):
+        return self._values.get(name, _Value())
+
+    @property
+    def r0(self):
+        return self.get('r0')
+
+
+class _History(object):
+    def __init__(self, jumpkind):
+        self.jumpkind = jumpkind
+
+
+class _State(object):
+    def __init__(self, jumpkind='Ijk_Ret', **values):
+        self.regs = _Registers(values)
+        self.history = _History(jumpkind)
+
+
+class _Node(object):
+    def __init__(self, name, is_simprocedure, function_address, addr=None):
+        self.name = name
+        self.is_simprocedure = is_simprocedure
+        self.function_address = function_address
+        self.addr = function_address if addr is None else addr
+        self.block_id = self.addr
+
+
+class _Resolver(object):
+    def get_taint_args(self, input_state, final_states, positions, tags):
+        return [input_state.regs.get('r%d' % position) for position in positions]
+
+
+class _SourceAndSinkManager(object):
+    def get_sink_tag_bits(self, name):
+        return ([1], 1) if name == '__android_log_print' else None
+
+
+class TaintSiteIndexTest(unittest.TestCase):
+    def testReturnSite(self):
+        ret = JstringAnnotation('from_native', 'value')
+        index = TaintSiteIndex()
+        index.add_return_site(0x1000, [_State(r0=_Value(ret)),
+                                       _State('Ijk_Boring', r0=_Value(JintAnnotation('arg1')))])
+        self.assertEqual([ret], index.return_annotations)
+
+    def testReturnSiteRevisited(self):
+        first = JstringAnnotation('from_native', 'first')
+        second = JstringAnnotation('from_native', 'second')
+        other = JstringAnnotation('from_native', 'other')
+        index = TaintSiteIndex(0x1000)
+        index.add_node(_Node(None, False, 0x1000, 0x1010), _State(), [_State(r0=_Value(first))])
+        index.add_node(_Node(None, False, 0x1000, 0x1020), _State(), [_State(r0=_Value(other))])
+        index.add_node(_Node(None, False, 0x1000, 0x1010), _State(), [_State(r0=_Value(second))])
+        self.assertEqual([second, other], index.return_annotations)
+
+    def testSinkSiteRevisited(self):
+        first = JstringAnnotation('arg1')
+        second = JstringAnnotation('arg2')
+        index = TaintSiteIndex(0x1000, _SourceAndSinkManager(), _Resolver())
+        log = _Node('__android_log_print', True, 0x3000)
+        index.add_node(log, _State(r1=_Value(first)), [_State()], '__android_log_print')
+        index.add_node(log, _State(r1=_Value(second)), [_State()], '__android_log_print')
+        self.assertEqual([second], index.sink_annotations)
+        index.add_node(log, _State(), [_State()], '__android_log_print')
+        self.assertEqual([], index.sink_annotations)
+
+    def testCallSite(self):
+        method_id = JmethodIDAnnotation('org/arguslab/Foo', 'leak', '(Ljava/lang/String;)V')
+        arg = JstringAnnotation('arg1')
+        saved = JstringAnnotation('arg2')
+        index = TaintSiteIndex()
+        index.add_call_site(0x1000, 'CallVoidMethod', [_State(r2=_Value(method_id), r3=_Value(arg), r4=_Value(saved))])
+        self.assertEqual([method_id, arg], index.call_annotations)
+        index = TaintSiteIndex()
+        index.add_call_site(0x1000, 'CallStaticVoidMethodV',
+                            [_State(r1=_Value(method_id), r2=_Value(arg), r3=_Value(saved))])
+        self.assertEqual([method_id, arg], index.call_annotations)
+
+    def testAddNode(self):
+        index = TaintSiteIndex(0x1000, _SourceAndSinkManager(), _Resolver())
+        ret = JstringAnnotation('from_native', 'value')
+        arg = JstringAnnotation('arg1')
+        index.add_node(_Node(None, False, 0x1000), _State(), [_State(r0=_Value(ret))])
+        index.add_node(_Node(None, False, 0x2000), _State(), [_State(r0=_Value(arg))])
+        index.add_node(_Node('__android_log_print', True, 0x3000), _State(r1=_Value(arg)), [_State()],
+                       '__android_log_print')
+        self.assertEqual([ret], index.return_annotations)
+        self.assertEqual([arg], index.sink_annotations)
+        self.assertEqual([], index.call_annotations)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,119 @@
+import threading
+
+__author__ = "Fengguo Wei"
+__copyright__ = "Copyright 2018, The Argus-SAF Project"
+__license__ = "Apache v2.0"
+
+
+class TagRegistry(object):
+    """
+    Interns tag names into single bit integers, so sets of tags are bitsets: membership, union and matching are
+    integer operations. Names are only needed again when a report is rendered.
+
+    :param list names: Names to intern up front
+    """
+
+    def __init__(self, names=()):
+        self._bits = dict()
+        self._names = list()
+        self._lock = threading.Lock()
+        for name in names:
+            self.bit(name)
+
+    def bit(self, name):
+        """
+        Get the bit of given name, interning it if it is new.
+
+        :param str name: Tag name
+        :rtype: int
+        """
+        bit = self._bits.get(name)
+        if bit is None:
+            with self._lock:
+                bit = self._bits.get(name)
+                if bit is None:
+                    bit = 1 << len(self._names)
+                    self._names.append(name)
+                    self._bits[name] = bit
+        return bit
+
+    def bits(self, names):
+        """
+        Get the bitset of given names, names joined by `|` are split.
+
+        :param names: Iterable of names, or None
+        :rtype: int
+        """
+        bits = 0
+        for name in names or ():
+            for part in name.split('|'):
+                if part:
+                    bits |= self.bit(part)
+        return bits
+
+    def name(self, bit):
+        """
+        Get the name of a single bit.
+
+        :param int bit: Bit
+        :return: Name, None for 0
+        """
+        if not bit:
+            return None
+        return self._names[bit.bit_length() - 1]
+
+    def names(self, bits):
+        """
+        Get the names of a bitset in interning order.
+
+        :param int bits: Bitset
+        :rtype: list
+        """
+        names = list()
+        index = 0
+        while bits:
+            if bits & 1:
+                names.append(self._names[index])
+            bits >>= 1
+            index += 1
+        return names
+
+
+# Taint tags of the source and sink specifications, TOP matches any tag.
+TAINT_TAGS = TagRegistry(['TOP', 'SENSITIVE_INFO'])
+TOP = TAINT_TAGS.bit('TOP')
+SENSITIVE_INFO = TAINT_TAGS.bit('SENSITIVE_INFO')
+
+
+def tags_match(tags, other):
+    """
+    Whether two tag bitsets share a tag, TOP on either side matches everything.
+
+    :param int tags: Tag bitset
+    :param int other: Tag bitset
+    :rtype: bool
+    """
+    return bool(tags & other or (tags | other) & TOP)
+
+
+# Roles and origins of a taint, i.e. both elements of the former taint_type list.
+TAINT_TYPES = TagRegistry(['_SOURCE_', '_SINK_', '_API_', '_ARGUMENT_', '_ARGUMENT_FIELD_', '_ARGUMENT_ELEMENT_',
+                           '_CLASS_FIELD_', '_STMT_'])
+SOURCE = TAINT_TYPES.bit('_SOURCE_')
+SINK = TAINT_TYPES.bit('_SINK_')
+API = TAINT_TYPES.bit('_API_')
+ARGUMENT = TAINT_TYPES.bit('_ARGUMENT_')
+ARGUMENT_FIELD = TAINT_TYPES.bit('_ARGUMENT_FIELD_')
+ARGUMENT_ELEMENT = TAINT_TYPES.bit('_ARGUMENT_ELEMENT_')
+CLASS_FIELD = TAINT_TYPES.bit('_CLASS_FIELD_')
+STMT = TAINT_TYPES.bit('_STMT_')
+# Origins which come from the arguments of the analyzed method.
+FROM_ARGUMENT = ARGUMENT | ARGUMENT_FIELD | ARGUMENT_ELEMENT
+
+# Source and sink kinds reported to JNSaf.
+TAINT_KINDS = TagRegistry(['api_source', 'icc_source', 'string_source', 'api_sink', 'icc_sink'])
+API_SOURCE = TAINT_KINDS.bit('api_source')
+ICC_SOURCE = TAINT_KINDS.bit('icc_source')
+STRING_SOURCE = TAINT_KINDS.bit('string_source')
+API_SINK = TAINT_KINDS.bit('api_sink')
+ICC_SINK = TAINT_KINDS.bit('icc_sink')
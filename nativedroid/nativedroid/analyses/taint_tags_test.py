@@ -0,0 +1,32 @@
+import unittest
+
+from nativedroid.analyses.taint_tags import *
+
+
+class TaintTagsTest(unittest.TestCase):
+    def testRegistry(self):
+        registry = TagRegistry(['A', 'B'])
+        self.assertEqual(1, registry.bit('A'))
+        self.assertEqual(4, registry.bit('C'))
+        self.assertEqual(7, registry.bits(['A|B', 'C']))
+        self.assertEqual(0, registry.bits(None))
+        self.assertEqual('C', registry.name(4))
+        self.assertIsNone(registry.name(0))
+        self.assertEqual(['A', 'C'], registry.names(5))
+
+    def testTagsMatch(self):
+        log = TAINT_TAGS.bit('LOG')
+        self.assertTrue(tags_match(SENSITIVE_INFO, SENSITIVE_INFO | log))
+        self.assertTrue(tags_match(TOP, log))
+        self.assertTrue(tags_match(log, TOP))
+        self.assertFalse(tags_match(SENSITIVE_INFO, log))
+
+    def testTypes(self):
+        self.assertTrue(ARGUMENT_FIELD & FROM_ARGUMENT)
+        self.assertFalse(API & FROM_ARGUMENT)
+        self.assertEqual(['_SOURCE_', '_API_'], TAINT_TYPES.names(SOURCE | API))
+        self.assertEqual('icc_sink', TAINT_KINDS.name(ICC_SINK))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -20,13 +20,72 @@ DESCRIPTOR = _descriptor.FileDescriptor(
   name='nativedroid/protobuf/nativedroid_grpc.proto',
   package='nativedroid_server',
   syntax='proto3',
-  serialized_pb=_b('\n+nativedroid/protobuf/nativedroid_grpc.proto\x12\x12nativedroid_server\x1a*nativedroid/protobuf/java_signatures.proto\"\xce\x01\n\x11GenSummaryRequest\x12\x12\n\napk_digest\x18\x01 \x01(\t\x12\x16\n\x0e\x63omponent_name\x18\x02 \x01(\t\x12\r\n\x05\x64\x65pth\x18\x03 \x01(\x05\x12\x11\n\tso_digest\x18\x04 \x01(\t\x12\x12\n\x08jni_func\x18\x05 \x01(\tH\x00\x12\x0e\n\x04\x61\x64\x64r\x18\x06 \x01(\x03H\x00\x12\x34\n\x10method_signature\x18\x07 \x01(\x0b\x32\x1a.jawa_core.MethodSignatureB\x11\n\x0fname_or_address\"S\n\x12GenSummaryResponse\x12\r\n\x05taint\x18\x01 \x01(\t\x12\x0f\n\x07summary\x18\x02 \x01(\t\x12\x1d\n\x15\x61nalyzed_instructions\x18\x03 \x01(\x03\"1\n\x1cGetDynamicRegisterMapRequest\x12\x11\n\tso_digest\x18\x01 \x01(\t\"3\n\tMethodMap\x12\x13\n\x0bmethod_name\x18\x01 \x01(\t\x12\x11\n\tfunc_addr\x18\x02 \x01(\x03\"R\n\x1dGetDynamicRegisterMapResponse\x12\x31\n\nmethod_map\x18\x01 \x03(\x0b\x32\x1d.nativedroid_server.MethodMap\"5\n\x10HasSymbolRequest\x12\x11\n\tso_digest\x18\x01 \x01(\t\x12\x0e\n\x06symbol\x18\x02 \x01(\t\"\'\n\x11HasSymbolResponse\x12\x12\n\nhas_symbol\x18\x01 \x01(\x08\"s\n\x1c\x41nalyseNativeActivityRequest\x12\x12\n\napk_digest\x18\x01 \x01(\t\x12\x16\n\x0e\x63omponent_name\x18\x02 \x01(\t\x12\x11\n\tso_digest\x18\x03 \x01(\t\x12\x14\n\x0c\x63ustom_entry\x18\x04 \x01(\t\";\n\x1d\x41nalyseNativeActivityResponse\x12\x1a\n\x12total_instructions\x18\x01 \x01(\x03\"#\n\x11LoadBinaryRequest\x12\x0e\n\x06\x62uffer\x18\x01 \x01(\x0c\"7\n\x12LoadBinaryResponse\x12\x11\n\tso_digest\x18\x01 \x01(\t\x12\x0e\n\x06length\x18\x02 \x01(\x05\x32\x9f\x04\n\x0bNativeDroid\x12[\n\nGenSummary\x12%.nativedroid_server.GenSummaryRequest\x1a&.nativedroid_server.GenSummaryResponse\x12|\n\x15GetDynamicRegisterMap\x12\x30.nativedroid_server.GetDynamicRegisterMapRequest\x1a\x31.nativedroid_server.GetDynamicRegisterMapResponse\x12X\n\tHasSymbol\x12$.nativedroid_server.HasSymbolRequest\x1a%.nativedroid_server.HasSymbolResponse\x12|\n\x15\x41nalyseNativeActivity\x12\x30.nativedroid_server.AnalyseNativeActivityRequest\x1a\x31.nativedroid_server.AnalyseNativeActivityResponse\x12]\n\nLoadBinary\x12%.nativedroid_server.LoadBinaryRequest\x1a&.nativedroid_server.LoadBinaryResponse(\x01\x42\x1e\n\x1corg.argus.nativedroid.serverb\x06proto3')
+  serialized_pb=_b('\n+nativedroid/protobuf/nativedroid_grpc.proto\x12\x12nativedroid_server\x1a*nativedroid/protobuf/java_signatures.proto\"r\n\x06\x42udget\x12\x12\n\ntime_limit\x18\x01 \x01(\x01\x12\x18\n\x10max_instructions\x18\x02 \x01(\x03\x12\x12\n\nmax_states\x18\x03 \x01(\x05\x12\x12\n\nmax_memory\x18\x04 \x01(\x03\x12\x12\n\ncall_depth\x18\x05 \x01(\x05\"\xfa\x01\n\x11GenSummaryRequest\x12\x12\n\napk_digest\x18\x01 \x01(\t\x12\x16\n\x0e\x63omponent_name\x18\x02 \x01(\t\x12\r\n\x05\x64\x65pth\x18\x03 \x01(\x05\x12\x11\n\tso_digest\x18\x04 \x01(\t\x12\x12\n\x08jni_func\x18\x05 \x01(\tH\x00\x12\x0e\n\x04\x61\x64\x64r\x18\x06 \x01(\x03H\x00\x12\x34\n\x10method_signature\x18\x07 \x01(\x0b\x32\x1a.jawa_core.MethodSignature\x12*\n\x06\x62udget\x18\x08 \x01(\x0b\x32\x1a.nativedroid_server.BudgetB\x11\n\x0fname_or_address\"d\n\x12GenSummaryResponse\x12\r\n\x05taint\x18\x01 \x01(\t\x12\x0f\n\x07summary\x18\x02 \x01(\t\x12\x1d\n\x15\x61nalyzed_instructions\x18\x03 \x01(\x03\x12\x0f\n\x07partial\x18\x04 \x01(\x08\"x\n\tJniMethod\x12\x12\n\x08jni_func\x18\x01 \x01(\tH\x00\x12\x0e\n\x04\x61\x64\x64r\x18\x02 \x01(\x03H\x00\x12\x34\n\x10method_signature\x18\x03 \x01(\x0b\x32\x1a.jawa_core.MethodSignatureB\x11\n\x0fname_or_address\"\xbf\x01\n\x13GenSummariesRequest\x12\x12\n\napk_digest\x18\x01 \x01(\t\x12\x16\n\x0e\x63omponent_name\x18\x02 \x01(\t\x12\r\n\x05\x64\x65pth\x18\x03 \x01(\x05\x12\x11\n\tso_digest\x18\x04 \x01(\t\x12.\n\x07methods\x18\x05 \x03(\x0b\x32\x1d.nativedroid_server.JniMethod\x12*\n\x06\x62udget\x18\x06 \x01(\x0b\x32\x1a.nativedroid_server.Budget\"n\n\x14GenSummariesResponse\x12\r\n\x05index\x18\x01 \x01(\x05\x12\x38\n\x08response\x18\x02 \x01(\x0b\x32&.nativedroid_server.GenSummaryResponse\x12\r\n\x05\x65rror\x18\x03 \x01(\t\"1\n\x1cGetDynamicRegisterMapRequest\x12\x11\n\tso_digest\x18\x01 \x01(\t\"3\n\tMethodMap\x12\x13\n\x0bmethod_name\x18\x01 \x01(\t\x12\x11\n\tfunc_addr\x18\x02 \x01(\x03\"R\n\x1dGetDynamicRegisterMapResponse\x12\x31\n\nmethod_map\x18\x01 \x03(\x0b\x32\x1d.nativedroid_server.MethodMap\"5\n\x10HasSymbolRequest\x12\x11\n\tso_digest\x18\x01 \x01(\t\x12\x0e\n\x06symbol\x18\x02 \x01(\t\"\'\n\x11HasSymbolResponse\x12\x12\n\nhas_symbol\x18\x01 \x01(\x08\"7\n\x11HasSymbolsRequest\x12\x11\n\tso_digest\x18\x01 \x01(\t\x12\x0f\n\x07symbols\x18\x02 \x03(\t\"(\n\x12HasSymbolsResponse\x12\x12\n\nhas_symbol\x18\x01 \x03(\x08\".\n\x19ListJniEntryPointsRequest\x12\x11\n\tso_digest\x18\x01 \x01(\t\"G\n\x1aListJniEntryPointsResponse\x12\x10\n\x08jni_func\x18\x01 \x03(\t\x12\x17\n\x0fhas_jni_on_load\x18\x02 \x01(\x08\"s\n\x1c\x41nalyseNativeActivityRequest\x12\x12\n\napk_digest\x18\x01 \x01(\t\x12\x16\n\x0e\x63omponent_name\x18\x02 \x01(\t\x12\x11\n\tso_digest\x18\x03 \x01(\t\x12\x14\n\x0c\x63ustom_entry\x18\x04 \x01(\t\";\n\x1d\x41nalyseNativeActivityResponse\x12\x1a\n\x12total_instructions\x18\x01 \x01(\x03\"#\n\x11LoadBinaryRequest\x12\x0e\n\x06\x62uffer\x18\x01 \x01(\x0c\"7\n\x12LoadBinaryResponse\x12\x11\n\tso_digest\x18\x01 \x01(\t\x12\x0e\n\x06length\x18\x02 \x01(\x05\x32\xd6\x06\n\x0bNativeDroid\x12[\n\nGenSummary\x12%.nativedroid_server.GenSummaryRequest\x1a&.nativedroid_server.GenSummaryResponse\x12\x63\n\x0cGenSummaries\x12\'.nativedroid_server.GenSummariesRequest\x1a(.nativedroid_server.GenSummariesResponse0\x01\x12|\n\x15GetDynamicRegisterMap\x12\x30.nativedroid_server.GetDynamicRegisterMapRequest\x1a\x31.nativedroid_server.GetDynamicRegisterMapResponse\x12X\n\tHasSymbol\x12$.nativedroid_server.HasSymbolRequest\x1a%.nativedroid_server.HasSymbolResponse\x12[\n\nHasSymbols\x12%.nativedroid_server.HasSymbolsRequest\x1a&.nativedroid_server.HasSymbolsResponse\x12s\n\x12ListJniEntryPoints\x12-.nativedroid_server.ListJniEntryPointsRequest\x1a..nativedroid_server.ListJniEntryPointsResponse\x12|\n\x15\x41nalyseNativeActivity\x12\x30.nativedroid_server.AnalyseNativeActivityRequest\x1a\x31.nativedroid_server.AnalyseNativeActivityResponse\x12]\n\nLoadBinary\x12%.nativedroid_server.LoadBinaryRequest\x1a&.nativedroid_server.LoadBinaryResponse(\x01\x42\x1e\n\x1corg.argus.nativedroid.serverb\x06proto3')
   ,
   dependencies=[nativedroid_dot_protobuf_dot_java__signatures__pb2.DESCRIPTOR,])
 
 
 
 
+_BUDGET = _descriptor.Descriptor(
+  name='Budget',
+  full_name='nativedroid_server.Budget',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='time_limit', full_name='nativedroid_server.Budget.time_limit', index=0,
+      number=1, type=1, cpp_type=5, label=1,
+      has_default_value=False, default_value=float(0),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='max_instructions', full_name='nativedroid_server.Budget.max_instructions', index=1,
+      number=2, type=3, cpp_type=2, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='max_states', full_name='nativedroid_server.Budget.max_states', index=2,
+      number=3, type=5, cpp_type=1, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='max_memory', full_name='nativedroid_server.Budget.max_memory', index=3,
+      number=4, type=3, cpp_type=2, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='call_depth', full_name='nativedroid_server.Budget.call_depth', index=4,
+      number=5, type=5, cpp_type=1, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=None, file=DESCRIPTOR),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  options=None,
+  is_extendable=False,
+  syntax='proto3',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=111,
+  serialized_end=225,
+)
+
+
 _GENSUMMARYREQUEST = _descriptor.Descriptor(
   name='GenSummaryRequest',
   full_name='nativedroid_server.GenSummaryRequest',
@@ -83,6 +142,13 @@ _GENSUMMARYREQUEST = _descriptor.Descriptor(
       message_type=None, enum_type=None, containing_type=None,
       is_extension=False, extension_scope=None,
       options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='budget', full_name='nativedroid_server.GenSummaryRequest.budget', index=7,
+      number=8, type=11, cpp_type=10, label=1,
+      has_default_value=False, default_value=None,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=None, file=DESCRIPTOR),
   ],
   extensions=[
   ],
@@ -98,8 +164,8 @@ _GENSUMMARYREQUEST = _descriptor.Descriptor(
       name='name_or_address', full_name='nativedroid_server.GenSummaryRequest.name_or_address',
       index=0, containing_type=None, fields=[]),
   ],
-  serialized_start=112,
-  serialized_end=318,
+  serialized_start=228,
+  serialized_end=478,
 )
 
 
@@ -131,6 +197,13 @@ _GENSUMMARYRESPONSE = _descriptor.Descriptor(
       message_type=None, enum_type=None, containing_type=None,
       is_extension=False, extension_scope=None,
       options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='partial', full_name='nativedroid_server.GenSummaryResponse.partial', index=3,
+      number=4, type=8, cpp_type=7, label=1,
+      has_default_value=False, default_value=False,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=None, file=DESCRIPTOR),
   ],
   extensions=[
   ],
@@ -143,8 +216,167 @@ _GENSUMMARYRESPONSE = _descriptor.Descriptor(
   extension_ranges=[],
   oneofs=[
   ],
-  serialized_start=320,
-  serialized_end=403,
+  serialized_start=480,
+  serialized_end=580,
+)
+
+
+_JNIMETHOD = _descriptor.Descriptor(
+  name='JniMethod',
+  full_name='nativedroid_server.JniMethod',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='jni_func', full_name='nativedroid_server.JniMethod.jni_func', index=0,
+      number=1, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=_b("").decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='addr', full_name='nativedroid_server.JniMethod.addr', index=1,
+      number=2, type=3, cpp_type=2, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='method_signature', full_name='nativedroid_server.JniMethod.method_signature', index=2,
+      number=3, type=11, cpp_type=10, label=1,
+      has_default_value=False, default_value=None,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=None, file=DESCRIPTOR),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  options=None,
+  is_extendable=False,
+  syntax='proto3',
+  extension_ranges=[],
+  oneofs=[
+    _descriptor.OneofDescriptor(
+      name='name_or_address', full_name='nativedroid_server.JniMethod.name_or_address',
+      index=0, containing_type=None, fields=[]),
+  ],
+  serialized_start=582,
+  serialized_end=702,
+)
+
+
+_GENSUMMARIESREQUEST = _descriptor.Descriptor(
+  name='GenSummariesRequest',
+  full_name='nativedroid_server.GenSummariesRequest',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='apk_digest', full_name='nativedroid_server.GenSummariesRequest.apk_digest', index=0,
+      number=1, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=_b("").decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='component_name', full_name='nativedroid_server.GenSummariesRequest.component_name', index=1,
+      number=2, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=_b("").decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='depth', full_name='nativedroid_server.GenSummariesRequest.depth', index=2,
+      number=3, type=5, cpp_type=1, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='so_digest', full_name='nativedroid_server.GenSummariesRequest.so_digest', index=3,
+      number=4, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=_b("").decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='methods', full_name='nativedroid_server.GenSummariesRequest.methods', index=4,
+      number=5, type=11, cpp_type=10, label=3,
+      has_default_value=False, default_value=[],
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='budget', full_name='nativedroid_server.GenSummariesRequest.budget', index=5,
+      number=6, type=11, cpp_type=10, label=1,
+      has_default_value=False, default_value=None,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=None, file=DESCRIPTOR),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  options=None,
+  is_extendable=False,
+  syntax='proto3',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=705,
+  serialized_end=896,
+)
+
+
+_GENSUMMARIESRESPONSE = _descriptor.Descriptor(
+  name='GenSummariesResponse',
+  full_name='nativedroid_server.GenSummariesResponse',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='index', full_name='nativedroid_server.GenSummariesResponse.index', index=0,
+      number=1, type=5, cpp_type=1, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='response', full_name='nativedroid_server.GenSummariesResponse.response', index=1,
+      number=2, type=11, cpp_type=10, label=1,
+      has_default_value=False, default_value=None,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='error', full_name='nativedroid_server.GenSummariesResponse.error', index=2,
+      number=3, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=_b("").decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=None, file=DESCRIPTOR),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  options=None,
+  is_extendable=False,
+  syntax='proto3',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=898,
+  serialized_end=1008,
 )
 
 
@@ -174,8 +406,8 @@ _GETDYNAMICREGISTERMAPREQUEST = _descriptor.Descriptor(
   extension_ranges=[],
   oneofs=[
   ],
-  serialized_start=405,
-  serialized_end=454,
+  serialized_start=1010,
+  serialized_end=1059,
 )
 
 
@@ -212,8 +444,8 @@ _METHODMAP = _descriptor.Descriptor(
   extension_ranges=[],
   oneofs=[
   ],
-  serialized_start=456,
-  serialized_end=507,
+  serialized_start=1061,
+  serialized_end=1112,
 )
 
 
@@ -243,8 +475,8 @@ _GETDYNAMICREGISTERMAPRESPONSE = _descriptor.Descriptor(
   extension_ranges=[],
   oneofs=[
   ],
-  serialized_start=509,
-  serialized_end=591,
+  serialized_start=1114,
+  serialized_end=1196,
 )
 
 
@@ -281,8 +513,8 @@ _HASSYMBOLREQUEST = _descriptor.Descriptor(
   extension_ranges=[],
   oneofs=[
   ],
-  serialized_start=593,
-  serialized_end=646,
+  serialized_start=1198,
+  serialized_end=1251,
 )
 
 
@@ -312,8 +544,146 @@ _HASSYMBOLRESPONSE = _descriptor.Descriptor(
   extension_ranges=[],
   oneofs=[
   ],
-  serialized_start=648,
-  serialized_end=687,
+  serialized_start=1253,
+  serialized_end=1292,
+)
+
+
+_HASSYMBOLSREQUEST = _descriptor.Descriptor(
+  name='HasSymbolsRequest',
+  full_name='nativedroid_server.HasSymbolsRequest',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='so_digest', full_name='nativedroid_server.HasSymbolsRequest.so_digest', index=0,
+      number=1, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=_b("").decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='symbols', full_name='nativedroid_server.HasSymbolsRequest.symbols', index=1,
+      number=2, type=9, cpp_type=9, label=3,
+      has_default_value=False, default_value=[],
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=None, file=DESCRIPTOR),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  options=None,
+  is_extendable=False,
+  syntax='proto3',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=1294,
+  serialized_end=1349,
+)
+
+
+_HASSYMBOLSRESPONSE = _descriptor.Descriptor(
+  name='HasSymbolsResponse',
+  full_name='nativedroid_server.HasSymbolsResponse',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='has_symbol', full_name='nativedroid_server.HasSymbolsResponse.has_symbol', index=0,
+      number=1, type=8, cpp_type=7, label=3,
+      has_default_value=False, default_value=[],
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=None, file=DESCRIPTOR),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  options=None,
+  is_extendable=False,
+  syntax='proto3',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=1351,
+  serialized_end=1391,
+)
+
+
+_LISTJNIENTRYPOINTSREQUEST = _descriptor.Descriptor(
+  name='ListJniEntryPointsRequest',
+  full_name='nativedroid_server.ListJniEntryPointsRequest',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='so_digest', full_name='nativedroid_server.ListJniEntryPointsRequest.so_digest', index=0,
+      number=1, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=_b("").decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=None, file=DESCRIPTOR),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  options=None,
+  is_extendable=False,
+  syntax='proto3',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=1393,
+  serialized_end=1439,
+)
+
+
+_LISTJNIENTRYPOINTSRESPONSE = _descriptor.Descriptor(
+  name='ListJniEntryPointsResponse',
+  full_name='nativedroid_server.ListJniEntryPointsResponse',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='jni_func', full_name='nativedroid_server.ListJniEntryPointsResponse.jni_func', index=0,
+      number=1, type=9, cpp_type=9, label=3,
+      has_default_value=False, default_value=[],
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='has_jni_on_load', full_name='nativedroid_server.ListJniEntryPointsResponse.has_jni_on_load', index=1,
+      number=2, type=8, cpp_type=7, label=1,
+      has_default_value=False, default_value=False,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      options=None, file=DESCRIPTOR),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  options=None,
+  is_extendable=False,
+  syntax='proto3',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=1441,
+  serialized_end=1512,
 )
 
 
@@ -364,8 +734,8 @@ _ANALYSENATIVEACTIVITYREQUEST = _descriptor.Descriptor(
   extension_ranges=[],
   oneofs=[
   ],
-  serialized_start=689,
-  serialized_end=804,
+  serialized_start=1514,
+  serialized_end=1629,
 )
 
 
@@ -395,8 +765,8 @@ _ANALYSENATIVEACTIVITYRESPONSE = _descriptor.Descriptor(
   extension_ranges=[],
   oneofs=[
   ],
-  serialized_start=806,
-  serialized_end=865,
+  serialized_start=1631,
+  serialized_end=1690,
 )
 
 
@@ -426,8 +796,8 @@ _LOADBINARYREQUEST = _descriptor.Descriptor(
   extension_ranges=[],
   oneofs=[
   ],
-  serialized_start=867,
-  serialized_end=902,
+  serialized_start=1692,
+  serialized_end=1727,
 )
 
 
@@ -464,31 +834,57 @@ _LOADBINARYRESPONSE = _descriptor.Descriptor(
   extension_ranges=[],
   oneofs=[
   ],
-  serialized_start=904,
-  serialized_end=959,
+  serialized_start=1729,
+  serialized_end=1784,
 )
 
 _GENSUMMARYREQUEST.fields_by_name['method_signature'].message_type = nativedroid_dot_protobuf_dot_java__signatures__pb2._METHODSIGNATURE
+_GENSUMMARYREQUEST.fields_by_name['budget'].message_type = _BUDGET
 _GENSUMMARYREQUEST.oneofs_by_name['name_or_address'].fields.append(
   _GENSUMMARYREQUEST.fields_by_name['jni_func'])
 _GENSUMMARYREQUEST.fields_by_name['jni_func'].containing_oneof = _GENSUMMARYREQUEST.oneofs_by_name['name_or_address']
 _GENSUMMARYREQUEST.oneofs_by_name['name_or_address'].fields.append(
   _GENSUMMARYREQUEST.fields_by_name['addr'])
 _GENSUMMARYREQUEST.fields_by_name['addr'].containing_oneof = _GENSUMMARYREQUEST.oneofs_by_name['name_or_address']
+_JNIMETHOD.fields_by_name['method_signature'].message_type = nativedroid_dot_protobuf_dot_java__signatures__pb2._METHODSIGNATURE
+_JNIMETHOD.oneofs_by_name['name_or_address'].fields.append(
+  _JNIMETHOD.fields_by_name['jni_func'])
+_JNIMETHOD.fields_by_name['jni_func'].containing_oneof = _JNIMETHOD.oneofs_by_name['name_or_address']
+_JNIMETHOD.oneofs_by_name['name_or_address'].fields.append(
+  _JNIMETHOD.fields_by_name['addr'])
+_JNIMETHOD.fields_by_name['addr'].containing_oneof = _JNIMETHOD.oneofs_by_name['name_or_address']
+_GENSUMMARIESREQUEST.fields_by_name['methods'].message_type = _JNIMETHOD
+_GENSUMMARIESREQUEST.fields_by_name['budget'].message_type = _BUDGET
+_GENSUMMARIESRESPONSE.fields_by_name['response'].message_type = _GENSUMMARYRESPONSE
 _GETDYNAMICREGISTERMAPRESPONSE.fields_by_name['method_map'].message_type = _METHODMAP
+DESCRIPTOR.message_types_by_name['Budget'] = _BUDGET
 DESCRIPTOR.message_types_by_name['GenSummaryRequest'] = _GENSUMMARYREQUEST
 DESCRIPTOR.message_types_by_name['GenSummaryResponse'] = _GENSUMMARYRESPONSE
+DESCRIPTOR.message_types_by_name['JniMethod'] = _JNIMETHOD
+DESCRIPTOR.message_types_by_name['GenSummariesRequest'] = _GENSUMMARIESREQUEST
+DESCRIPTOR.message_types_by_name['GenSummariesResponse'] = _GENSUMMARIESRESPONSE
 DESCRIPTOR.message_types_by_name['GetDynamicRegisterMapRequest'] = _GETDYNAMICREGISTERMAPREQUEST
 DESCRIPTOR.message_types_by_name['MethodMap'] = _METHODMAP
 DESCRIPTOR.message_types_by_name['GetDynamicRegisterMapResponse'] = _GETDYNAMICREGISTERMAPRESPONSE
 DESCRIPTOR.message_types_by_name['HasSymbolRequest'] = _HASSYMBOLREQUEST
 DESCRIPTOR.message_types_by_name['HasSymbolResponse'] = _HASSYMBOLRESPONSE
+DESCRIPTOR.message_types_by_name['HasSymbolsRequest'] = _HASSYMBOLSREQUEST
+DESCRIPTOR.message_types_by_name['HasSymbolsResponse'] = _HASSYMBOLSRESPONSE
+DESCRIPTOR.message_types_by_name['ListJniEntryPointsRequest'] = _LISTJNIENTRYPOINTSREQUEST
+DESCRIPTOR.message_types_by_name['ListJniEntryPointsResponse'] = _LISTJNIENTRYPOINTSRESPONSE
 DESCRIPTOR.message_types_by_name['AnalyseNativeActivityRequest'] = _ANALYSENATIVEACTIVITYREQUEST
 DESCRIPTOR.message_types_by_name['AnalyseNativeActivityResponse'] = _ANALYSENATIVEACTIVITYRESPONSE
 DESCRIPTOR.message_types_by_name['LoadBinaryRequest'] = _LOADBINARYREQUEST
 DESCRIPTOR.message_types_by_name['LoadBinaryResponse'] = _LOADBINARYRESPONSE
 _sym_db.RegisterFileDescriptor(DESCRIPTOR)
 
+Budget = _reflection.GeneratedProtocolMessageType('Budget', (_message.Message,), dict(
+  DESCRIPTOR = _BUDGET,
+  __module__ = 'nativedroid.protobuf.nativedroid_grpc_pb2'
+  # @@protoc_insertion_point(class_scope:nativedroid_server.Budget)
+  ))
+_sym_db.RegisterMessage(Budget)
+
 GenSummaryRequest = _reflection.GeneratedProtocolMessageType('GenSummaryRequest', (_message.Message,), dict(
   DESCRIPTOR = _GENSUMMARYREQUEST,
   __module__ = 'nativedroid.protobuf.nativedroid_grpc_pb2'
@@ -503,6 +899,27 @@ GenSummaryResponse = _reflection.GeneratedProtocolMessageType('GenSummaryRespons
   ))
 _sym_db.RegisterMessage(GenSummaryResponse)
 
+JniMethod = _reflection.GeneratedProtocolMessageType('JniMethod', (_message.Message,), dict(
+  DESCRIPTOR = _JNIMETHOD,
+  __module__ = 'nativedroid.protobuf.nativedroid_grpc_pb2'
+  # @@protoc_insertion_point(class_scope:nativedroid_server.JniMethod)
+  ))
+_sym_db.RegisterMessage(JniMethod)
+
+GenSummariesRequest = _reflection.GeneratedProtocolMessageType('GenSummariesRequest', (_message.Message,), dict(
+  DESCRIPTOR = _GENSUMMARIESREQUEST,
+  __module__ = 'nativedroid.protobuf.nativedroid_grpc_pb2'
+  # @@protoc_insertion_point(class_scope:nativedroid_server.GenSummariesRequest)
+  ))
+_sym_db.RegisterMessage(GenSummariesRequest)
+
+GenSummariesResponse = _reflection.GeneratedProtocolMessageType('GenSummariesResponse', (_message.Message,), dict(
+  DESCRIPTOR = _GENSUMMARIESRESPONSE,
+  __module__ = 'nativedroid.protobuf.nativedroid_grpc_pb2'
+  # @@protoc_insertion_point(class_scope:nativedroid_server.GenSummariesResponse)
+  ))
+_sym_db.RegisterMessage(GenSummariesResponse)
+
 GetDynamicRegisterMapRequest = _reflection.GeneratedProtocolMessageType('GetDynamicRegisterMapRequest', (_message.Message,), dict(
   DESCRIPTOR = _GETDYNAMICREGISTERMAPREQUEST,
   __module__ = 'nativedroid.protobuf.nativedroid_grpc_pb2'
@@ -538,6 +955,34 @@ HasSymbolResponse = _reflection.GeneratedProtocolMessageType('HasSymbolResponse'
   ))
 _sym_db.RegisterMessage(HasSymbolResponse)
 
+HasSymbolsRequest = _reflection.GeneratedProtocolMessageType('HasSymbolsRequest', (_message.Message,), dict(
+  DESCRIPTOR = _HASSYMBOLSREQUEST,
+  __module__ = 'nativedroid.protobuf.nativedroid_grpc_pb2'
+  # @@protoc_insertion_point(class_scope:nativedroid_server.HasSymbolsRequest)
+  ))
+_sym_db.RegisterMessage(HasSymbolsRequest)
+
+HasSymbolsResponse = _reflection.GeneratedProtocolMessageType('HasSymbolsResponse', (_message.Message,), dict(
+  DESCRIPTOR = _HASSYMBOLSRESPONSE,
+  __module__ = 'nativedroid.protobuf.nativedroid_grpc_pb2'
+  # @@protoc_insertion_point(class_scope:nativedroid_server.HasSymbolsResponse)
+  ))
+_sym_db.RegisterMessage(HasSymbolsResponse)
+
+ListJniEntryPointsRequest = _reflection.GeneratedProtocolMessageType('ListJniEntryPointsRequest', (_message.Message,), dict(
+  DESCRIPTOR = _LISTJNIENTRYPOINTSREQUEST,
+  __module__ = 'nativedroid.protobuf.nativedroid_grpc_pb2'
+  # @@protoc_insertion_point(class_scope:nativedroid_server.ListJniEntryPointsRequest)
+  ))
+_sym_db.RegisterMessage(ListJniEntryPointsRequest)
+
+ListJniEntryPointsResponse = _reflection.GeneratedProtocolMessageType('ListJniEntryPointsResponse', (_message.Message,), dict(
+  DESCRIPTOR = _LISTJNIENTRYPOINTSRESPONSE,
+  __module__ = 'nativedroid.protobuf.nativedroid_grpc_pb2'
+  # @@protoc_insertion_point(class_scope:nativedroid_server.ListJniEntryPointsResponse)
+  ))
+_sym_db.RegisterMessage(ListJniEntryPointsResponse)
+
 AnalyseNativeActivityRequest = _reflection.GeneratedProtocolMessageType('AnalyseNativeActivityRequest', (_message.Message,), dict(
   DESCRIPTOR = _ANALYSENATIVEACTIVITYREQUEST,
   __module__ = 'nativedroid.protobuf.nativedroid_grpc_pb2'
@@ -576,8 +1021,8 @@ _NATIVEDROID = _descriptor.ServiceDescriptor(
   file=DESCRIPTOR,
   index=0,
   options=None,
-  serialized_start=962,
-  serialized_end=1505,
+  serialized_start=1787,
+  serialized_end=2641,
   methods=[
   _descriptor.MethodDescriptor(
     name='GenSummary',
@@ -588,10 +1033,19 @@ _NATIVEDROID = _descriptor.ServiceDescriptor(
     output_type=_GENSUMMARYRESPONSE,
     options=None,
   ),
+  _descriptor.MethodDescriptor(
+    name='GenSummaries',
+    full_name='nativedroid_server.NativeDroid.GenSummaries',
+    index=1,
+    containing_service=None,
+    input_type=_GENSUMMARIESREQUEST,
+    output_type=_GENSUMMARIESRESPONSE,
+    options=None,
+  ),
   _descriptor.MethodDescriptor(
     name='GetDynamicRegisterMap',
     full_name='nativedroid_server.NativeDroid.GetDynamicRegisterMap',
-    index=1,
+    index=2,
     containing_service=None,
     input_type=_GETDYNAMICREGISTERMAPREQUEST,
     output_type=_GETDYNAMICREGISTERMAPRESPONSE,
@@ -600,16 +1054,34 @@ _NATIVEDROID = _descriptor.ServiceDescriptor(
   _descriptor.MethodDescriptor(
     name='HasSymbol',
     full_name='nativedroid_server.NativeDroid.HasSymbol',
-    index=2,
+    index=3,
     containing_service=None,
     input_type=_HASSYMBOLREQUEST,
     output_type=_HASSYMBOLRESPONSE,
     options=None,
   ),
+  _descriptor.MethodDescriptor(
+    name='HasSymbols',
+    full_name='nativedroid_server.NativeDroid.HasSymbols',
+    index=4,
+    containing_service=None,
+    input_type=_HASSYMBOLSREQUEST,
+    output_type=_HASSYMBOLSRESPONSE,
+    options=None,
+  ),
+  _descriptor.MethodDescriptor(
+    name='ListJniEntryPoints',
+    full_name='nativedroid_server.NativeDroid.ListJniEntryPoints',
+    index=5,
+    containing_service=None,
+    input_type=_LISTJNIENTRYPOINTSREQUEST,
+    output_type=_LISTJNIENTRYPOINTSRESPONSE,
+    options=None,
+  ),
   _descriptor.MethodDescriptor(
     name='AnalyseNativeActivity',
     full_name='nativedroid_server.NativeDroid.AnalyseNativeActivity',
-    index=3,
+    index=6,
     containing_service=None,
     input_type=_ANALYSENATIVEACTIVITYREQUEST,
     output_type=_ANALYSENATIVEACTIVITYRESPONSE,
@@ -618,7 +1090,7 @@ _NATIVEDROID = _descriptor.ServiceDescriptor(
   _descriptor.MethodDescriptor(
     name='LoadBinary',
     full_name='nativedroid_server.NativeDroid.LoadBinary',
-    index=4,
+    index=7,
     containing_service=None,
     input_type=_LOADBINARYREQUEST,
     output_type=_LOADBINARYRESPONSE,
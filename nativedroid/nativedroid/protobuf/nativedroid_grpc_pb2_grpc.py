@@ -19,6 +19,11 @@ class NativeDroidStub(object):
         request_serializer=nativedroid_dot_protobuf_dot_nativedroid__grpc__pb2.GenSummaryRequest.SerializeToString,
         response_deserializer=nativedroid_dot_protobuf_dot_nativedroid__grpc__pb2.GenSummaryResponse.FromString,
         )
+    self.GenSummaries = channel.unary_stream(
+        '/nativedroid_server.NativeDroid/GenSummaries',
+        request_serializer=nativedroid_dot_protobuf_dot_nativedroid__grpc__pb2.GenSummariesRequest.SerializeToString,
+        response_deserializer=nativedroid_dot_protobuf_dot_nativedroid__grpc__pb2.GenSummariesResponse.FromString,
+        )
     self.GetDynamicRegisterMap = channel.unary_unary(
         '/nativedroid_server.NativeDroid/GetDynamicRegisterMap',
         request_serializer=nativedroid_dot_protobuf_dot_nativedroid__grpc__pb2.GetDynamicRegisterMapRequest.SerializeToString,
@@ -29,6 +34,16 @@ class NativeDroidStub(object):
         request_serializer=nativedroid_dot_protobuf_dot_nativedroid__grpc__pb2.HasSymbolRequest.SerializeToString,
         response_deserializer=nativedroid_dot_protobuf_dot_nativedroid__grpc__pb2.HasSymbolResponse.FromString,
         )
+    self.HasSymbols = channel.unary_unary(
+        '/nativedroid_server.NativeDroid/HasSymbols',
+        request_serializer=nativedroid_dot_protobuf_dot_nativedroid__grpc__pb2.HasSymbolsRequest.SerializeToString,
+        response_deserializer=nativedroid_dot_protobuf_dot_nativedroid__grpc__pb2.HasSymbolsResponse.FromString,
+        )
+    self.ListJniEntryPoints = channel.unary_unary(
+        '/nativedroid_server.NativeDroid/ListJniEntryPoints',
+        request_serializer=nativedroid_dot_protobuf_dot_nativedroid__grpc__pb2.ListJniEntryPointsRequest.SerializeToString,
+        response_deserializer=nativedroid_dot_protobuf_dot_nativedroid__grpc__pb2.ListJniEntryPointsResponse.FromString,
+        )
     self.AnalyseNativeActivity = channel.unary_unary(
         '/nativedroid_server.NativeDroid/AnalyseNativeActivity',
         request_serializer=nativedroid_dot_protobuf_dot_nativedroid__grpc__pb2.AnalyseNativeActivityRequest.SerializeToString,
@@ -52,6 +67,13 @@ class NativeDroidServicer(object):
     context.set_details('Method not implemented!')
     raise NotImplementedError('Method not implemented!')
 
+  def GenSummaries(self, request, context):
+    # missing associated documentation comment in .proto file
+    pass
+    context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+    context.set_details('Method not implemented!')
+    raise NotImplementedError('Method not implemented!')
+
   def GetDynamicRegisterMap(self, request, context):
     # missing associated documentation comment in .proto file
     pass
@@ -66,6 +88,20 @@ class NativeDroidServicer(object):
     context.set_details('Method not implemented!')
     raise NotImplementedError('Method not implemented!')
 
+  def HasSymbols(self, request, context):
+    # missing associated documentation comment in .proto file
+    pass
+    context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+    context.set_details('Method not implemented!')
+    raise NotImplementedError('Method not implemented!')
+
+  def ListJniEntryPoints(self, request, context):
+    # missing associated documentation comment in .proto file
+    pass
+    context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+    context.set_details('Method not implemented!')
+    raise NotImplementedError('Method not implemented!')
+
   def AnalyseNativeActivity(self, request, context):
     # missing associated documentation comment in .proto file
     pass
@@ -88,6 +124,11 @@ def add_NativeDroidServicer_to_server(servicer, server):
           request_deserializer=nativedroid_dot_protobuf_dot_nativedroid__grpc__pb2.GenSummaryRequest.FromString,
           response_serializer=nativedroid_dot_protobuf_dot_nativedroid__grpc__pb2.GenSummaryResponse.SerializeToString,
       ),
+      'GenSummaries': grpc.unary_stream_rpc_method_handler(
+          servicer.GenSummaries,
+          request_deserializer=nativedroid_dot_protobuf_dot_nativedroid__grpc__pb2.GenSummariesRequest.FromString,
+          response_serializer=nativedroid_dot_protobuf_dot_nativedroid__grpc__pb2.GenSummariesResponse.SerializeToString,
+      ),
       'GetDynamicRegisterMap': grpc.unary_unary_rpc_method_handler(
           servicer.GetDynamicRegisterMap,
           request_deserializer=nativedroid_dot_protobuf_dot_nativedroid__grpc__pb2.GetDynamicRegisterMapRequest.FromString,
@@ -98,6 +139,16 @@ def add_NativeDroidServicer_to_server(servicer, server):
           request_deserializer=nativedroid_dot_protobuf_dot_nativedroid__grpc__pb2.HasSymbolRequest.FromString,
           response_serializer=nativedroid_dot_protobuf_dot_nativedroid__grpc__pb2.HasSymbolResponse.SerializeToString,
       ),
+      'HasSymbols': grpc.unary_unary_rpc_method_handler(
+          servicer.HasSymbols,
+          request_deserializer=nativedroid_dot_protobuf_dot_nativedroid__grpc__pb2.HasSymbolsRequest.FromString,
+          response_serializer=nativedroid_dot_protobuf_dot_nativedroid__grpc__pb2.HasSymbolsResponse.SerializeToString,
+      ),
+      'ListJniEntryPoints': grpc.unary_unary_rpc_method_handler(
+          servicer.ListJniEntryPoints,
+          request_deserializer=nativedroid_dot_protobuf_dot_nativedroid__grpc__pb2.ListJniEntryPointsRequest.FromString,
+          response_serializer=nativedroid_dot_protobuf_dot_nativedroid__grpc__pb2.ListJniEntryPointsResponse.SerializeToString,
+      ),
       'AnalyseNativeActivity': grpc.unary_unary_rpc_method_handler(
           servicer.AnalyseNativeActivity,
           request_deserializer=nativedroid_dot_protobuf_dot_nativedroid__grpc__pb2.AnalyseNativeActivityRequest.FromString,
@@ -1,3 +1,4 @@
+import functools
 import hashlib
 import io
 import os
@@ -6,32 +7,189 @@ import time
 import pkg_resources
 from concurrent import futures
 
+from nativedroid.analyses.analysis_budget import DEFAULT_CALL_DEPTH, AnalysisBudget
+from nativedroid.analyses.library_cache import cache_dir_for
+from nativedroid.analyses.library_handle import LibraryHandleCache
 from nativedroid.analyses.nativedroid_analysis import *
 from nativedroid.jawa.utils import *
 from nativedroid.protobuf.nativedroid_grpc_pb2 import *
 from nativedroid.protobuf.nativedroid_grpc_pb2_grpc import *
+from nativedroid.protobuf.jnsaf_grpc_pb2 import GetSummaryRequest
 from nativedroid.protobuf.jnsaf_grpc_pb2_grpc import *
+from nativedroid.server.summary_cache import SummaryCache
+from nativedroid.server.worker_pool import WORKER_MEMORY, WorkerError, WorkerPool, call_cancelled
 
 __author__ = "Fengguo Wei"
 __copyright__ = "Copyright 2018, The Argus-SAF Project"
 __license__ = "Apache v2.0"
 
 _ONE_DAY_IN_SECONDS = 60 * 60 * 24
+_PREFETCH_TIMEOUT_IN_SECONDS = 60
+# Status codes of a failed JNSaf request which stop the analysis waiting for it, with the reason of the stop.
+_ABORTING_STATUS_CODES = {grpc.StatusCode.DEADLINE_EXCEEDED: 'deadline', grpc.StatusCode.CANCELLED: 'cancelled'}
+# Depth of the JNSaf summaries requested by a native activity analysis.
+_NATIVE_ACTIVITY_DEPTH = 3
 
 logger = logging.getLogger('nativedroid.server.NativeDroidServer')
 
 
+def _deadline(context):
+    """
+    Get the deadline of an RPC. gRPC reports an RPC without deadline as one ending in the far future.
+    :param context: Servicer context of the RPC
+    :return: Deadline in seconds since the epoch, None if the RPC has no deadline
+    """
+    time_remaining = context.time_remaining()
+    if time_remaining is None or time_remaining > _ONE_DAY_IN_SECONDS:
+        return None
+    return time.time() + time_remaining
+
+
+def _worker_call_active():
+    return not call_cancelled()
+
+
+def _analysis_budget(budget, deadline=None, is_active=None):
+    """
+    Build the budget of an analysis from the budget of its request, in which 0 means no limit.
+    :param Budget budget: server_pb2.Budget
+    :param float deadline: Deadline of the RPC in seconds since the epoch, None for no deadline
+    :param is_active: Function telling whether the RPC is still active, None to poll the cancellation of the call
+                      running in this worker
+    :return: AnalysisBudget
+    """
+    return AnalysisBudget(time_limit=budget.time_limit or None, max_instructions=budget.max_instructions or None,
+                          max_states=budget.max_states or None, max_memory=budget.max_memory or None,
+                          call_depth=budget.call_depth or DEFAULT_CALL_DEPTH, deadline=deadline,
+                          is_active=is_active or _worker_call_active)
+
+
+def _gen_summary_request(request, method):
+    """
+    Build the GenSummary request of one method of a GenSummaries request.
+    :param GenSummariesRequest request: server_pb2.GenSummariesRequest
+    :param JniMethod method: server_pb2.JniMethod
+    :return: server_pb2.GenSummaryRequest
+    """
+    gen_summary_request = GenSummaryRequest(apk_digest=request.apk_digest, component_name=request.component_name,
+                                            depth=request.depth, so_digest=request.so_digest,
+                                            method_signature=method.method_signature, budget=request.budget)
+    if method.HasField('jni_func'):
+        gen_summary_request.jni_func = method.jni_func
+    else:
+        gen_summary_request.addr = method.addr
+    return gen_summary_request
+
+
 class JNSafClient(JNSafStub):
-    def __init__(self, channel, apk_digest, component_name, depth):
+    def __init__(self, channel, apk_digest, component_name, depth, summary_cache=None, deadline=None):
         super(JNSafClient, self).__init__(channel)
         self.apk_digest = apk_digest
         self.component_name = component_name
         self.depth = depth
+        self.summary_cache = summary_cache
+        self.deadline = deadline
+
+    def _time_remaining(self):
+        """
+        Seconds left until the deadline of the request being analyzed, which bounds the requests sent to JNSaf.
+        :return: Remaining seconds, None if there is no deadline
+        """
+        if self.deadline is None:
+            return None
+        return max(0, self.deadline - time.time())
+
+    def _summary_request(self, signature, gen=True):
+        return GetSummaryRequest(apk_digest=self.apk_digest, component_name=self.component_name,
+                                 signature=signature, gen=gen, depth=self.depth)
+
+    def get_summary(self, signature, analysis_budget=None):
+        """
+        Get summary of given Java method from JNSaf, served from the summary cache when possible. If the summary is
+        being prefetched, wait for that request, and only ask JNSaf to generate the summary if none did. If the
+        request fails, the analysis goes on without the summary, unless the request ran out of time or was
+        cancelled: then the analysis has to stop as well.
+        :param str signature: Java method signature
+        :param AnalysisBudget analysis_budget: Budget of the analysis asking for the summary, aborted if the request
+                                               ran out of time or was cancelled
+        :return: GetSummaryResponse, None if the request failed
+        """
+        key = (self.apk_digest, signature, self.depth)
+        if self.summary_cache is not None:
+            response = self.summary_cache.get(key)
+            if response is not None:
+                return response
+            try:
+                response = self.summary_cache.wait_pending(key, self._time_remaining())
+                if response is not None:
+                    return response
+            except (grpc.RpcError, grpc.FutureCancelledError, grpc.FutureTimeoutError) as e:
+                logger.warning('Prefetch summary of %s failed: %s', signature, e)
+        try:
+            response = self.GetSummary(self._summary_request(signature), timeout=self._time_remaining())
+        except grpc.RpcError as e:
+            logger.warning('Get summary of %s failed: %s', signature, e)
+            if analysis_budget is not None and e.code() in _ABORTING_STATUS_CODES:
+                analysis_budget.abort(_ABORTING_STATUS_CODES[e.code()])
+            return None
+        if self.summary_cache is not None:
+            self.summary_cache.put(key, response)
+        return response
+
+    def prefetch_summary(self, signature, gen=True, timeout=None):
+        """
+        Start fetching the summary of given Java method without waiting for it, get_summary picks it up later.
+        :param str signature: Java method signature
+        :param bool gen: Whether JNSaf generates the summary if it has none, False for a method which may never be
+                         called, then generating it is left to get_summary
+        :param float timeout: Seconds the request may take, None to wait until the deadline of the analysis
+        :return: Future of GetSummaryResponse, None if the summary is cached or there is no summary cache.
+        """
+        if self.summary_cache is None:
+            return None
+        key = (self.apk_digest, signature, self.depth)
+        if self.summary_cache.get(key) is not None:
+            return None
+        time_remaining = self._time_remaining()
+        if timeout is None or (time_remaining is not None and time_remaining < timeout):
+            timeout = time_remaining
+        future = self.summary_cache.get_pending(key, final=gen)
+        if future is None:
+            future = self.summary_cache.add_pending(
+                key, self.GetSummary.future(self._summary_request(signature, gen), timeout=timeout), final=gen)
+        return future
+
+    def prefetch_summaries(self, signatures, timeout=_PREFETCH_TIMEOUT_IN_SECONDS):
+        """
+        Start fetching the summaries of given Java methods from JNSaf in one batch of concurrent requests, without
+        waiting for them. The methods are only guessed from the binary, so JNSaf is not asked to generate the
+        summaries it does not have. The responses land in the summary cache, get_summary waits for the ones it needs.
+        :param list signatures: Java method signatures
+        :param float timeout: Seconds each request may take
+        :return: dict of signature to Future of GetSummaryResponse of the started requests
+        """
+        pending = dict()
+        for signature in signatures:
+            future = self.prefetch_summary(signature, False, timeout)
+            if future is not None:
+                pending[signature] = future
+        logger.info('Prefetching %d of %d summaries.', len(pending), len(signatures))
+        return pending
 
 
 class NativeDroidServer(NativeDroidServicer):
+    """
+    NativeDroid gRPC servicer. With a worker pool, the analyses run in the worker of the binary, each worker serves
+    them with its own NativeDroidServer, and this one only answers the requests reading the ELF metadata. If the pool
+    forks, GenSummary and AnalyseNativeActivity run in a child forked from the worker after it preloaded the binary,
+    and GenSummaries analyzes its methods in such children in parallel.
 
-    def __init__(self, binary_path, jnsaf_address, jnsaf_port, native_ss_file, java_ss_file):
+    :param WorkerPool worker_pool: Worker processes running the analyses, None to run them in the calling thread
+    :param int library_memory: Memory budget of the loaded library handles, None for the LibraryHandleCache default
+    """
+
+    def __init__(self, binary_path, jnsaf_address, jnsaf_port, native_ss_file, java_ss_file, worker_pool=None,
+                 library_memory=None):
         self._binary_path = binary_path
         self._jnsaf_address = jnsaf_address
         self._jnsaf_port = jnsaf_port
@@ -39,16 +197,99 @@ class NativeDroidServer(NativeDroidServicer):
         self._native_ss_file = native_ss_file
         self._java_ss_file = java_ss_file
         self._call_jnsaf = True  # TODO(fengguow) Add flag for it
+        if library_memory is None:
+            self._library_handles = LibraryHandleCache(cache_dir=cache_dir_for(binary_path))
+        else:
+            self._library_handles = LibraryHandleCache(max_memory=library_memory, cache_dir=cache_dir_for(binary_path))
+        self._prewarm_executor = futures.ThreadPoolExecutor(max_workers=1)
+        self._summary_cache = SummaryCache()
+        self._worker_pool = worker_pool
 
     @classmethod
-    def from_python_package(cls, jnsaf_address, jnsaf_port, binary_path):
+    def from_python_package(cls, jnsaf_address, jnsaf_port, binary_path, worker_pool=None):
         native_ss_file = pkg_resources.resource_filename('nativedroid.data', 'sourceAndSinks/NativeSourcesAndSinks.txt')
         java_ss_file = pkg_resources.resource_filename('nativedroid.data', 'sourceAndSinks/TaintSourcesAndSinks.txt')
-        return cls(binary_path, jnsaf_address, jnsaf_port, native_ss_file, java_ss_file)
+        return cls(binary_path, jnsaf_address, jnsaf_port, native_ss_file, java_ss_file, worker_pool)
 
     @classmethod
-    def from_filesystem(cls, binary_path, jnsaf_address, jnsaf_port, native_ss_file, java_ss_file):
-        return cls(binary_path, jnsaf_address, jnsaf_port, native_ss_file, java_ss_file)
+    def from_filesystem(cls, binary_path, jnsaf_address, jnsaf_port, native_ss_file, java_ss_file, worker_pool=None):
+        return cls(binary_path, jnsaf_address, jnsaf_port, native_ss_file, java_ss_file, worker_pool)
+
+    def _dispatch(self, so_digest, method, request):
+        """
+        Run a method in the worker of given binary, or in the calling thread if there is no worker pool.
+        :param str so_digest: sha256 digest of the binary
+        :param str method: Name of the method
+        :param request: Request message
+        :return: Response message
+        """
+        if self._worker_pool is None:
+            return getattr(self, method)(request)
+        return self._worker_pool.call(so_digest, method, request)
+
+    def _dispatch_analysis(self, so_digest, method, request, context, depth):
+        """
+        Run an analysis, which modifies the loaded project, so a forking pool runs it in a child of the worker of
+        given binary. The analysis gives up at the deadline of the RPC, and as soon as the RPC is cancelled: in the
+        calling thread it polls the context, in a worker the call is cancelled.
+        :param str so_digest: sha256 digest of the binary
+        :param str method: Name of the method running the analysis, called with the request, the deadline and,
+                           without worker pool, the function telling whether the RPC is active
+        :param request: Request message
+        :param context: Servicer context of the RPC
+        :param int depth: Depth of the analysis, the nested analyses JNSaf requests for its summaries are shallower,
+                          so they never wait for the fork slot of the analysis waiting for them
+        :return: Response message
+        """
+        deadline = _deadline(context)
+        if self._worker_pool is None:
+            return getattr(self, method)(request, deadline, context.is_active)
+        call = self._worker_pool.fork_submit(so_digest, method, request, deadline, level=depth)
+        # Callbacks run once the RPC terminates, cancelling a completed call does nothing.
+        context.add_callback(call.cancel)
+        return call.result()
+
+    def _get_library_handle(self, so_digest):
+        """
+        Get the cached handle of given binary.
+        :param str so_digest: sha256 digest of the binary
+        :return: LibraryHandle
+        """
+        return self._library_handles.get(so_digest, self._binary_path + so_digest)
+
+    def preload(self, so_digest):
+        """
+        Load and index given binary once, a forking worker calls it before forking the child running an analysis.
+        The JNIEnv is hooked into the project here too, so all children share one set of JNI hooks.
+        :param str so_digest: sha256 digest of the binary
+        """
+        library_handle = self._get_library_handle(so_digest)
+        library_handle.prewarm()
+        library_handle.get_jni_native_interface(None)
+
+    def _new_jnsaf_client(self, apk_digest, component_name, depth, deadline=None):
+        """
+        Connect to JNSaf for the summaries of the Java methods called by an analysis.
+        :param float deadline: Deadline of the analyzed request in seconds since the epoch, None for no deadline
+        :return: JNSafClient, None if JNSaf is not called
+        """
+        if not self._call_jnsaf:
+            return None
+        return JNSafClient(grpc.insecure_channel('%s:%s' % (self._jnsaf_address, self._jnsaf_port)),
+                           apk_digest, component_name, depth, self._summary_cache, deadline)
+
+    def _prewarm(self, so_digest):
+        """
+        Background job started by LoadBinary, warms up the handle of given binary unless it is already warm.
+        :param str so_digest: sha256 digest of the binary
+        """
+        try:
+            if self._worker_pool is None:
+                self._get_library_handle(so_digest).prewarm()
+            else:
+                self._worker_pool.call(so_digest, '_prewarm', so_digest)
+        except Exception:
+            logger.exception('Prewarm failed for %s', so_digest)
 
     def GenSummary(self, request, context):
         """
@@ -58,24 +299,132 @@ class NativeDroidServer(NativeDroidServicer):
         :return: server_pb2.GenSummaryResponse
         """
         logger.info('Server GenSummary: %s', request)
+        return self._dispatch_analysis(request.so_digest, 'gen_summary', request, context, request.depth)
+
+    def gen_summary(self, request, deadline=None, is_active=None, jnsaf_client=None):
+        """
+        Run the analysis of a GenSummary request.
+        :param GenSummaryRequest request: server_pb2.GenSummaryRequest
+        :param float deadline: Deadline of the RPC in seconds since the epoch, None for no deadline
+        :param is_active: Function telling whether the RPC is still active, None in a worker
+        :param JNSafClient jnsaf_client: JNSaf client shared with other analyses, None to connect a new one
+        :return: server_pb2.GenSummaryResponse
+        """
         depth = request.depth
         if depth is 0:
             return GenSummaryResponse()
-        jnsaf_client = None
-        if self._call_jnsaf:
-            jnsaf_client = JNSafClient(grpc.insecure_channel('%s:%s' % (self._jnsaf_address, self._jnsaf_port)),
-                                       request.apk_digest, request.component_name, depth - 1)
-        so_path = self._binary_path + request.so_digest
+        if jnsaf_client is None:
+            jnsaf_client = self._new_jnsaf_client(request.apk_digest, request.component_name, depth - 1, deadline)
+        library_handle = self._get_library_handle(request.so_digest)
         signature = request.method_signature
         name_or_address = request.jni_func if request.HasField('jni_func') else request.addr
         method_signature = method_signature_str(signature)
         jni_method_arguments = get_params_from_method_signature(signature, False)
         arguments_str = ",".join(java_type_str(arg, False) for arg in jni_method_arguments)
+        analysis_budget = _analysis_budget(request.budget, deadline, is_active)
         taint_analysis_report, safsu_report, total_instructions = gen_summary(
-            jnsaf_client, so_path, name_or_address, method_signature, arguments_str,
-            self._native_ss_file, self._java_ss_file)
+            jnsaf_client, library_handle, name_or_address, method_signature, arguments_str,
+            self._native_ss_file, self._java_ss_file, analysis_budget)
         return GenSummaryResponse(taint=taint_analysis_report, summary=safsu_report,
-                                  analyzed_instructions=total_instructions)
+                                  analyzed_instructions=total_instructions, partial=analysis_budget.partial)
+
+    def GenSummaries(self, request, context):
+        """
+        Gen summaries for given methods of one binary, each response is streamed as soon as its method is analyzed.
+        The methods share the loaded project and its JNI hooks. With a forking worker pool they are analyzed in
+        parallel, each in a child of the worker of the binary. Otherwise they are analyzed one after the other, in a
+        worker by a single call, so the whole batch runs on the handle the worker loaded once.
+        :param GenSummariesRequest request: server_pb2.GenSummariesRequest
+        :param context:
+        :return: Iterator of server_pb2.GenSummariesResponse
+        """
+        logger.info('Server GenSummaries: %d methods of %s', len(request.methods), request.so_digest)
+        requests = [_gen_summary_request(request, method) for method in request.methods]
+        if not requests:
+            return
+        if self._worker_pool is None:
+            results = self._gen_summaries(requests, _deadline(context), context.is_active)
+        elif self._worker_pool.fork:
+            results = self._dispatch_gen_summaries(request.so_digest, requests, context)
+        else:
+            results = self._dispatch_batch(request.so_digest, requests, context)
+        for index, response, error in results:
+            yield GenSummariesResponse(index=index, response=response, error=error)
+
+    def gen_summaries(self, requests, deadline=None):
+        """
+        Run the analyses of GenSummary requests of one binary one after the other in a worker.
+        :param list requests: server_pb2.GenSummaryRequest of the methods
+        :param float deadline: Deadline of the RPC in seconds since the epoch, None for no deadline
+        :return: List of index, server_pb2.GenSummaryResponse and error message
+        """
+        return list(self._gen_summaries(requests, deadline, _worker_call_active))
+
+    def _gen_summaries(self, requests, deadline, is_active):
+        """
+        Run the analyses of GenSummary requests of one binary in the calling thread with one JNSaf client.
+        :param list requests: server_pb2.GenSummaryRequest of the methods
+        :param float deadline: Deadline of the RPC in seconds since the epoch, None for no deadline
+        :param is_active: Function telling whether the RPC is still active
+        :return: Iterator of index, server_pb2.GenSummaryResponse and error message
+        """
+        request = requests[0]
+        jnsaf_client = None
+        if request.depth > 0:
+            jnsaf_client = self._new_jnsaf_client(request.apk_digest, request.component_name, request.depth - 1,
+                                                  deadline)
+        for index, request in enumerate(requests):
+            if not is_active():
+                return
+            try:
+                yield index, self.gen_summary(request, deadline, is_active, jnsaf_client), ''
+            except Exception as e:
+                logger.exception('GenSummaries failed for %s', request.method_signature)
+                yield index, GenSummaryResponse(), str(e)
+
+    def _dispatch_batch(self, so_digest, requests, context):
+        """
+        Run the analyses of GenSummary requests of one binary in its worker by one call, which analyzes them one after
+        the other on the handle of the worker.
+        :param str so_digest: sha256 digest of the binary
+        :param list requests: server_pb2.GenSummaryRequest of the methods
+        :param context: Servicer context of the RPC
+        :return: List of index, server_pb2.GenSummaryResponse and error message
+        """
+        try:
+            return self._dispatch_analysis(so_digest, 'gen_summaries', requests, context, requests[0].depth)
+        except WorkerError as e:
+            logger.error('GenSummaries failed for %s: %s', so_digest, e)
+            return [(index, GenSummaryResponse(), str(e)) for index in xrange(len(requests))]
+
+    def _dispatch_gen_summaries(self, so_digest, requests, context):
+        """
+        Run the analyses of GenSummary requests of one binary in children of its worker, as many at a time as the
+        pool can run.
+        :param str so_digest: sha256 digest of the binary
+        :param list requests: server_pb2.GenSummaryRequest of the methods
+        :param context: Servicer context of the RPC
+        :return: Iterator of index, server_pb2.GenSummaryResponse and error message, in completion order
+        """
+        executor = futures.ThreadPoolExecutor(max_workers=min(len(requests), self._worker_pool.capacity))
+        pending = dict()
+        for index, request in enumerate(requests):
+            future = executor.submit(self._dispatch_analysis, so_digest, 'gen_summary', request, context,
+                                     request.depth)
+            pending[future] = index
+        try:
+            for future in futures.as_completed(pending):
+                index = pending[future]
+                try:
+                    yield index, future.result(), ''
+                except WorkerError as e:
+                    logger.error('GenSummaries failed for %s: %s', requests[index].method_signature, e)
+                    yield index, GenSummaryResponse(), str(e)
+        finally:
+            # The client is gone if the stream was closed early, drop the analyses not started yet.
+            for future in pending:
+                future.cancel()
+            executor.shutdown(wait=False)
 
     def AnalyseNativeActivity(self, request, context):
         """
@@ -85,14 +434,24 @@ class NativeDroidServer(NativeDroidServicer):
         :return: server_pb2.AnalyseNativeActivityResponse
         """
         logger.info('Server AnalyseNativeActivity: %s', request)
-        jnsaf_client = None
-        if self._call_jnsaf:
-            jnsaf_client = JNSafClient(grpc.insecure_channel('%s:%s' % (self._jnsaf_address, self._jnsaf_port)),
-                                       request.apk_digest, request.component_name, 3)
-        so_path = self._binary_path + request.so_digest
+        return self._dispatch_analysis(request.so_digest, 'analyse_native_activity', request, context,
+                                       _NATIVE_ACTIVITY_DEPTH + 1)
+
+    def analyse_native_activity(self, request, deadline=None, is_active=None):
+        """
+        Run the analysis of an AnalyseNativeActivity request.
+        :param AnalyseNativeActivityRequest request: server_pb2.AnalyseNativeActivityRequest
+        :param float deadline: Deadline of the RPC in seconds since the epoch, None for no deadline
+        :param is_active: Function telling whether the RPC is still active, None in a worker
+        :return: server_pb2.AnalyseNativeActivityResponse
+        """
+        jnsaf_client = self._new_jnsaf_client(request.apk_digest, request.component_name, _NATIVE_ACTIVITY_DEPTH,
+                                              deadline)
+        library_handle = self._get_library_handle(request.so_digest)
         custom_entry = request.custom_entry
+        analysis_budget = AnalysisBudget(deadline=deadline, is_active=is_active or _worker_call_active)
         total_instructions = native_activity_analysis(
-            jnsaf_client, so_path, custom_entry, self._native_ss_file, self._java_ss_file)
+            jnsaf_client, library_handle, custom_entry, self._native_ss_file, self._java_ss_file, analysis_budget)
         return AnalyseNativeActivityResponse(total_instructions=total_instructions)
 
     def GetDynamicRegisterMap(self, request, context):
@@ -103,8 +462,16 @@ class NativeDroidServer(NativeDroidServicer):
         :return: server_pb2.GetDynamicRegisterResponse
         """
         logger.info('Server GetDynamicRegisterMap: %s', request)
-        so_path = self._binary_path + request.so_digest
-        dynamic_methods = get_dynamic_register_methods(so_path, None)
+        return self._dispatch(request.so_digest, 'get_dynamic_register_map', request)
+
+    def get_dynamic_register_map(self, request):
+        """
+        Resolve the dynamically registered methods of a GetDynamicRegisterMap request.
+        :param GetDynamicRegisterRequest request: server_pb2.GetDynamicRegisterRequest
+        :return: server_pb2.GetDynamicRegisterResponse
+        """
+        library_handle = self._get_library_handle(request.so_digest)
+        dynamic_methods = get_dynamic_register_methods(library_handle, None)
         method_map = []
         for name, addr in dynamic_methods.items():
             method_map.append(MethodMap(method_name=name, func_addr=addr))
@@ -134,6 +501,7 @@ class NativeDroidServer(NativeDroidServicer):
             with open(so_path, 'wb') as out:
                 out.write(f.getvalue())
             self._loaded_sos.add(so_path)
+        self._prewarm_executor.submit(self._prewarm, so_digest)
         size = len(f.getvalue())
         return LoadBinaryResponse(so_digest=so_digest, length=size)
 
@@ -145,14 +513,54 @@ class NativeDroidServer(NativeDroidServicer):
         :return:
         """
         logger.info('Server HasSymbol: %s', request)
-        so_path = self._binary_path + request.so_digest
-        return HasSymbolResponse(has_symbol=has_symbol(so_path, request.symbol))
+        library_handle = self._get_library_handle(request.so_digest)
+        return HasSymbolResponse(has_symbol=has_symbol(library_handle, request.symbol))
+
+    def HasSymbols(self, request, context):
+        """
+        Check given symbols in the binary file or not, answered from the ELF metadata index.
+        :param HasSymbolsRequest request: server_pb2.HasSymbolsRequest
+        :param context:
+        :return: server_pb2.HasSymbolsResponse
+        """
+        logger.info('Server HasSymbols: %s symbols in %s', len(request.symbols), request.so_digest)
+        elf_metadata = get_elf_metadata(self._get_library_handle(request.so_digest))
+        return HasSymbolsResponse(has_symbol=[elf_metadata.has_symbol(symbol) for symbol in request.symbols])
+
+    def ListJniEntryPoints(self, request, context):
+        """
+        List statically registered JNI methods of the binary file.
+        :param ListJniEntryPointsRequest request: server_pb2.ListJniEntryPointsRequest
+        :param context:
+        :return: server_pb2.ListJniEntryPointsResponse
+        """
+        logger.info('Server ListJniEntryPoints: %s', request)
+        elf_metadata = get_elf_metadata(self._get_library_handle(request.so_digest))
+        return ListJniEntryPointsResponse(jni_func=elf_metadata.jni_entry_points,
+                                          has_jni_on_load=elf_metadata.has_jni_on_load)
+
 
+def serve(binary_path, address, port, jnsaf_address, jnsaf_port, native_ss_file, java_ss_file, workers=None,
+          fork=False):
+    """
+    Run the NativeDroid server until interrupted.
 
-def serve(binary_path, address, port, jnsaf_address, jnsaf_port, native_ss_file, java_ss_file):
-    server = grpc.server(futures.ThreadPoolExecutor(max_workers=10))
+    :param int workers: Number of worker processes running the analyses, None to size the pool to the cores and
+                        memory of the machine, 0 to run the analyses in the server threads
+    :param bool fork: Whether the workers preload each binary once and fork a child per analysis
+    """
+    worker_pool = None
+    if workers != 0:
+        worker_pool = WorkerPool(functools.partial(NativeDroidServer, binary_path, jnsaf_address, jnsaf_port,
+                                                   native_ss_file, java_ss_file, library_memory=WORKER_MEMORY),
+                                 workers, fork)
+        # Fork the workers before gRPC starts any thread.
+        worker_pool.start()
+    max_workers = 10 if worker_pool is None else max(10, 2 * worker_pool.capacity)
+    server = grpc.server(futures.ThreadPoolExecutor(max_workers=max_workers))
     add_NativeDroidServicer_to_server(
-        NativeDroidServer.from_filesystem(binary_path, jnsaf_address, jnsaf_port, native_ss_file, java_ss_file), server)
+        NativeDroidServer.from_filesystem(binary_path, jnsaf_address, jnsaf_port, native_ss_file, java_ss_file,
+                                          worker_pool), server)
     server.add_insecure_port('%s:%s' % (address, port))
     server.start()
     logger.info('Server started.')
@@ -161,4 +569,6 @@ def serve(binary_path, address, port, jnsaf_address, jnsaf_port, native_ss_file,
             time.sleep(_ONE_DAY_IN_SECONDS)
     except KeyboardInterrupt:
         server.stop(0)
+        if worker_pool is not None:
+            worker_pool.shutdown()
     logger.info('Server stopped.')
@@ -51,7 +51,40 @@ class NativeDroidServerTest(unittest.TestCase):
                                                         symbol='Java_org_arguslab_native_1leak_MainActivity_send'))
         self.assertTrue(response.has_symbol)
 
+    def testHasSymbols(self):
+        response = self.stub.HasSymbols(HasSymbolsRequest(so_digest=self._lb_response.so_digest,
+                                                          symbols=['Java_org_arguslab_native_1leak_MainActivity_send',
+                                                                   'Java_org_arguslab_native_1leak_MainActivity_none']))
+        self.assertEqual([True, False], list(response.has_symbol))
+
+    def testListJniEntryPoints(self):
+        response = self.stub.ListJniEntryPoints(ListJniEntryPointsRequest(so_digest=self._lb_response.so_digest))
+        self.assertIn('Java_org_arguslab_native_1leak_MainActivity_send', response.jni_func)
+
     def testGenSummary(self):
+        request = GenSummaryRequest(apk_digest='', so_digest=self._lb_response.so_digest,
+                                    jni_func='Java_org_arguslab_native_1leak_MainActivity_send',
+                                    method_signature=self._send_signature(), depth=1)
+        response = self.stub.GenSummary(request)
+        self.assertEqual('Lorg/arguslab/native_leak/MainActivity;.send:(Ljava/lang/String;)V -> _SINK_ 1',
+                         response.taint)
+
+    def testGenSummaries(self):
+        method = JniMethod(jni_func='Java_org_arguslab_native_1leak_MainActivity_send',
+                           method_signature=self._send_signature())
+        missing = JniMethod(jni_func='Java_org_arguslab_native_1leak_MainActivity_none',
+                            method_signature=self._send_signature())
+        request = GenSummariesRequest(apk_digest='', so_digest=self._lb_response.so_digest,
+                                      methods=[method, missing, method], depth=1)
+        responses = sorted(self.stub.GenSummaries(request), key=lambda r: r.index)
+        self.assertEqual([0, 1, 2], [response.index for response in responses])
+        self.assertEqual('Lorg/arguslab/native_leak/MainActivity;.send:(Ljava/lang/String;)V -> _SINK_ 1',
+                         responses[0].response.taint)
+        self.assertEqual('', responses[1].response.taint)
+        self.assertEqual(responses[0].response.taint, responses[2].response.taint)
+
+    @staticmethod
+    def _send_signature():
         package_pb = JavaPackage(name='org')
         package_pb = JavaPackage(name='arguslab', parent=package_pb)
         package_pb = JavaPackage(name='native_leak', parent=package_pb)
@@ -62,13 +95,7 @@ class NativeDroidServerTest(unittest.TestCase):
         class_type_pb = ClassType(package=package_pb, name='String', unknown=False)
         proto = MethodProto(param_types=[JavaType(class_type=class_type_pb)],
                             return_void_type=VoidType())
-        method_signature_pb = MethodSignature(owner=java_type_pb, name='send', proto=proto)
-        request = GenSummaryRequest(apk_digest='', so_digest=self._lb_response.so_digest,
-                                    jni_func='Java_org_arguslab_native_1leak_MainActivity_send',
-                                    method_signature=method_signature_pb, depth=1)
-        response = self.stub.GenSummary(request)
-        self.assertEqual('Lorg/arguslab/native_leak/MainActivity;.send:(Ljava/lang/String;)V -> _SINK_ 1',
-                         response.taint)
+        return MethodSignature(owner=java_type_pb, name='send', proto=proto)
 
 
 if __name__ == '__main__':
@@ -0,0 +1,135 @@
+import threading
+import time
+from collections import OrderedDict
+
+__author__ = "Fengguo Wei"
+__copyright__ = "Copyright 2018, The Argus-SAF Project"
+__license__ = "Apache v2.0"
+
+
+class SummaryCache(object):
+    """
+    LRU cache of JNSaf GetSummary responses keyed by (apk_digest, signature, depth), shared by all analyses of an
+    APK. Empty responses are cached as well, but only for negative_ttl seconds, as JNSaf may produce the summary
+    later. Requests in flight are tracked as well, so a summary is fetched only once even if several analyses ask
+    for it before JNSaf responds. A request is final if JNSaf generates the summary for it, otherwise an empty
+    response only tells the summary is not generated yet.
+
+    :param int max_entries: Maximum number of cached responses
+    :param float negative_ttl: Seconds an empty response is kept
+    """
+
+    def __init__(self, max_entries=4096, negative_ttl=60):
+        self._max_entries = max_entries
+        self._negative_ttl = negative_ttl
+        self._entries = OrderedDict()
+        self._pending = dict()
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._entries)
+
+    @staticmethod
+    def is_empty(response):
+        return not response.taint_result and not response.HasField('heap_summary')
+
+    def get(self, key):
+        """
+        Get cached response.
+
+        :param tuple key: (apk_digest, signature, depth)
+        :return: GetSummaryResponse or None
+        """
+        with self._lock:
+            entry = self._entries.pop(key, None)
+            if entry is None:
+                return None
+            response, expires = entry
+            if expires is not None and expires < time.time():
+                return None
+            self._entries[key] = entry
+            return response
+
+    def put(self, key, response):
+        """
+        Cache response, evicting the least recently used entries if full.
+
+        :param tuple key: (apk_digest, signature, depth)
+        :param GetSummaryResponse response: JNSaf response
+        """
+        expires = time.time() + self._negative_ttl if self.is_empty(response) else None
+        with self._lock:
+            self._entries.pop(key, None)
+            self._entries[key] = (response, expires)
+            while len(self._entries) > self._max_entries:
+                self._entries.popitem(last=False)
+
+    def get_pending(self, key, final=False):
+        """
+        Get the future of a response still in flight.
+
+        :param tuple key: (apk_digest, signature, depth)
+        :param bool final: Whether only a final request counts
+        :return: Future of GetSummaryResponse or None
+        """
+        with self._lock:
+            entry = self._pending.get(key)
+        if entry is None or (final and not entry[1]):
+            return None
+        return entry[0]
+
+    def add_pending(self, key, future, final=True):
+        """
+        Track a response in flight, it is cached once the future completes successfully. A final request replaces
+        a request in flight which is not.
+
+        :param tuple key: (apk_digest, signature, depth)
+        :param future: Future of GetSummaryResponse
+        :param bool final: Whether JNSaf generates the summary for the request, an empty response of any other
+                           request is not cached
+        :return: The future tracked for key, which is an earlier one if the key is already in flight.
+        """
+        with self._lock:
+            entry = self._pending.get(key)
+            if entry is None or (final and not entry[1]):
+                entry = self._pending[key] = (future, final)
+        if entry[0] is future:
+            future.add_done_callback(lambda f: self._complete(key, f, final))
+        return entry[0]
+
+    def wait_pending(self, key, timeout=None):
+        """
+        Wait for the requests in flight for key until one of them gives a final or non-empty response, or take it
+        from the cache if they completed already.
+
+        :param tuple key: (apk_digest, signature, depth)
+        :param float timeout: Seconds to wait, None to wait until the requests complete
+        :return: GetSummaryResponse, None if no request in flight had the summary
+        :raises Exception: What the future of a failed request raises, also if it did not complete in time
+        """
+        deadline = time.time() + timeout if timeout is not None else None
+        waited = None
+        while True:
+            with self._lock:
+                entry = self._pending.get(key)
+            if entry is None:
+                # Completed meanwhile, a final or non-empty response is cached.
+                return self.get(key)
+            if entry[0] is waited:
+                return None
+            waited, final = entry
+            response = waited.result(timeout=max(0, deadline - time.time()) if deadline is not None else None)
+            if final or not self.is_empty(response):
+                return response
+
+    def _complete(self, key, future, final):
+        try:
+            if future.exception() is None and (final or not self.is_empty(future.result())):
+                self.put(key, future.result())
+        except Exception:
+            # Cancelled, the summary is fetched again when needed.
+            pass
+        with self._lock:
+            entry = self._pending.get(key)
+            if entry is not None and entry[0] is future:
+                del self._pending[key]
@@ -0,0 +1,91 @@
+import unittest
+
+from concurrent import futures
+
+from nativedroid.protobuf.jnsaf_grpc_pb2 import GetSummaryResponse
+from nativedroid.server.summary_cache import SummaryCache
+
+
+class SummaryCacheTest(unittest.TestCase):
+    def testLRU(self):
+        cache = SummaryCache(max_entries=2)
+        cache.put(('apk', 'a', 1), GetSummaryResponse(taint_result='a'))
+        cache.put(('apk', 'b', 1), GetSummaryResponse(taint_result='b'))
+        self.assertEqual('a', cache.get(('apk', 'a', 1)).taint_result)
+        cache.put(('apk', 'c', 1), GetSummaryResponse(taint_result='c'))
+        self.assertEqual(2, len(cache))
+        self.assertIsNone(cache.get(('apk', 'b', 1)))
+        self.assertIsNone(cache.get(('apk', 'a', 2)))
+
+    def testNegativeCaching(self):
+        cache = SummaryCache()
+        cache.put(('apk', 'a', 1), GetSummaryResponse())
+        self.assertTrue(SummaryCache.is_empty(cache.get(('apk', 'a', 1))))
+        expired = SummaryCache(negative_ttl=-1)
+        expired.put(('apk', 'a', 1), GetSummaryResponse())
+        self.assertIsNone(expired.get(('apk', 'a', 1)))
+
+    def testPending(self):
+        cache = SummaryCache()
+        future = futures.Future()
+        self.assertIs(future, cache.add_pending(('apk', 'a', 1), future))
+        self.assertIs(future, cache.add_pending(('apk', 'a', 1), futures.Future()))
+        self.assertIs(future, cache.get_pending(('apk', 'a', 1)))
+        self.assertIsNone(cache.get(('apk', 'a', 1)))
+        future.set_result(GetSummaryResponse(taint_result='a'))
+        self.assertIsNone(cache.get_pending(('apk', 'a', 1)))
+        self.assertEqual('a', cache.get(('apk', 'a', 1)).taint_result)
+        failed = futures.Future()
+        cache.add_pending(('apk', 'b', 1), failed)
+        failed.set_exception(RuntimeError('unavailable'))
+        self.assertIsNone(cache.get_pending(('apk', 'b', 1)))
+        self.assertIsNone(cache.get(('apk', 'b', 1)))
+
+    def testPendingNotGenerated(self):
+        cache = SummaryCache()
+        empty = futures.Future()
+        cache.add_pending(('apk', 'a', 1), empty, final=False)
+        empty.set_result(GetSummaryResponse())
+        self.assertIsNone(cache.get_pending(('apk', 'a', 1)))
+        self.assertIsNone(cache.get(('apk', 'a', 1)))
+        found = futures.Future()
+        cache.add_pending(('apk', 'b', 1), found, final=False)
+        found.set_result(GetSummaryResponse(taint_result='b'))
+        self.assertEqual('b', cache.get(('apk', 'b', 1)).taint_result)
+
+    def testFinalReplacesPending(self):
+        cache = SummaryCache()
+        lookup = futures.Future()
+        generating = futures.Future()
+        cache.add_pending(('apk', 'a', 1), lookup, final=False)
+        self.assertIsNone(cache.get_pending(('apk', 'a', 1), final=True))
+        self.assertIs(generating, cache.add_pending(('apk', 'a', 1), generating))
+        self.assertIs(generating, cache.add_pending(('apk', 'a', 1), futures.Future(), final=False))
+        lookup.set_result(GetSummaryResponse())
+        generating.set_result(GetSummaryResponse())
+        self.assertTrue(SummaryCache.is_empty(cache.get(('apk', 'a', 1))))
+
+    def testWaitPending(self):
+        cache = SummaryCache()
+        self.assertIsNone(cache.wait_pending(('apk', 'a', 1)))
+        lookup = futures.Future()
+        cache.add_pending(('apk', 'a', 1), lookup, final=False)
+        lookup.set_result(GetSummaryResponse())
+        # An empty lookup does not tell whether the summary exists.
+        self.assertIsNone(cache.wait_pending(('apk', 'a', 1)))
+        generating = futures.Future()
+        cache.add_pending(('apk', 'b', 1), generating)
+        generating.set_result(GetSummaryResponse())
+        self.assertTrue(SummaryCache.is_empty(cache.wait_pending(('apk', 'b', 1))))
+        found = futures.Future()
+        cache.add_pending(('apk', 'c', 1), found, final=False)
+        found.set_result(GetSummaryResponse(taint_result='c'))
+        self.assertEqual('c', cache.wait_pending(('apk', 'c', 1)).taint_result)
+        waiting = futures.Future()
+        cache.add_pending(('apk', 'd', 1), waiting, final=False)
+        with self.assertRaises(futures.TimeoutError):
+            cache.wait_pending(('apk', 'd', 1), 0.01)
+
+
+if __name__ == '__main__':
+    unittest.main()
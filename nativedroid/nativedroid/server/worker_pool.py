@@ -0,0 +1,509 @@
+import itertools
+import logging
+import multiprocessing
+import os
+import select
+import signal
+import threading
+import traceback
+import zlib
+from collections import Counter, deque
+
+__author__ = "Fengguo Wei"
+__copyright__ = "Copyright 2018, The Argus-SAF Project"
+__license__ = "Apache v2.0"
+
+logger = logging.getLogger('nativedroid.server.WorkerPool')
+
+# Memory budget of one worker, its library handles are bounded by it.
+WORKER_MEMORY = 2 * 1024 * 1024 * 1024
+
+# Method name of the message cancelling a call.
+_CANCEL = '__cancel__'
+
+# Seconds between looking for finished calls while forked calls wait for them.
+_POLL_INTERVAL = 0.05
+
+# In a worker process: ids of the running calls cancelled by the caller, and id of the call running in the current
+# thread.
+_cancelled_calls = set()
+_running = threading.local()
+
+
+def available_memory():
+    """
+    Get the memory available for new processes.
+
+    :return: Available memory in bytes, 0 if it cannot be read.
+    :rtype: int
+    """
+    try:
+        with open('/proc/meminfo') as f:
+            for line in f:
+                if line.startswith('MemAvailable:'):
+                    return int(line.split()[1]) * 1024
+    except (IOError, OSError, IndexError, ValueError):
+        pass
+    return 0
+
+
+def default_worker_count(worker_memory=WORKER_MEMORY):
+    """
+    Number of workers the machine can run: one per core, as long as each gets worker_memory.
+
+    :param int worker_memory: Memory budget of one worker in bytes
+    :rtype: int
+    """
+    workers = multiprocessing.cpu_count()
+    memory = available_memory()
+    if memory:
+        workers = min(workers, memory // worker_memory)
+    return max(1, workers)
+
+
+class WorkerError(Exception):
+    """
+    A call failed inside a worker, the worker died while serving it or the call was cancelled.
+    """
+
+
+def call_cancelled():
+    """
+    Whether the caller cancelled the call running in this worker, for long calls to poll and give up early. It is
+    always False outside the workers, and in forked children, which are killed when their call is cancelled.
+
+    :rtype: bool
+    """
+    call_id = getattr(_running, 'call_id', None)
+    return call_id is not None and call_id in _cancelled_calls
+
+
+def _invoke(target, method, args):
+    try:
+        return True, getattr(target, method)(*args)
+    except Exception:
+        return False, traceback.format_exc()
+
+
+def _run_call(target, conn, send_lock, call_id, method, args):
+    _running.call_id = call_id
+    result = _invoke(target, method, args)
+    with send_lock:
+        conn.send((call_id,) + result)
+
+
+def _fork_call(target, conn, children, method, args):
+    """
+    Run a call in a forked child of the worker, which starts from the current image of the worker through
+    copy-on-write pages and exits after sending the result.
+
+    :return: Connection the result is received from and the child pid
+    """
+    result_reader, result_writer = multiprocessing.Pipe(False)
+    pid = os.fork()
+    if pid == 0:
+        try:
+            conn.close()
+            result_reader.close()
+            for child_conn in children:
+                child_conn.close()
+            result_writer.send(_invoke(target, method, args))
+        finally:
+            os._exit(0)
+    result_writer.close()
+    return result_reader, pid
+
+
+def _cancel_forked_call(call_id, queued, children):
+    for message in queued:
+        if message[0] == call_id:
+            queued.remove(message)
+            return
+    for child_call_id, pid, _ in children.itervalues():
+        if child_call_id == call_id:
+            # The caller ignores the result the worker sends once it sees the child died.
+            os.kill(pid, signal.SIGKILL)
+            return
+
+
+def _worker_main(factory, conn, max_children):
+    target = factory()
+    send_lock = threading.Lock()
+    # Call id to the thread running the call in the worker.
+    threads = dict()
+    # Connection of a forked child to its call id, pid and level.
+    children = dict()
+    queued = deque()
+    while True:
+        for call_id, thread in threads.items():
+            if not thread.is_alive():
+                del threads[call_id]
+                _cancelled_calls.discard(call_id)
+        timeout = _POLL_INTERVAL if queued and threads else None
+        readable, _, _ = select.select([conn] + children.keys(), [], [], timeout)
+        for ready in readable:
+            if ready is conn:
+                try:
+                    message = conn.recv()
+                except (EOFError, IOError):
+                    message = None
+                if message is None:
+                    for _, pid, _ in children.itervalues():
+                        os.kill(pid, signal.SIGKILL)
+                    return
+                call_id, key, _, method, args = message
+                if method == _CANCEL:
+                    if call_id in threads:
+                        _cancelled_calls.add(call_id)
+                    else:
+                        _cancel_forked_call(call_id, queued, children)
+                elif key is None:
+                    thread = threading.Thread(target=_run_call, args=(target, conn, send_lock, call_id, method, args))
+                    thread.daemon = True
+                    thread.start()
+                    threads[call_id] = thread
+                else:
+                    queued.append(message)
+            else:
+                call_id, pid, _ = children.pop(ready)
+                try:
+                    result = ready.recv()
+                except (EOFError, IOError):
+                    result = (False, 'Child %d of worker %d died.' % (pid, os.getpid()))
+                ready.close()
+                os.waitpid(pid, 0)
+                with send_lock:
+                    conn.send((call_id,) + result)
+        # A child forked while a thread runs would inherit the locks the thread holds.
+        if queued and not any(thread.is_alive() for thread in threads.itervalues()):
+            _fork_queued(target, conn, send_lock, max_children, queued, children)
+
+
+def _fork_queued(target, conn, send_lock, max_children, queued, children):
+    """
+    Fork the queued calls in order, as long as fewer than max_children children of their level are running.
+    """
+    running = Counter(level for _, _, level in children.itervalues())
+    for message in list(queued):
+        call_id, key, level, method, args = message
+        if running[level] >= max_children:
+            continue
+        queued.remove(message)
+        ok, error = _invoke(target, 'preload', (key,))
+        if not ok:
+            with send_lock:
+                conn.send((call_id, False, error))
+            continue
+        result_reader, pid = _fork_call(target, conn, children, method, args)
+        children[result_reader] = (call_id, pid, level)
+        running[level] += 1
+
+
+class WorkerProcess(object):
+    """
+    A process serving calls on the object built by factory. The process is forked, so factory and its arguments
+    need not be picklable, but the call arguments and results are sent through a pipe. Each call runs in its own
+    thread of the worker, so a call never waits for another one, which may be waiting for it through a nested
+    request. Forked calls are the exception: the worker preloads their key with `target.preload(key)` and runs each
+    in a forked child, once no thread of the worker is running. Up to max_children children of each level run at
+    the same time: a call waiting for nested calls passes a higher level than they do, so a nested call never waits
+    for the slot held by the call waiting for it. Children never change the worker, so every call starts from the
+    same preloaded image. A cancelled call fails at once: a forked
+    one is dropped or its child is killed, one running in the worker can poll call_cancelled to stop early.
+
+    The worker is forked only by start, which has to be called before the process starts any other thread. A dead
+    worker is not started again, as that would fork the threads of the caller too, its calls fail instead.
+
+    :param factory: Function building the target of the calls, called once in the worker
+    :param int max_children: Maximum number of forked calls of one level running at the same time
+    """
+
+    def __init__(self, factory, max_children=1):
+        self._factory = factory
+        self._max_children = max_children
+        self._lock = threading.Lock()
+        self._call_ids = itertools.count()
+        self._process = None
+        self._conn = None
+        self._pending = None
+
+    @property
+    def pid(self):
+        return self._process.pid if self._process is not None else None
+
+    @property
+    def alive(self):
+        return self._conn is not None and self._process.is_alive()
+
+    def start(self):
+        with self._lock:
+            if self._process is not None:
+                return
+            parent_conn, child_conn = multiprocessing.Pipe()
+            self._process = multiprocessing.Process(target=_worker_main,
+                                                    args=(self._factory, child_conn, self._max_children))
+            self._process.daemon = True
+            self._process.start()
+            child_conn.close()
+            self._conn = parent_conn
+            self._pending = dict()
+            reader = threading.Thread(target=self._read_results,
+                                      args=(parent_conn, self._pending, self._process.pid))
+            reader.daemon = True
+            reader.start()
+
+    def _read_results(self, conn, pending, pid):
+        while True:
+            try:
+                call_id, ok, result = conn.recv()
+            except (EOFError, IOError):
+                break
+            with self._lock:
+                call = pending.pop(call_id, None)
+            # Cancelled calls are already completed.
+            if call is not None:
+                call.complete(ok, result)
+        with self._lock:
+            if self._conn is conn:
+                self._conn = None
+            calls = pending.values()
+            pending.clear()
+        conn.close()
+        logger.error('Worker %d exited, it is not started again.', pid)
+        for call in calls:
+            call.complete(False, 'Worker %d died.' % pid)
+
+    def call(self, method, *args):
+        """
+        Call a method of the target in the worker and wait for the result.
+
+        :param str method: Method name
+        :return: Result of the method
+        :raises WorkerError: The method raised or the worker died
+        """
+        return self.submit(None, method, *args).result()
+
+    def fork_call(self, key, method, *args, **kwargs):
+        """
+        Call a method of the target in a child forked from the worker after preloading given key.
+
+        :param str key: Key passed to `target.preload`
+        :param str method: Method name
+        :param int level: Level of the call, see submit
+        :return: Result of the method
+        :raises WorkerError: The method raised or the worker or child died
+        """
+        return self.submit(key, method, *args, **kwargs).result()
+
+    def submit(self, key, method, *args, **kwargs):
+        """
+        Send a call to the worker without waiting for it.
+
+        :param str key: Key to preload before running the call in a forked child, None to run it in the worker
+        :param str method: Method name
+        :param int level: Level of a forked call, higher than the level of the nested calls it waits for, 0 by
+                          default
+        :rtype: WorkerCall
+        """
+        level = kwargs.pop('level', 0)
+        with self._lock:
+            call = WorkerCall(self, next(self._call_ids), key)
+            if self._conn is None:
+                call.complete(False, 'Worker %s is not running.' % self.pid)
+                return call
+            self._pending[call.call_id] = call
+            try:
+                self._conn.send((call.call_id, key, level, method, args))
+            except IOError:
+                # The reader fails the pending calls once it sees the worker is gone.
+                pass
+        return call
+
+    def cancel(self, call):
+        """
+        Cancel a call, it fails with WorkerError if it has not completed yet.
+
+        :param WorkerCall call: Call sent to this worker
+        :return: Whether the call was cancelled
+        :rtype: bool
+        """
+        with self._lock:
+            if self._pending is None or self._pending.pop(call.call_id, None) is None:
+                return False
+            if self._conn is not None:
+                try:
+                    self._conn.send((call.call_id, None, 0, _CANCEL, ()))
+                except IOError:
+                    pass
+        call.complete(False, 'Call %d was cancelled.' % call.call_id)
+        return True
+
+    def stop(self):
+        with self._lock:
+            if self._process is None:
+                return
+            if self._conn is not None:
+                try:
+                    self._conn.send(None)
+                except IOError:
+                    pass
+            self._process.join(1)
+            if self._process.is_alive():
+                self._process.terminate()
+            self._process = None
+            self._conn = None
+
+
+class WorkerCall(object):
+    """
+    A call sent to a worker process.
+    """
+
+    def __init__(self, worker, call_id, key):
+        self._worker = worker
+        self._call_id = call_id
+        self._key = key
+        self._done = threading.Event()
+        self._ok = None
+        self._result = None
+
+    @property
+    def call_id(self):
+        return self._call_id
+
+    @property
+    def key(self):
+        return self._key
+
+    def cancel(self):
+        """
+        Give up on the call and stop it in the worker.
+
+        :return: Whether the call was cancelled, False if it has already completed
+        """
+        return self._worker.cancel(self)
+
+    def complete(self, ok, result):
+        self._ok = ok
+        self._result = result
+        self._done.set()
+
+    def result(self):
+        """
+        Wait for the call to complete.
+
+        :return: Result of the method
+        :raises WorkerError: The method raised, the worker or child died or the call was cancelled
+        """
+        self._done.wait()
+        if not self._ok:
+            raise WorkerError(self._result)
+        return self._result
+
+
+class WorkerPool(object):
+    """
+    Worker processes running the analyses, which are pure Python and would serialize on the GIL in threads. Calls
+    are routed by a key, the so_digest, so a library is always analyzed by the same worker, where its loaded project
+    stays warm, unless that worker died: its keys move on to the next live worker. In fork mode, the analyses run in children forked from the worker of the library, which keeps the
+    preloaded library pristine and analyzes methods of the same library in parallel.
+
+    :param factory: Function building the target of the calls in each worker
+    :param int num_workers: Number of workers, None to size the pool by default_worker_count
+    :param bool fork: Whether fork_call runs the calls in forked children
+    :param int max_children: Maximum number of forked calls of one level per worker, None to share the cores among
+                             the workers
+    """
+
+    def __init__(self, factory, num_workers=None, fork=False, max_children=None):
+        if num_workers is None:
+            num_workers = default_worker_count()
+        if max_children is None:
+            max_children = max(1, multiprocessing.cpu_count() // num_workers)
+        self._fork = fork
+        self._max_children = max_children
+        self._workers = [WorkerProcess(factory, max_children) for _ in xrange(num_workers)]
+
+    def __len__(self):
+        return len(self._workers)
+
+    @property
+    def fork(self):
+        return self._fork
+
+    @property
+    def capacity(self):
+        """
+        Number of analyses of one level the pool runs at the same time.
+        """
+        return len(self._workers) * self._max_children if self._fork else len(self._workers)
+
+    def start(self):
+        """
+        Start all workers. Call it before starting any gRPC channel or server, as they must not be forked.
+        """
+        for worker in self._workers:
+            worker.start()
+        logger.info('Started %d workers.', len(self._workers))
+
+    def worker_for(self, key):
+        """
+        :param str key: Routing key
+        :return: The worker of the key, or the next live one if it died
+        :rtype: WorkerProcess
+        """
+        index = (zlib.crc32(key) & 0xffffffff) % len(self._workers)
+        for offset in xrange(len(self._workers)):
+            worker = self._workers[(index + offset) % len(self._workers)]
+            if worker.alive:
+                return worker
+        return self._workers[index]
+
+    def call(self, key, method, *args):
+        """
+        Call a method of the target in the worker of given key.
+
+        :param str key: Routing key
+        :param str method: Method name
+        :return: Result of the method
+        """
+        return self.worker_for(key).call(method, *args)
+
+    def submit(self, key, method, *args):
+        """
+        Send a call to the worker of given key without waiting for it.
+
+        :param str key: Routing key
+        :param str method: Method name
+        :rtype: WorkerCall
+        """
+        return self.worker_for(key).submit(None, method, *args)
+
+    def fork_submit(self, key, method, *args, **kwargs):
+        """
+        Send a call like fork_call without waiting for it.
+
+        :param str key: Routing key, passed to `target.preload` in fork mode
+        :param str method: Method name
+        :param int level: Level of the call, see fork_call
+        :rtype: WorkerCall
+        """
+        return self.worker_for(key).submit(key if self._fork else None, method, *args, **kwargs)
+
+    def fork_call(self, key, method, *args, **kwargs):
+        """
+        Call a method of the target which may modify it. In fork mode it runs in a child forked from the worker of
+        given key after the key is preloaded, otherwise in the worker like call. The forked calls of each level are
+        limited separately, so a call waiting for nested calls, e.g. through a JNSaf summary request, has to pass a
+        higher level than they do.
+
+        :param str key: Routing key, passed to `target.preload` in fork mode
+        :param str method: Method name
+        :param int level: Level of the call, 0 by default
+        :return: Result of the method
+        """
+        return self.fork_submit(key, method, *args, **kwargs).result()
+
+    def shutdown(self):
+        for worker in self._workers:
+            worker.stop()
@@ -0,0 +1,203 @@
+import os
+import shutil
+import tempfile
+import threading
+import time
+import unittest
+
+from nativedroid.server.worker_pool import *
+
+
+class _Target(object):
+    def __init__(self, name):
+        self.name = name
+        self.preloaded = []
+        self.changes = []
+
+    def preload(self, key):
+        if key not in self.preloaded:
+            self.preloaded.append(key)
+
+    def change(self, seconds=0):
+        time.sleep(seconds)
+        self.changes.append(seconds)
+        return list(self.preloaded), list(self.changes), os.getpid()
+
+    def describe(self, value):
+        return self.name, os.getpid(), value
+
+    def wait_cancelled(self, seconds, path=None):
+        deadline = time.time() + seconds
+        while not call_cancelled() and time.time() < deadline:
+            time.sleep(0.01)
+        if path is not None and call_cancelled():
+            self.touch(path)
+        return call_cancelled()
+
+    def wait_file(self, path, seconds):
+        deadline = time.time() + seconds
+        while not os.path.exists(path) and time.time() < deadline:
+            time.sleep(0.01)
+        return os.path.exists(path)
+
+    def touch(self, path):
+        open(path, 'w').close()
+
+    def fail(self):
+        raise ValueError('failed')
+
+    def exit(self):
+        os._exit(1)
+
+
+class WorkerPoolTest(unittest.TestCase):
+    def setUp(self):
+        self.pool = WorkerPool(lambda: _Target('worker'), 2)
+        self.pool.start()
+
+    def tearDown(self):
+        self.pool.shutdown()
+
+    def testCall(self):
+        name, pid, value = self.pool.call('so_digest', 'describe', 42)
+        self.assertEqual('worker', name)
+        self.assertEqual(42, value)
+        self.assertNotEqual(os.getpid(), pid)
+        self.assertEqual(pid, self.pool.worker_for('so_digest').pid)
+        self.assertEqual(pid, self.pool.call('so_digest', 'describe', 0)[1])
+
+    def testError(self):
+        with self.assertRaises(WorkerError) as cm:
+            self.pool.call('so_digest', 'fail')
+        self.assertIn('ValueError: failed', str(cm.exception))
+        self.assertEqual(1, self.pool.call('so_digest', 'describe', 1)[2])
+
+    def testWorkerDied(self):
+        worker = self.pool.worker_for('so_digest')
+        with self.assertRaises(WorkerError):
+            self.pool.call('so_digest', 'exit')
+        self.assertFalse(worker.alive)
+        # The worker is not forked again, its keys move on to the other worker.
+        _, pid, _ = self.pool.call('so_digest', 'describe', 0)
+        self.assertNotEqual(worker.pid, pid)
+        with self.assertRaises(WorkerError):
+            worker.call('describe', 0)
+
+    def testNestedCall(self):
+        # Like a GenSummary whose JNSaf summary request issues a GenSummary for the same binary.
+        tmp_dir = tempfile.mkdtemp()
+        try:
+            path = os.path.join(tmp_dir, 'nested')
+            outer = self.pool.submit('so_digest', 'wait_file', path, 10)
+            time.sleep(0.2)
+            start = time.time()
+            self.pool.call('so_digest', 'touch', path)
+            self.assertTrue(outer.result())
+            self.assertLess(time.time() - start, 5)
+        finally:
+            shutil.rmtree(tmp_dir)
+
+    def testCancel(self):
+        call = self.pool.submit('so_digest', 'wait_cancelled', 10)
+        time.sleep(0.2)
+        self.assertTrue(call.cancel())
+        self.assertFalse(call.cancel())
+        with self.assertRaises(WorkerError):
+            call.result()
+        # The running call saw the cancellation and returned, so the worker is free again.
+        start = time.time()
+        self.assertFalse(self.pool.call('so_digest', 'wait_cancelled', 0))
+        self.assertLess(time.time() - start, 5)
+
+    def testCancelConcurrent(self):
+        tmp_dir = tempfile.mkdtemp()
+        try:
+            paths = [os.path.join(tmp_dir, str(index)) for index in xrange(2)]
+            calls = [self.pool.submit('so_digest', 'wait_cancelled', 10, path) for path in paths]
+            time.sleep(0.2)
+            for call in calls:
+                self.assertTrue(call.cancel())
+            # Both running calls saw their cancellation.
+            self.assertTrue(self.pool.call('so_digest', 'wait_file', paths[0], 5))
+            self.assertTrue(self.pool.call('so_digest', 'wait_file', paths[1], 5))
+        finally:
+            shutil.rmtree(tmp_dir)
+
+    def testDefaultWorkerCount(self):
+        self.assertGreaterEqual(default_worker_count(), 1)
+        self.assertEqual(1, default_worker_count(worker_memory=1 << 62))
+
+
+class ForkingWorkerPoolTest(unittest.TestCase):
+    def setUp(self):
+        self.pool = WorkerPool(lambda: _Target('worker'), 1, fork=True, max_children=2)
+        self.pool.start()
+
+    def tearDown(self):
+        self.pool.shutdown()
+
+    def testCapacity(self):
+        self.assertEqual(2, self.pool.capacity)
+
+    def testForkCall(self):
+        worker_pid = self.pool.worker_for('so_digest').pid
+        for _ in xrange(2):
+            preloaded, changes, pid = self.pool.fork_call('so_digest', 'change')
+            self.assertEqual(['so_digest'], preloaded)
+            self.assertEqual([0], changes)
+            self.assertNotEqual(worker_pid, pid)
+        # The children did not change the worker.
+        self.assertEqual(([0], worker_pid), self.pool.call('so_digest', 'change')[1:])
+
+    def testParallel(self):
+        results = []
+        threads = [threading.Thread(target=lambda: results.append(self.pool.fork_call('so_digest', 'change', 0.5)))
+                   for _ in xrange(2)]
+        start = time.time()
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertLess(time.time() - start, 0.9)
+        self.assertEqual(2, len(set(pid for _, _, pid in results)))
+
+    def testCancel(self):
+        calls = [self.pool.fork_submit('so_digest', 'change', 10) for _ in xrange(3)]
+        time.sleep(0.2)
+        for call in calls:
+            self.assertTrue(call.cancel())
+            with self.assertRaises(WorkerError):
+                call.result()
+        # The children were killed and the queued call dropped.
+        start = time.time()
+        self.assertEqual([0], self.pool.fork_call('so_digest', 'change')[1])
+        self.assertLess(time.time() - start, 5)
+
+    def testNestedForkCall(self):
+        # Like a GenSummary of depth 2 whose JNSaf summary request issues a GenSummary of depth 1 for the same binary,
+        # with a single fork slot per level.
+        pool = WorkerPool(lambda: _Target('worker'), 1, fork=True, max_children=1)
+        pool.start()
+        tmp_dir = tempfile.mkdtemp()
+        try:
+            path = os.path.join(tmp_dir, 'nested')
+            outer = pool.fork_submit('so_digest', 'wait_file', path, 10, level=2)
+            time.sleep(0.2)
+            start = time.time()
+            pool.fork_call('so_digest', 'touch', path, level=1)
+            self.assertTrue(outer.result())
+            self.assertLess(time.time() - start, 5)
+        finally:
+            shutil.rmtree(tmp_dir)
+            pool.shutdown()
+
+    def testChildDied(self):
+        worker_pid = self.pool.worker_for('so_digest').pid
+        with self.assertRaises(WorkerError):
+            self.pool.fork_call('so_digest', 'exit')
+        self.assertEqual(worker_pid, self.pool.worker_for('so_digest').pid)
+        self.assertEqual([0], self.pool.fork_call('so_digest', 'change')[1])
+
+
+if __name__ == '__main__':
+    unittest.main()
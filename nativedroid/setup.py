@@ -14,6 +14,7 @@ setup(
         'grpcio-tools==1.9.0',
         'claripy',
         'cle',
+        'pyelftools',
         'angr',
         'angr-utils'
     ]